@@ -3,7 +3,9 @@ import json
 from PySide6.QtCore import QTimer, Signal, QObject
 from PySide6.QtWidgets import QMessageBox
 
-from managers.editor_manager import EditorManager
+from managers.editor_pool_manager import EditorPoolManager
+from services.image_gc_service import ImageGCService
+from services.note_render_cache_service import NoteRenderCacheService
 from views.editor.editor_view import EditorPanel
 
 class NoteController(QObject):
@@ -37,6 +39,12 @@ class NoteController(QObject):
         self.search_term = ""
         self.order_by = "updated DESC"
 
+        # Background collection of images no note references anymore
+        self.image_gc = ImageGCService(self.model, parent=self)
+
+        # Recently closed editors, reopened without rebuilding them
+        self.editors = EditorPoolManager()
+
         # Connect add note button to new note action
         self.view.add_btn.clicked.connect(self.add_note)
 
@@ -66,24 +74,36 @@ class NoteController(QObject):
 
         :param note: A single note entry from database query
         """
-        # Convert JSON string to Python list for adding tags
-        tags = json.loads(note["tags"]) if note["tags"] else []
-
-        editor = EditorPanel(
-            parent=self.view,
-            note_id=note["id"],
-            title=note["title"],
-            content=note["content"],
-            save_callback=lambda t, c, new_tags=None: self.save_edit(note["id"], t, c, new_tags),
-            delete_callback=lambda nid=note["id"]: self.delete_note(nid),
-            tags=tags
-        )
+        note_id = note["id"]
+
+        # Reuse the editor from the last time the note was opened while the row is unchanged.
+        # The listing row can be stale (sticky notes save without refreshing the grid), so ask the database.
+        editor = self.editors.take(note_id, self.model.get_note_updated(note_id))
+        if editor is None:
+            # Listings carry only the preview; load the full note for editing
+            note = self.model.get_note_by_id(note_id) or note
+
+            # Convert JSON string to Python list for adding tags
+            tags = json.loads(note["tags"]) if note["tags"] else []
+
+            editor = EditorPanel(
+                parent=self.view,
+                note_id=note_id,
+                title=note["title"],
+                content=note["content"],
+                save_callback=lambda t, c, new_tags=None: self.save_edit(note_id, t, c, new_tags),
+                delete_callback=lambda nid=note_id: self.delete_note(nid),
+                tags=tags,
+                model=self.model,
+                updated=note["updated"]
+            )
 
         # Force preview mode
         editor.open_existing_in_preview()
 
         # Opens the editor
         editor.exec()
+        self.editors.release(note_id, editor)
 
     ### --- Helpers --- ###
     def on_search_changed(self, text):
@@ -110,24 +130,21 @@ class NoteController(QObject):
 
             # If no category selected, go to default view
             self.model.add_note(self.current_category or "Notes", title, content, tags=new_tags)
+            self.image_gc.schedule()  # images dropped from the draft become orphans
             self._notify_change()  # triggers refresh and dashboard update
 
-        EditorPanel(self.view, None, "New Note", "", save_cb).exec()
+        editor = EditorPanel(self.view, None, "New Note", "", save_cb, model=self.model)
+        editor.exec()
+        editor.deleteLater()
 
     def save_edit(self, note_id, title, content, tags=None):
         """Save modification to an existing note."""
         self.model.edit_note(note_id, title=title, content=content, tags=tags)
+        NoteRenderCacheService.instance().invalidate(note_id)
+        self.editors.discard(note_id)
 
-        # Clean up orphaned images
-        all_notes_html = [
-            note["content"]
-            for note in self.model.get_notes(
-                category_name=None,
-                search="",
-                order_by="updated DESC"
-            )
-        ]
-        EditorManager.cleanup_orphaned_images(all_notes_html)
+        # Image references were updated with the note; unused files are removed off the UI thread
+        self.image_gc.schedule()
 
         self._notify_change()
 
@@ -143,17 +160,11 @@ class NoteController(QObject):
             return # Ensures no operation if record is already gone
 
         self.model.delete_note(note_id)
+        NoteRenderCacheService.instance().invalidate(note_id)
+        self.editors.discard(note_id)
 
-        # Cleanup orphaned images
-        all_notes_html = [
-            note["content"]
-            for note in self.model.get_notes(
-                category_name=None,
-                search="",
-                order_by="updated DESC"
-            )
-        ]
-        EditorManager.cleanup_orphaned_images(all_notes_html)
+        # Cleanup orphaned images in the background
+        self.image_gc.schedule()
 
         self._notify_change()
 
@@ -162,6 +173,7 @@ class NoteController(QObject):
         notes = self.model.get_notes(
             category_name=self.current_category,
             search=self.search_term,
-            order_by=self.order_by
+            order_by=self.order_by,
+            with_content=False
         )
         self.view.populate_notes(notes, self.on_note_click)
\ No newline at end of file
@@ -1,16 +1,14 @@
 # helpers/md_to_html.py
+import hashlib
 import re
-import os
-from html import escape
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
-import markdown2
-from pygments import highlight
-from pygments.lexers import get_lexer_by_name, TextLexer
-from pygments.formatters import HtmlFormatter
+# markdown2 and Pygments are imported by the first MarkdownRenderer, not at
+# startup: nothing renders Markdown until a note is opened or listed
 
-
-# CSS used for code blocks (Pygments + small github-like tweaks)
-PYGMENTS_CSS = HtmlFormatter(nowrap=True).get_style_defs(".codehilite")
+# CSS used for code blocks (small github-like tweaks; the Pygments style defs are appended per renderer)
 EXTRA_CSS = """
 /* Overall body */
 body {
@@ -94,81 +92,133 @@ h1, h2, h3, h4, h5, h6 {
     margin: 8px 0;
     font-weight: bold;
 }
-""" + PYGMENTS_CSS
+"""
+
+
+# Full document wrapper around a rendered body (the head is built by MarkdownRenderer)
+DOCUMENT_TAIL = "</body></html>"
+
+# Code blocks markdown2 leaves unhighlighted (indented blocks, fences without a known language)
+CODE_BLOCK_RE = re.compile(
+    r'<pre><code(?: class="language-(?P<lang>[\w+-]+)")?>(?P<code>.*?)</code></pre>',
+    flags=re.DOTALL
+)
 
+# extras: fenced code blocks, tables, autolink, strike, task lists (checkboxes supported by markdown2 via 'extras' isn't native,
+# we'll keep checkboxes as "- [ ]" -> show as text; you can post-process if you want real checkboxes)
+MARKDOWN_EXTRAS = [
+    "fenced-code-blocks",
+    "tables",
+    "autolink",
+    "strike",
+    "cuddled-lists",
+]
 
-def _highlight_code_blocks(html: str) -> str:
+
+@lru_cache(maxsize=64)
+def _lexer_for(lang: str):
+    """Pygments lexer for a code block language, resolved once per language."""
+    from pygments.lexers import get_lexer_by_name, TextLexer
+    try:
+        return get_lexer_by_name(lang) if lang else TextLexer()
+    except Exception:
+        return TextLexer()
+
+
+class MarkdownRenderer:
     """
-    Find <pre><code class="language-...">...</code></pre> and replace with pygments-highlighted HTML.
-    Works with markdown2's fenced-code-blocks output.
+    Markdown -> HTML for the editor, EditorManager.load_initial_content and note cards.
+
+    Owns one configured markdown2 instance and a single Pygments formatter, and
+    keeps the most recently rendered bodies in an LRU keyed by a hash of the
+    source, so reopening a note or rebuilding its card doesn't convert it again.
+    markdown2 keeps per-conversion state, so conversions are serialized.
     """
-    def repl(m):
-        lang = m.group("lang") or ""
-        code = m.group("code") or ""
-        code = code.rstrip("\n")
-        try:
-            lexer = get_lexer_by_name(lang) if lang else TextLexer()
-        except Exception:
-            lexer = TextLexer()
-        formatter = HtmlFormatter(nowrap=True, noclasses=True)
-        highlighted = highlight(code, lexer, formatter)
-
-        return f'<pre><code class="codehilite">{highlighted}</code></pre>'
-
-    pattern = re.compile(
-        r'<pre><code(?: class="language-(?P<lang>[\w+-]+)")?>(?P<code>.*?)</code></pre>',
-        flags=re.DOTALL
-    )
-    return pattern.sub(repl, html)
+    _instance = None
+
+    def __init__(self, max_items=128):
+        import markdown2
+        from pygments.formatters import HtmlFormatter
+
+        self.max_items = max_items
+        self._markdown = markdown2.Markdown(extras=MARKDOWN_EXTRAS)
+        self._formatter = HtmlFormatter(nowrap=True, noclasses=True)
+        pygments_css = HtmlFormatter(nowrap=True).get_style_defs(".codehilite")
+        self.document_head = f"""<html><head><meta charset="utf-8"><style>{EXTRA_CSS}{pygments_css}</style></head>
+    <body>"""
+        self._bodies: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def instance(cls) -> "MarkdownRenderer":
+        """Shared, process-wide renderer."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def key_for(md_text: str) -> str:
+        return hashlib.sha256(md_text.encode("utf-8")).hexdigest()
+
+    def render_body(self, md_text: str) -> str:
+        """Rendered HTML fragment (no <html>/<style> wrapper), from the cache when possible."""
+        key = self.key_for(md_text)
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                self.hits += 1
+                return body
+
+            self.misses += 1
+            body = self._highlight_code_blocks(self._markdown.convert(md_text))
+            self._bodies[key] = body
+            while len(self._bodies) > self.max_items:
+                self._bodies.popitem(last=False)
+            return body
+
+    def render_document(self, md_text: str) -> str:
+        """Full HTML document styled for QTextBrowser (EXTRA_CSS + rendered body)."""
+        return self.document_head + self.render_body(md_text) + DOCUMENT_TAIL
+
+    def clear(self):
+        with self._lock:
+            self._bodies.clear()
+
+    def _highlight_code_blocks(self, html: str) -> str:
+        """
+        Find <pre><code class="language-...">...</code></pre> and replace with pygments-highlighted HTML.
+        Works with markdown2's fenced-code-blocks output.
+        """
+        from pygments import highlight
+
+        formatter = self._formatter
+
+        def repl(m):
+            code = (m.group("code") or "").rstrip("\n")
+            highlighted = highlight(code, _lexer_for(m.group("lang") or ""), formatter)
+            return f'<pre><code class="codehilite">{highlighted}</code></pre>'
+
+        return CODE_BLOCK_RE.sub(repl, html)
 
 
 def render_markdown_to_html(md_text: str) -> str:
     """
     Render markdown -> full HTML snippet styled for QTextBrowser.
-    Uses markdown2 extras and applies Pygments to code blocks.
+    Uses the shared MarkdownRenderer (markdown2 extras, Pygments for code blocks).
     """
-    # extras: fenced code blocks, tables, autolink, strike, task lists (checkboxes supported by markdown2 via 'extras' isn't native,
-    # we'll keep checkboxes as "- [ ]" -> show as text; you can post-process if you want real checkboxes)
-    html = markdown2.markdown(
-        md_text,
-        extras=[
-            "fenced-code-blocks",
-            "tables",
-            "autolink",
-            "strike",
-            "cuddled-lists",
-            "metadata",
-        ],
-    )
-
-    # Convert HTML entities inside code blocks from markdown2 (usually safe)
-    html = _highlight_code_blocks(html)
-
-    full = f"""<html><head><meta charset="utf-8"><style>{EXTRA_CSS}</style></head>
-    <body>{html}</body></html>"""
-    return full
+    return MarkdownRenderer.instance().render_document(md_text)
 
 
 # Optional utility for saving an image (used by EditorPanel)
-def save_dropped_image(bytes_data: bytes, filename_hint: str = "pasted") -> str:
+def save_dropped_image(bytes_data: bytes, store, filename_hint: str = "pasted") -> str:
     """
-    Save bytes_data to data/images under project root. Returns relative path (forward slashes).
+    Save bytes_data into the content-addressed image store. Returns the blob path (forward slashes).
     """
-    base = os.path.abspath(os.path.join(os.getcwd(), "data", "images"))
-    os.makedirs(base, exist_ok=True)
     # try to determine extension from hint, else default .png
-    name = f"{filename_hint}".replace(" ", "_")
     ext = ".png"
     if "." in filename_hint and len(filename_hint.split(".")[-1]) <= 4:
         ext = "." + filename_hint.split(".")[-1]
-    i = 0
-    while True:
-        candidate = os.path.join(base, f"{name}_{i}{ext}")
-        if not os.path.exists(candidate):
-            break
-        i += 1
-    with open(candidate, "wb") as f:
-        f.write(bytes_data)
-    # return relative path for markdown link
-    rel = os.path.relpath(candidate, os.getcwd()).replace("\\", "/")
-    return rel
+    return store.put_bytes(bytes_data, ext).as_posix()
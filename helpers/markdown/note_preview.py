@@ -0,0 +1,70 @@
+import re
+
+# Bounds of the snippet stored in notes.preview; cards never show more than this
+PREVIEW_CHARS = 1500       # visible characters (text outside tags)
+PREVIEW_LINES = 30
+PREVIEW_MARKUP_CHARS = 16 * PREVIEW_CHARS  # hard cap on the stored snippet, markup included
+
+# An HTML tag cut off at the end of the snippet
+_OPEN_TAG_RE = re.compile(r"<[^>]*$")
+_TAG_RE = re.compile(r"<[^>]*>")
+
+# The document wrapper of QTextDocument.toHtml() (what the editor saves): doctype, <head> and its
+# stylesheet, <body> and the closing tags. None of it shows on a card, but it would use up the budget.
+_QT_HEAD_RE = re.compile(r"\A\s*<!DOCTYPE[^>]*>\s*<html>\s*<head>.*?</head>\s*<body[^>]*>\s*", re.DOTALL | re.IGNORECASE)
+_QT_TAIL_RE = re.compile(r"\s*</body>\s*</html>\s*\Z", re.IGNORECASE)
+
+
+def _visible_limit(text, max_chars):
+    """Index in text where its visible characters (outside tags) pass max_chars, or len(text)."""
+    visible = 0
+    pos = 0
+    for tag in _TAG_RE.finditer(text):
+        gap = tag.start() - pos
+        if visible + gap > max_chars:
+            return pos + max_chars - visible
+        visible += gap
+        pos = tag.end()
+    if visible + len(text) - pos > max_chars:
+        return pos + max_chars - visible
+    return len(text)
+
+
+def make_preview(content, max_chars=PREVIEW_CHARS, max_lines=PREVIEW_LINES):
+    """
+    Leading snippet of a note (Markdown or HTML) for its card.
+
+    Keeps at most max_lines lines and about max_chars visible characters, so
+    markup (Qt's per-paragraph style attributes, tags) doesn't count against
+    the text shown. Qt's document head is dropped first. The snippet is cut at
+    a paragraph or line boundary where possible; a cut snippet never ends
+    inside an HTML tag or an open code fence and finishes with an ellipsis
+    paragraph.
+    """
+    text = content or ""
+    head = _QT_HEAD_RE.match(text)
+    if head:
+        text = _QT_TAIL_RE.sub("", text[head.end():])
+
+    lines = text.split("\n", max_lines)
+    truncated = len(lines) > max_lines
+    if truncated:
+        text = "\n".join(lines[:max_lines])
+
+    limit = min(_visible_limit(text, max_chars), PREVIEW_MARKUP_CHARS)
+    if limit < len(text):
+        truncated = True
+        cut = text.rfind("\n\n", 0, limit)
+        if cut < limit // 2:
+            cut = text.rfind("\n", 0, limit)
+        if cut < limit // 2:
+            cut = limit
+        text = text[:cut]
+
+    if not truncated:
+        return text
+
+    text = _OPEN_TAG_RE.sub("", text).rstrip()
+    if text.count("```") % 2:
+        text += "\n```"
+    return text + "\n\n…"
@@ -0,0 +1,90 @@
+from collections import deque
+
+# Below this many keywords, one C-level `in` check per keyword beats a per-character Python automaton
+AUTOMATON_MIN_KEYWORDS = 64
+
+
+class AhoCorasick:
+    """
+    Aho–Corasick automaton over a list of keywords.
+
+    Built once into a deterministic transition table, so a search walks the
+    text exactly once no matter how many keywords there are. Keyword order is
+    priority: first() returns the lowest index among all keywords found.
+    """
+    def __init__(self, keywords):
+        goto = [{}]
+        fail = [0]
+        self.out = [-1]  # state -> best (lowest) keyword index ending here, -1 if none
+
+        # Trie
+        for index, keyword in enumerate(keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    self.out.append(-1)
+                    goto[state][ch] = nxt
+                state = nxt
+            if self.out[state] == -1 or index < self.out[state]:
+                self.out[state] = index
+
+        # Failure links (breadth first), folding each fallback state's output into its own
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                inherited = self.out[fail[nxt]]
+                if inherited != -1 and (self.out[nxt] == -1 or inherited < self.out[nxt]):
+                    self.out[nxt] = inherited
+
+        # Resolve failure links into direct transitions; missing entries mean "back to root"
+        self.delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        for state in order:
+            row = dict(self.delta[fail[state]])
+            row.update(goto[state])
+            self.delta[state] = {ch: nxt for ch, nxt in row.items() if nxt}
+
+    def first(self, text):
+        """Return the highest-priority keyword index found in text, or -1."""
+        delta, out = self.delta, self.out
+        best = -1
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            found = out[state]
+            if found != -1 and (best == -1 or found < best):
+                best = found
+                if best == 0:
+                    break
+        return best
+
+
+class KeywordMatcher:
+    """
+    Finds the first keyword (in priority order) contained in a lowercased line.
+    Small sets use plain substring checks; large sets use an AhoCorasick automaton.
+    """
+    def __init__(self, keywords):
+        self.keywords = [kw.lower() for kw in keywords]
+        self._automaton = AhoCorasick(self.keywords) if len(self.keywords) >= AUTOMATON_MIN_KEYWORDS else None
+
+    def first(self, text):
+        """Return the index of the highest-priority keyword in text, or -1."""
+        if self._automaton is not None:
+            return self._automaton.first(text)
+        for index, keyword in enumerate(self.keywords):
+            if keyword in text:
+                return index
+        return -1
@@ -0,0 +1,185 @@
+import io
+import multiprocessing
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from helpers.parsers.log_parser_helper import ModemLogParser
+
+LOG_EXTS = {".log", ".txt"}
+
+# Files larger than this are split into line-aligned byte ranges
+CHUNK_BYTES = 32 * 1024 * 1024
+
+# Built once per worker process by _init_worker, so the merged rules compile once, not per unit
+_worker_parser = None
+
+
+class BatchReport:
+    """Merged results of a batch analysis."""
+    def __init__(self):
+        self.files = {}    # source name -> summary dict (same shape as ModemLogParser.summarize)
+        self.summary = {}  # all files combined
+        self.total_events = 0
+        self.errors = []   # (source name, message)
+
+    def add(self, source, summary):
+        merge_summaries(self.files.setdefault(source, {}), summary)
+        merge_summaries(self.summary, summary)
+        self.total_events += sum(data["count"] for data in summary.values())
+
+    def format(self):
+        """Readable combined report: overall counts followed by a per-file breakdown."""
+        lines = [f"Analyzed {len(self.files)} log file(s), {self.total_events:,} events", ""]
+
+        lines.append("All files:")
+        for cat, data in sorted(self.summary.items(), key=lambda kv: -kv[1]["count"]):
+            lines.append(f"  • {cat}: {data['count']:,} events (Severity: {data['severity']})")
+
+        for source in sorted(self.files):
+            summary = self.files[source]
+            count = sum(data["count"] for data in summary.values())
+            lines.append("")
+            lines.append(f"{source} ({count:,} events)")
+            for cat, data in sorted(summary.items(), key=lambda kv: -kv[1]["count"]):
+                lines.append(f"  • {cat}: {data['count']:,}")
+
+        if self.errors:
+            lines.append("")
+            lines.append("Skipped:")
+            for source, message in self.errors:
+                lines.append(f"  • {source}: {message}")
+
+        return "\n".join(lines)
+
+
+def merge_summaries(into, summary):
+    """
+    Add the counts of one summarize() result into another.
+    A category keeps the severity it had in `into`, so merge in input order.
+    """
+    for cat, data in summary.items():
+        entry = into.setdefault(cat, {"count": 0, "severity": data["severity"]})
+        entry["count"] += data["count"]
+    return into
+
+
+def split_file(path, chunk_bytes=CHUNK_BYTES):
+    """Return (start, end) byte ranges covering the file, each ending on a line boundary."""
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + chunk_bytes
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()  # run to the end of the line the cut landed in
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def collect_units(paths, chunk_bytes=CHUNK_BYTES):
+    """
+    Expand files, folders and ZIP archives into work units for the pool.
+
+    A unit is ("file", path, start, end, name) or ("zip", archive, member, name).
+    ZIP members are compressed streams, so each is one unit.
+    """
+    units = []
+    for path in paths:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in sorted(names):
+                    full = os.path.join(root, name)
+                    units += collect_units([full], chunk_bytes)
+        elif path.lower().endswith(".zip"):
+            with zipfile.ZipFile(path) as zf:
+                for info in zf.infolist():
+                    if not info.is_dir() and os.path.splitext(info.filename)[1].lower() in LOG_EXTS:
+                        units.append(("zip", path, info.filename, f"{os.path.basename(path)}/{info.filename}"))
+        elif os.path.splitext(path)[1].lower() in LOG_EXTS:
+            for start, end in split_file(path, chunk_bytes):
+                units.append(("file", path, start, end, path))
+    return units
+
+
+def _init_worker(rules):
+    global _worker_parser
+    _worker_parser = ModemLogParser(rules=rules)
+
+
+def analyze_unit(unit, parser=None):
+    """
+    Parse one work unit and return (source name, summary).
+    Runs in a worker process, so only the summary travels back, never the events.
+    """
+    parser = parser or _worker_parser or ModemLogParser()
+
+    if unit[0] == "zip":
+        _, archive, member, name = unit
+        with zipfile.ZipFile(archive) as zf, zf.open(member) as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+            return name, parser.parse_batch(text).summarize()
+
+    _, path, start, end, name = unit
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    text = io.StringIO(data.decode("utf-8", errors="replace"))
+    return name, parser.parse_batch(text).summarize()
+
+
+def analyze_batch(paths, max_workers=None, chunk_bytes=CHUNK_BYTES, progress=None, rules=None):
+    """
+    Analyze many modem logs in parallel and merge the results.
+
+    :param paths: Files, folders and/or ZIP archives
+    :param max_workers: Process count, defaults to the number of CPUs
+    :param chunk_bytes: Split size for large files
+    :param progress: Optional callback(done, total) after each unit
+    :param rules: Rule list (e.g. from RulePackLoader.load()), defaults to ModemLogParser.RULES
+    :return: BatchReport
+    """
+    report = BatchReport()
+    units = collect_units(paths, chunk_bytes)
+    if not units:
+        return report
+
+    # A single unit isn't worth starting processes for
+    if len(units) == 1:
+        report.add(*analyze_unit(units[0], ModemLogParser(rules=rules)))
+        if progress:
+            progress(1, 1)
+        return report
+
+    workers = min(max_workers or os.cpu_count() or 1, len(units))
+    results = [None] * len(units)  # (source, summary) or an exception, per unit
+    # spawn: forking a process that is running Qt threads is not safe
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker, initargs=(rules,)
+    ) as pool:
+        futures = {pool.submit(analyze_unit, unit): index for index, unit in enumerate(units)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+            if progress:
+                progress(done, len(units))
+
+    # Merge in unit order, not completion order, so the first severity seen for a category
+    # (and every ordering in the report) matches a single-process parse of the same input
+    for unit, result in zip(units, results):
+        if isinstance(result, Exception):
+            report.errors.append((unit[-1], str(result)))
+        else:
+            report.add(*result)
+
+    return report
@@ -1,18 +1,171 @@
+import io
+import os
 import re
+import sys
+import time
+import unicodedata
+from array import array
+from collections import Counter
 from datetime import datetime
 
+from helpers.parsers.keyword_matcher import KeywordMatcher
+from helpers.parsers.timestamp_helper import NO_TIMESTAMP, extract_epoch, format_epoch, bucket_size
+
+
+# Escapes that spell out one character: \x41, \u0041, \U00000041, octal, \N{...}
+_CHAR_ESCAPE_RE = re.compile(
+    r"\\(?:x([0-9a-fA-F]{2})|u([0-9a-fA-F]{4})|U([0-9a-fA-F]{8})|(0[0-7]{0,2}|[1-3][0-7]{2})|N\{([^}]*)\})"
+)
+# A numbered backreference like \1 (outside character classes)
+_BACKREF_RE = re.compile(r"\\([1-9][0-9]?)")
+# Group openings that need rewriting: named group, named backreference, conditional, inline flags
+_GROUP_RE = re.compile(r"\(\?(?:P<(\w+)>|P=(\w+)\)|\((\w+)\)|([aiLmsux]+)\))")
+# Other "(?" openings (non-capturing, lookaround, scoped flags, comments) are copied as they are
+_OTHER_GROUP_RE = re.compile(r"\(\?(?:#[^)]*\)|[aiLmsux-]*:|[=!>]|<[=!])")
+_OTHER_ESCAPE_RE = re.compile(r"\\.?", re.DOTALL)
+_CLASS_OPEN_RE = re.compile(r"\[\^?\]?")  # "]" right after "[" or "[^" is a literal
+_TEXT_RE = re.compile(r"[^\\(\[]+")
+_CLASS_TEXT_RE = re.compile(r"[^\\\]]+")
+
+
+def _decode_escape(match):
+    """Lowercased, re-escaped character of a _CHAR_ESCAPE_RE match, or the escape itself if invalid."""
+    hex2, hex4, hex8, octal, name = match.groups()
+    try:
+        if name is not None:
+            char = unicodedata.lookup(name)
+        elif octal is not None:
+            char = chr(int(octal, 8))
+        else:
+            char = chr(int(hex2 or hex4 or hex8, 16))
+    except (KeyError, ValueError):
+        return match.group()  # let re.compile report it
+    return re.escape(char.lower())
+
+
+def _lower_pattern(pattern, prefix="g"):
+    """
+    Rewrite a rule's regex so it can be matched, merged with other rules, against a lowercased line.
+
+    - Literal text is lowercased. Escapes that stand for a single character (\\x41, \\u0041,
+      \\N{LATIN CAPITAL LETTER A}, octal) are decoded and lowercased too; other escapes like
+      \\D or \\S are left intact.
+    - Capturing groups are renamed <prefix>_<number>, and named or numbered backreferences and
+      conditionals follow them, so two rules can use the same group name and the merged
+      pattern's own r0, r1, ... groups can't clash with a rule's.
+    - Inline flags like (?i) or (?x) become a scoped (?i:...) group around the whole pattern,
+      since global flags are only allowed at the start of the merged expression.
+    """
+    out, flags, names = [], "", {}
+    groups = 0
+    pos, end = 0, len(pattern)
+    in_class = False
+    while pos < end:
+        if in_class:
+            if pattern[pos] == "]":
+                out.append("]")
+                in_class = False
+                pos += 1
+                continue
+            match = _CHAR_ESCAPE_RE.match(pattern, pos)
+            if match:
+                out.append(_decode_escape(match))
+            elif pattern[pos] == "\\":
+                match = _OTHER_ESCAPE_RE.match(pattern, pos)
+                out.append(match.group())
+            else:
+                match = _CLASS_TEXT_RE.match(pattern, pos)
+                out.append(match.group().lower())
+            pos = match.end()
+            continue
+
+        char = pattern[pos]
+        if char == "[":
+            match = _CLASS_OPEN_RE.match(pattern, pos)
+            out.append(match.group())
+            in_class = True
+        elif char == "\\":
+            match = _CHAR_ESCAPE_RE.match(pattern, pos) or _BACKREF_RE.match(pattern, pos)
+            if match and match.re is _BACKREF_RE:
+                out.append(f"(?P={prefix}_{match.group(1)})")
+            elif match:
+                out.append(_decode_escape(match))
+            else:
+                match = _OTHER_ESCAPE_RE.match(pattern, pos)
+                out.append(match.group())
+        elif char == "(":
+            match = _GROUP_RE.match(pattern, pos) or _OTHER_GROUP_RE.match(pattern, pos)
+            if match is None:
+                if pattern.startswith("(?", pos):
+                    out.append("(")  # unknown extension: left for re.compile to report
+                else:
+                    groups += 1
+                    out.append(f"(?P<{prefix}_{groups}>")
+                pos += 1
+                continue
+            if match.re is _OTHER_GROUP_RE:
+                out.append(match.group())
+            else:
+                name, ref, cond, inline = match.groups()
+                if name is not None:
+                    groups += 1
+                    names[name] = groups
+                    out.append(f"(?P<{prefix}_{groups}>")
+                elif ref is not None:
+                    out.append(f"(?P={prefix}_{names.get(ref, ref)})")
+                elif cond is not None:
+                    out.append(f"(?({prefix}_{names.get(cond, cond)})")
+                else:
+                    flags += "".join(flag for flag in inline if flag not in flags)
+        else:
+            match = _TEXT_RE.match(pattern, pos)
+            out.append(match.group().lower())
+        pos = match.end()
+
+    lowered = "".join(out)
+    if flags:
+        # A verbose-mode comment would swallow the closing parenthesis without the newline
+        tail = "\n" if "x" in flags else ""
+        lowered = f"(?{flags}:{lowered}{tail})"
+    return lowered
+
+def compile_rules(rules):
+    """
+    Merge every rule pattern into one alternation.
+
+    Each rule becomes a named group (r0, r1, ...) so a single scan of a line
+    reports which rules matched. Patterns are lowercased and matched against the
+    lowercased line: sre skips ahead on the alternation's first characters that
+    way, which it can't do with re.IGNORECASE.
+
+    Returns (regex, {group name: rule index}).
+    """
+    parts, groups = [], {}
+    for i, rule in enumerate(rules):
+        name = f"r{i}"
+        # The outer group closes last, so match.lastgroup names the rule even if the pattern has groups
+        parts.append(f"(?P<{name}>{_lower_pattern(rule[0], name)})")
+        groups[name] = i
+    return re.compile("|".join(parts)), groups
+
+
 class ModemEvent:
-    def __init__(self, timestamp, message, category, severity, explanation, steps=None):
-        self.timestamp = timestamp
+    # No per-instance __dict__; explanation and steps are shared with the rule, never copied
+    __slots__ = ("timestamp", "message", "category", "severity", "explanation", "steps", "epoch")
+
+    def __init__(self, timestamp, message, category, severity, explanation, steps=None, epoch=None):
+        self.timestamp = timestamp  # display string, "Unknown" when the line has none
         self.message = message
         self.category = category
         self.severity = severity
         self.explanation = explanation
         self.steps = steps or []
+        self.epoch = epoch  # seconds since 1970 (log wall-clock treated as UTC) or None
 
     def to_dict(self):
         return {
             "timestamp": self.timestamp,
+            "epoch": self.epoch,
             "message": self.message,
             "category": self.category,
             "severity": self.severity,
@@ -21,6 +174,166 @@ class ModemEvent:
         }
 
 
+class RuleTable:
+    """
+    Interned classification outcomes addressed by small integer ids.
+
+    Each entry is (category, severity, explanation, steps). Categories and
+    severities also get their own codes so batches can be counted and filtered
+    on integers instead of strings.
+
+    Not thread-safe: parsing can add entries (embedded tags), so a table being
+    filled on a worker thread is mirrored on the GUI thread with copy() and
+    extend() instead of being read there.
+    """
+    def __init__(self):
+        self.entries = []        # rule id -> (category, severity, explanation, steps)
+        self.categories = []     # category code -> name
+        self.severities = []     # severity code -> name
+        self.category_of = array("H")  # rule id -> category code
+        self.severity_of = array("H")  # rule id -> severity code
+        self._ids = {}
+        self._category_codes = {}
+        self._severity_codes = {}
+
+    def intern(self, category, severity, explanation, steps=(), unique=False):
+        """
+        Return the id for an outcome, adding it on first sight.
+        With unique=True a new entry is always added, so rules that share an
+        outcome still get ids of their own (and the id can equal the rule index).
+        """
+        key = (category, severity, explanation)
+        rule_id = None if unique else self._ids.get(key)
+        if rule_id is None:
+            rule_id = len(self.entries)
+            category, severity = sys.intern(category), sys.intern(severity)
+            self.entries.append((category, severity, explanation, steps))
+            self.category_of.append(self._code(self._category_codes, self.categories, category))
+            self.severity_of.append(self._code(self._severity_codes, self.severities, severity))
+            self._ids.setdefault(key, rule_id)
+        return rule_id
+
+    def copy(self):
+        """A new table with the same entries and ids."""
+        table = RuleTable()
+        table.extend(self.entries)
+        return table
+
+    def extend(self, entries):
+        """Append entries added to another table after this one was copied from it, keeping their ids."""
+        for category, severity, explanation, steps in entries:
+            self.intern(category, severity, explanation, steps, unique=True)
+
+    @staticmethod
+    def _code(codes, names, name):
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
+
+
+class EventBatch:
+    """
+    Column-oriented store of parsed events.
+
+    One entry per event in three parallel columns (epoch, message, rule id);
+    category, severity, explanation and steps live once in the RuleTable.
+    Iterating or indexing builds ModemEvent views on demand.
+    """
+    __slots__ = ("table", "epochs", "messages", "rule_ids")
+
+    def __init__(self, table):
+        self.table = table
+        self.epochs = array("q")  # NO_TIMESTAMP where the line had none
+        self.messages = []
+        self.rule_ids = array("H")
+
+    def append(self, epoch, message, rule_id):
+        self.epochs.append(epoch)
+        self.messages.append(message)
+        self.rule_ids.append(rule_id)
+
+    def extend(self, other):
+        """Append all events of another batch built on the same RuleTable."""
+        self.epochs.extend(other.epochs)
+        self.messages.extend(other.messages)
+        self.rule_ids.extend(other.rule_ids)
+
+    def __len__(self):
+        return len(self.rule_ids)
+
+    def __getitem__(self, i):
+        category, severity, explanation, steps = self.table.entries[self.rule_ids[i]]
+        epoch = self.epochs[i]
+        return ModemEvent(
+            format_epoch(epoch), self.messages[i], category, severity, explanation, steps,
+            None if epoch == NO_TIMESTAMP else epoch
+        )
+
+    def __iter__(self):
+        for i in range(len(self.rule_ids)):
+            yield self[i]
+
+    def category_counts(self):
+        """Return {category: count} without building any events."""
+        counts = Counter()
+        category_of = self.table.category_of
+        for rule_id, n in Counter(self.rule_ids).items():
+            counts[self.table.categories[category_of[rule_id]]] += n
+        return dict(counts)
+
+    def summarize(self, summary=None):
+        """Same result as ModemLogParser.summarize(), computed from rule id counts."""
+        if summary is None:
+            summary = {}
+        # Counter keeps first-occurrence order, so categories come out in the same order as per event
+        for rule_id, n in Counter(self.rule_ids).items():
+            category, severity, _, _ = self.table.entries[rule_id]
+            summary.setdefault(category, {"count": 0, "severity": severity})
+            summary[category]["count"] += n
+        return summary
+
+    def select(self, categories=None, severities=None):
+        """Return the indices of events in the given categories and/or severities."""
+        wanted = self._rule_ids_for(categories, severities)
+        return [i for i, rule_id in enumerate(self.rule_ids) if rule_id in wanted]
+
+    def histogram(self, bucket="minute", by="category", categories=None, severities=None):
+        """
+        Count events per time bucket.
+
+        :param bucket: "minute", "hour", "day" or a bucket width in seconds
+        :param by: "category" or "severity"
+        :param categories: Optional set of categories to count (e.g. the T3/T4 ones)
+        :param severities: Optional set of severities to count
+        :return: {bucket start epoch: {category or severity: count}}, oldest first.
+                 Events without a timestamp are left out.
+        """
+        size = bucket_size(bucket)
+        if by == "category":
+            codes, names = self.table.category_of, self.table.categories
+        else:
+            codes, names = self.table.severity_of, self.table.severities
+        wanted = self._rule_ids_for(categories, severities)
+
+        counts = Counter()
+        for epoch, rule_id in zip(self.epochs, self.rule_ids):
+            if epoch != NO_TIMESTAMP and rule_id in wanted:
+                counts[(epoch - epoch % size, codes[rule_id])] += 1
+
+        result = {}
+        for (start, code), n in sorted(counts.items()):
+            result.setdefault(start, {})[names[code]] = n
+        return result
+
+    def _rule_ids_for(self, categories, severities):
+        return {
+            rule_id for rule_id, (category, severity, _, _) in enumerate(self.table.entries)
+            if (categories is None or category in categories) and (severities is None or severity in severities)
+        }
+
+
 class ModemLogParser:
 
     # Patterns grouped by DOCSIS issue type
@@ -131,14 +444,11 @@ class ModemLogParser:
         ),
     ]
 
-    # Timestamp patterns
-    TIMESTAMP_PATTERNS = [
-        r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]",  # [2025-11-20 08:15:23]
-        r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})",      # 2025-11-20 08:15:23
-        r"(\d+/\d+/\d+ \d+:\d+:\d+)",                  # 11/20/2025 08:15:23
-    ]
+    # Logs that already carry "(CATEGORY/SEVERITY)" tags
+    CATEGORY_SEVERITY_PATTERN = re.compile(r"\((?P<category>[^/()]{1,40})/(?P<severity>[^/()]{1,20})\)")
 
-    CATEGORY_SEVERITY_PATTERN = re.compile(r"\((?P<category>[^/]+)/(?P<severity>[^)]+)\)")
+    # RuleTable ids are stored in array("H"); embedded tags stop adding outcomes past this
+    MAX_OUTCOMES = 65535
 
     GENERIC_KEYWORDS = {
         "upstream": ("Upstream / Noise", "High"),
@@ -149,65 +459,179 @@ class ModemLogParser:
         "wifi": ("LAN/WiFi", "Low"),
     }
 
+    def __init__(self, rules=None, keywords=None):
+        """
+        :param rules: Rule tuples (pattern, category, severity, explanation, steps), defaults to RULES
+        :param keywords: Fallback {keyword: (category, severity)} in priority order, defaults to GENERIC_KEYWORDS
+        """
+        self.rules = list(rules if rules is not None else self.RULES)
+        self._rule_re, self._rule_groups = compile_rules(self.rules)
+        self._higher_re = {}  # rule index -> merged pattern of the rules before it
+
+        # Rule ids equal rule indexes; the unmatched outcome comes right after them
+        self.table = RuleTable()
+        for _, category, severity, explanation, steps in self.rules:
+            self.table.intern(category, severity, explanation, steps, unique=True)
+        self.general_id = self.table.intern("General", "Info", "No detailed rule matched.")
+        self.hits = Counter()  # rule id -> lines classified with it, across every parse
+
+        # Keyword fallback, reusing the steps of a rule with the same category
+        keywords = keywords if keywords is not None else self.GENERIC_KEYWORDS
+        steps_for = {}
+        for _, category, _, _, steps in self.rules:
+            steps_for.setdefault(category, steps)
+        self._keywords = KeywordMatcher(keywords)
+        self._keyword_ids = [
+            self.table.intern(cat, sev, f"Matched keyword '{kw}' for fallback categorization.", steps_for.get(cat, ()))
+            for kw, (cat, sev) in keywords.items()
+        ]
+
     def parse(self, raw_text):
-        events = []
+        return list(self.parse_stream(io.StringIO(raw_text)))
 
-        lines = raw_text.splitlines()
-        for line in lines:
+    def parse_stream(self, source):
+        """
+        Yield one ModemEvent per non-empty line, reading lazily.
+
+        :param source: Open text file, any iterable of lines, or a path to a log file
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "r", encoding="utf-8", errors="replace") as f:
+                yield from self.parse_stream(f)
+            return
+
+        for line in source:
             clean = line.strip()
-            if not clean:
-                continue
+            if clean:
+                yield self.parse_line(clean)
 
-            timestamp = self._extract_timestamp(clean)
+    def parse_batch(self, source, batch=None):
+        """
+        Parse into a column-oriented EventBatch instead of one object per line.
+        Takes the same sources as parse_stream(); pass `batch` to append to an existing one.
+        """
+        if batch is None:
+            batch = EventBatch(self.table)
 
-            category = "General"
-            severity = "Info"
-            explanation = "No detailed rule matched."
-            steps = []  # default empty list
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "r", encoding="utf-8", errors="replace") as f:
+                return self.parse_batch(f, batch)
 
-            for pattern, cat, sev, expl, rule_steps in self.RULES:
-                if re.search(pattern, clean, re.IGNORECASE):
-                    category, severity, explanation, steps = cat, sev, expl, rule_steps
-                    break
+        start = len(batch)
+        append = batch.append
+        for line in source:
+            clean = line.strip()
+            if clean:
+                append(extract_epoch(clean), clean, self._classify(clean))
+        self.hits.update(batch.rule_ids[start:])
+        return batch
 
-            events.append(
-                ModemEvent(timestamp, clean, category, severity, explanation, steps)
+    def parse_line(self, clean):
+        """Build the event for one stripped, non-empty line."""
+        rule_id = self._classify(clean)
+        self.hits[rule_id] += 1
+        category, severity, explanation, steps = self.table.entries[rule_id]
+        epoch = extract_epoch(clean)
+        return ModemEvent(
+            format_epoch(epoch), clean, category, severity, explanation, steps,
+            None if epoch == NO_TIMESTAMP else epoch
+        )
+
+    def _classify(self, line):
+        """
+        Return the RuleTable id for a line. Classification runs in three stages:
+
+        1. Explicit RULES. The merged pattern finds the leftmost match in one
+           scan. Only when that match belongs to a later rule is the rest of the
+           line checked, and then only against the rules that outrank it, so
+           RULES order still decides.
+        2. An embedded "(CATEGORY/SEVERITY)" tag.
+        3. Fallback keywords, found in a single pass however many there are.
+
+        Lines matching none of them get general_id.
+        """
+        low = line.lower()
+        match = self._rule_re.search(low)
+        best = None
+        while match:
+            best = self._rule_groups[match.lastgroup]
+            if best == 0:
+                break
+            match = self._higher_priority(best).search(low, match.start() + 1)
+        if best is not None:
+            return best
+
+        tag = self.CATEGORY_SEVERITY_PATTERN.search(line)
+        if tag and len(self.table.entries) < self.MAX_OUTCOMES:
+            return self.table.intern(
+                tag.group("category").strip(), tag.group("severity").strip(),
+                "Matched via explicit category/severity in log."
             )
 
-        return events
+        keyword = self._keywords.first(low)
+        if keyword != -1:
+            return self._keyword_ids[keyword]
 
-    def _match_rules(self, line):
-        # Check explicit RULES
-        for pattern, cat, sev, expl in self.RULES:
-            if re.search(pattern, line, re.IGNORECASE):
-                return cat, sev, expl
+        return self.general_id
 
-        # Check if line has (CATEGORY/SEVERITY)
-        cs_match = self.CATEGORY_SEVERITY_PATTERN.search(line)
-        if cs_match:
-            cat = cs_match.group("category")
-            sev = cs_match.group("severity")
-            return cat, sev, "Matched via explicit category/severity in log."
+    def _higher_priority(self, index):
+        """Merged pattern of the rules that outrank rule `index`, compiled on first use."""
+        regex = self._higher_re.get(index)
+        if regex is None:
+            regex, _ = compile_rules(self.rules[:index])
+            self._higher_re[index] = regex
+        return regex
 
-        # Fallback
-        for kw, (cat, sev) in self.GENERIC_KEYWORDS.items():
-            if kw.lower() in line.lower():
-                return cat, sev, f"Matched keyword '{kw}' for fallback categorization."
+    def profile_rules(self, lines):
+        """
+        Time every rule pattern on its own against sample lines.
 
-        # No rule matched
-        return "General", "Info", "No detailed rule matched."
+        The merged pattern can't say which alternative costs the most, so each
+        rule is compiled separately and searched over every line. Returns one
+        dict per rule (index, pattern, category, hits, seconds), slowest first.
+        """
+        lowered = [line.strip().lower() for line in lines if line.strip()]
+        stats = []
+        for index, (pattern, category, _, _, _) in enumerate(self.rules):
+            search = re.compile(_lower_pattern(pattern)).search
+            start = time.perf_counter()
+            for line in lowered:
+                search(line)
+            stats.append({
+                "index": index,
+                "pattern": pattern,
+                "category": category,
+                "hits": self.hits[index],
+                "seconds": time.perf_counter() - start,
+            })
+        stats.sort(key=lambda s: -s["seconds"])
+        return stats
 
-    def summarize(self, events):
-        summary = {}
+    def summarize(self, events, summary=None):
+        """
+        Count events per category.
+        Pass a previous result as `summary` to keep counting across batches.
+        """
+        if summary is None:
+            summary = {}
         for ev in events:
             key = ev.category
             summary.setdefault(key, {"count": 0, "severity": ev.severity})
             summary[key]["count"] += 1
         return summary
 
-    def _extract_timestamp(self, line):
-        for pattern in self.TIMESTAMP_PATTERNS:
-            match = re.search(pattern, line)
-            if match:
-                return match.group(1)
-        return "Unknown"
+    def histogram(self, events, bucket="minute", by="category"):
+        """
+        Count ModemEvents per time bucket, like EventBatch.histogram().
+        Returns {bucket start epoch: {category or severity: count}}, oldest first.
+        """
+        size = bucket_size(bucket)
+        counts = Counter()
+        for ev in events:
+            if ev.epoch is not None:
+                counts[(ev.epoch - ev.epoch % size, getattr(ev, by))] += 1
+
+        result = {}
+        for (start, name), n in sorted(counts.items()):
+            result.setdefault(start, {})[name] = n
+        return result
@@ -0,0 +1,222 @@
+import hashlib
+import json
+import os
+import re
+
+from helpers.parsers.log_parser_helper import ModemLogParser, compile_rules
+
+PACK_EXTS = {".yaml", ".yml", ".json"}
+
+# Bump when the cached rule format or its validation changes so stale cache files are ignored
+CACHE_VERSION = 2
+
+SEVERITIES = {"Critical", "High", "Medium", "Low", "Info"}
+
+
+class RulePackError(Exception):
+    """A rule pack file that can't be read or has no valid rules."""
+
+
+def file_hash(path):
+    """SHA-256 of a file's bytes."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def read_pack(path):
+    """
+    Read a rule pack into rule tuples (pattern, category, severity, explanation, steps).
+
+    A pack is a YAML or JSON mapping:
+
+        name: Arris
+        override: false   # true puts these rules ahead of the built-in RULES
+        rules:
+          - pattern: "Lost MDD Timeout"
+            category: "Downstream / SNR"
+            severity: High
+            explanation: "..."
+            steps: ["...", "..."]
+
+    Invalid rules are skipped and reported through the returned warnings list.
+    :return: (pack name, override, rules, warnings)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            data = json.load(f)
+        else:
+            import yaml  # only needed when a YAML pack is present
+            data = yaml.safe_load(f)
+
+    if isinstance(data, list):
+        data = {"rules": data}
+    if not isinstance(data, dict) or not isinstance(data.get("rules"), list):
+        raise RulePackError("expected a mapping with a 'rules' list")
+
+    name = str(data.get("name") or os.path.splitext(os.path.basename(path))[0])
+    rules, warnings = [], []
+    for number, rule in enumerate(data["rules"], start=1):
+        try:
+            rules.append(_validate_rule(rule))
+        except (RulePackError, re.error) as e:
+            warnings.append(f"rule {number}: {e}")
+
+    return name, bool(data.get("override")), rules, warnings
+
+
+def _validate_rule(rule):
+    if not isinstance(rule, dict):
+        raise RulePackError("not a mapping")
+
+    pattern = rule.get("pattern")
+    category = rule.get("category")
+    if not pattern or not category:
+        raise RulePackError("'pattern' and 'category' are required")
+    # Check the lowered, wrapped form the parser compiles, not just the pattern as written
+    compile_rules([(str(pattern),)])
+
+    severity = str(rule.get("severity") or "Info").capitalize()
+    if severity not in SEVERITIES:
+        raise RulePackError(f"unknown severity '{severity}'")
+
+    steps = rule.get("steps") or []
+    if isinstance(steps, str):
+        steps = [steps]
+
+    return (
+        str(pattern), str(category), severity,
+        str(rule.get("explanation") or f"Matched {category} rule pack pattern."),
+        [str(step) for step in steps],
+    )
+
+
+class RulePackLoader:
+    """
+    Loads every rule pack in a folder and combines it with the built-in RULES.
+
+    Validated packs are cached as JSON named after the pack's SHA-256, so
+    unchanged files skip YAML parsing and pattern checks on the next load (and
+    in every batch worker process). changed() compares file sizes and
+    modification times, which is cheap enough to call before every parse.
+    """
+    def __init__(self, folder, cache_dir=None):
+        """
+        :param folder: Folder holding *.yaml, *.yml and *.json rule packs
+        :param cache_dir: Where validated packs are cached, defaults to <folder>/.cache
+        """
+        self.folder = os.fspath(folder)
+        self.cache_dir = os.fspath(cache_dir) if cache_dir else os.path.join(self.folder, ".cache")
+        self.packs = []    # (pack name, path, rule count), in load order
+        self.origins = []  # pack name of each rule returned by load(), "Built-in" for RULES
+        self.errors = []   # (file name, message)
+        self._snapshot = None
+
+    def pack_files(self):
+        """Rule pack paths, sorted by file name so load order is predictable."""
+        if not os.path.isdir(self.folder):
+            return []
+        return [
+            os.path.join(self.folder, name) for name in sorted(os.listdir(self.folder))
+            if os.path.splitext(name)[1].lower() in PACK_EXTS
+        ]
+
+    def changed(self):
+        """True if a pack was added, removed or modified since the last load()."""
+        return self._snapshot != self._stat_files()
+
+    def load(self):
+        """
+        Read all packs and return the combined rule list.
+        Built-in RULES come first so they keep their priority, and packs follow in
+        file name order; packs with `override: true` go ahead of the built-in RULES.
+        """
+        self._snapshot = self._stat_files()
+        self.packs, self.errors = [], []
+
+        front, front_origins = [], []
+        rules = list(ModemLogParser.RULES)
+        origins = ["Built-in"] * len(rules)
+
+        digests = set()
+        for path in self.pack_files():
+            try:
+                digest = file_hash(path)
+                digests.add(digest)
+                name, override, pack_rules, warnings = self._load_pack(path, digest)
+            except Exception as e:  # OSError, RulePackError, JSON/YAML syntax errors
+                self.errors.append((os.path.basename(path), str(e)))
+                continue
+
+            self.errors += [(os.path.basename(path), warning) for warning in warnings]
+            if not pack_rules:
+                self.errors.append((os.path.basename(path), "no valid rules"))
+                continue
+
+            self.packs.append((name, path, len(pack_rules)))
+            if override:
+                front += pack_rules
+                front_origins += [name] * len(pack_rules)
+            else:
+                rules += pack_rules
+                origins += [name] * len(pack_rules)
+
+        self._prune_cache(digests)
+        self.origins = front_origins + origins
+        return front + rules
+
+    def parser(self):
+        """Reload the packs and return a ModemLogParser built from them."""
+        return ModemLogParser(rules=self.load())
+
+    def _load_pack(self, path, digest):
+        """Return read_pack() results for a pack, from the cache when its hash is known."""
+        cache_path = os.path.join(self.cache_dir, f"{digest}.json")
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("version") == CACHE_VERSION:
+                rules = [tuple(rule) for rule in cached["rules"]]
+                return cached["name"], cached["override"], rules, cached["warnings"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # not cached yet, or unreadable: parse the pack itself
+
+        name, override, rules, warnings = read_pack(path)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": CACHE_VERSION, "name": name, "override": override,
+                    "rules": rules, "warnings": warnings,
+                }, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not cache rule pack {path}: {e}")
+
+        return name, override, rules, warnings
+
+    def _prune_cache(self, digests):
+        """Delete cached packs whose source file no longer exists in this form."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json") and name[:-5] not in digests:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def _stat_files(self):
+        snapshot = {}
+        for path in self.pack_files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
@@ -0,0 +1,76 @@
+import re
+from datetime import datetime, timedelta
+
+# Stored when a line has no recognizable timestamp (modem logs never predate 1970)
+NO_TIMESTAMP = -1
+
+BUCKET_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_EPOCH = datetime(1970, 1, 1)
+
+ISO_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})")         # 2025-11-20 08:15:23
+US_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4}) (\d{1,2}):(\d{1,2}):(\d{1,2})")  # 11/20/2025 8:15:23
+
+
+def to_epoch(year, month, day, hour, minute, second):
+    """
+    Seconds since 1970-01-01 for a wall-clock time, or NO_TIMESTAMP if it isn't
+    a real date and time from 1970 through 9999 (Feb 31, month 13, hour 25, ...).
+
+    Modem logs carry no time zone, so times are treated as UTC; that keeps
+    arithmetic and bucketing free of DST jumps. Integer-only (days-from-civil),
+    which is several times faster than building datetime objects per line.
+    """
+    if not (1970 <= year <= 9999 and 1 <= month <= 12 and hour < 24 and minute < 60 and second < 61):
+        return NO_TIMESTAMP
+    leap = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not 1 <= day <= DAYS_IN_MONTH[month - 1] + leap:
+        return NO_TIMESTAMP
+
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    days = era * 146097 + doe - 719468
+    return days * 86400 + hour * 3600 + minute * 60 + second
+
+
+def extract_epoch(line):
+    """Return the epoch of the first supported timestamp in a line, or NO_TIMESTAMP."""
+    m = ISO_PATTERN.search(line)
+    if m:
+        y, mo, d, h, mi, s = m.groups()
+        return to_epoch(int(y), int(mo), int(d), int(h), int(mi), int(s))
+
+    m = US_PATTERN.search(line)
+    if m:
+        mo, d, y, h, mi, s = map(int, m.groups())
+        if y < 100:
+            y += 2000
+        return to_epoch(y, mo, d, h, mi, s)
+
+    return NO_TIMESTAMP
+
+
+def format_epoch(epoch):
+    """
+    Display form of an epoch ("YYYY-MM-DD HH:MM:SS"), "Unknown" for NO_TIMESTAMP or out of range.
+    Uses datetime arithmetic rather than time.gmtime(), which raises OSError on Windows for
+    negative or very large values.
+    """
+    if epoch == NO_TIMESTAMP:
+        return "Unknown"
+    try:
+        return (_EPOCH + timedelta(seconds=epoch)).strftime("%Y-%m-%d %H:%M:%S")
+    except (OverflowError, ValueError):
+        return "Unknown"
+
+
+def bucket_size(bucket):
+    """Seconds per bucket for "minute"/"hour"/"day" or an explicit number of seconds."""
+    if isinstance(bucket, str):
+        return BUCKET_SECONDS[bucket]
+    return int(bucket)
@@ -0,0 +1,63 @@
+from PySide6.QtCore import QUrl
+from PySide6.QtGui import QTextDocument
+from PySide6.QtWidgets import QTextBrowser
+
+from services.image_cache_service import ImageCacheService
+
+
+class CachedImageBrowser(QTextBrowser):
+    """
+    QTextBrowser that pulls local <img> resources from the shared ImageCacheService
+    instead of letting QTextDocument decode file:/// URLs on every setHtml().
+
+    Missing images are decoded in the background; the document is re-rendered
+    once they arrive.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.image_cache = ImageCacheService.instance()
+        self._last_html: str | None = ""
+        self._waiting_images: set[str] = set()
+        self.image_cache.image_ready.connect(self._on_image_ready)
+
+    @staticmethod
+    def local_path(url: QUrl) -> str | None:
+        """Return the file path for a local image URL, or None for remote/custom schemes."""
+        if url.isLocalFile():
+            path = url.toLocalFile()
+            # "/C:/..." on non-Windows builds of Qt
+            if len(path) > 2 and path[0] == "/" and path[2] == ":":
+                path = path[1:]
+            return path
+        scheme = url.scheme()
+        if not scheme or len(scheme) == 1:  # relative path or Windows drive letter
+            return url.toString()
+        return None
+
+    def setHtml(self, html: str):
+        self._last_html = html
+        super().setHtml(html)
+
+    def invalidate_html(self):
+        """The document was edited in place; re-render from its current contents when images arrive."""
+        self._last_html = None
+
+    def loadResource(self, resource_type, url: QUrl):
+        if resource_type == QTextDocument.ResourceType.ImageResource:
+            path = self.local_path(url)
+            if path:
+                image = self.image_cache.request(path)
+                if image is None:
+                    self._waiting_images.add(self.image_cache.normalize(path))
+                return image
+        return super().loadResource(resource_type, url)
+
+    def _on_image_ready(self, key: str):
+        if key in self._waiting_images:
+            self._waiting_images.discard(key)
+            scroll = self.verticalScrollBar().value()
+            html = self.toHtml() if self._last_html is None else self._last_html
+            # Drop the document's own resource cache so the image is fetched again
+            self.document().clear()
+            super().setHtml(html)
+            self.verticalScrollBar().setValue(scroll)
@@ -2,6 +2,8 @@ from PySide6.QtWidgets import QDialog, QVBoxLayout, QScrollArea, QLabel
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
 
+from services.image_cache_service import ImageCacheService
+
 class ImagePopup:
     """
     Utility class to display an image in a popup dialog with optional scaling and scroll support.
@@ -26,7 +28,9 @@ class ImagePopup:
                     Default is 0.98 (i.e., 98% of the available scroll area).
 
             Behavior:
-                - Loads the image from the given path.
+                - Takes the image from the shared ImageCacheService; on a miss it is
+                  decoded in the background while a "Loading..." placeholder is shown.
+                  A missing or undecodable file shows an error message instead.
                 - Scales the image to fit within the dialog's scrollable viewport,
                   maintaining the original aspect ratio.
                 - Updates the image size dynamically if the dialog is resized.
@@ -50,14 +54,21 @@ class ImagePopup:
         lbl = QLabel()
         lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        # Load original pixmap once
-        pix = QPixmap(path)
-        lbl.original_pixmap = pix  # store it
+        cache = ImageCacheService.instance()
+        key = cache.normalize(path)
+
+        # Reuse the decoded image if a card or preview already loaded it
+        image = cache.request(path)
+        lbl.original_pixmap = QPixmap.fromImage(image) if image is not None else None
+        if lbl.original_pixmap is None:
+            lbl.setText("Loading..." if cache.is_loading(path) else f"Image not found:\n{path}")
 
         scroll.setWidget(lbl)
 
         # Function to scale pixmap whenever window changes
         def resize_image():
+            if lbl.original_pixmap is None:
+                return
             viewport_size = scroll.viewport().size()
             max_width = int(viewport_size.width() * margin_ratio)
             max_height = int(viewport_size.height() * margin_ratio)
@@ -69,6 +80,24 @@ class ImagePopup:
             )
             lbl.setPixmap(scaled)
 
+        def on_image_ready(ready_key):
+            if ready_key == key and lbl.original_pixmap is None:
+                ready = cache.get(path)
+                if ready is None:  # larger than the whole cache budget, never kept
+                    ready = cache.load(path)
+                lbl.original_pixmap = QPixmap.fromImage(ready)
+                resize_image()
+
+        def on_image_failed(failed_key):
+            if failed_key == key and lbl.original_pixmap is None:
+                lbl.setText(f"Could not load image:\n{path}")
+
+        cache.image_ready.connect(on_image_ready)
+        cache.image_failed.connect(on_image_failed)
+        dlg.finished.connect(lambda: (
+            cache.image_ready.disconnect(on_image_ready), cache.image_failed.disconnect(on_image_failed)
+        ))
+
         # Connect resizing
         dlg.resizeEvent = lambda event: (resize_image(), QDialog.resizeEvent(dlg, event))
         dlg.show()
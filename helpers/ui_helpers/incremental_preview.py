@@ -0,0 +1,219 @@
+import time
+
+from PySide6.QtGui import QTextCursor, QTextCharFormat
+
+# Debounce bounds for the live preview (ms) and how many render times to wait
+PREVIEW_MIN_DELAY = 50
+PREVIEW_MAX_DELAY = 1000
+PREVIEW_DELAY_FACTOR = 3
+
+# Edits touching more than this share of the document are re-rendered in full
+PATCH_MAX_FRACTION = 0.5
+
+# Notes at least this long (characters) prepare full renders on the RenderService pool
+ASYNC_RENDER_CHARS = 20_000
+
+
+def adaptive_delay(render_ms: float) -> int:
+    """Debounce interval for a preview that takes render_ms to update."""
+    return int(min(PREVIEW_MAX_DELAY, max(PREVIEW_MIN_DELAY, render_ms * PREVIEW_DELAY_FACTOR)))
+
+
+class IncrementalPreview:
+    """
+    Keeps a preview QTextBrowser in step with an editor's QTextDocument block by block.
+
+    Edits are collected from the document's contentsChange signal as one dirty
+    character range. update() maps that range to editor blocks, copies just
+    those blocks into the preview and leaves the rest of its layout (and the
+    scroll position) alone. Anything it can't patch safely (tables, the first
+    render, edits covering most of the note, a patch that doesn't line up)
+    falls back to the full toHtml() -> setHtml() render.
+
+    With a render service, full renders of long notes run prepare_full on its
+    pool: update() queues the job and apply_full() loads the result (or
+    render_failed() renders it here if the job failed). Edits made meanwhile
+    stay dirty and are patched in on the next update().
+    """
+    def __init__(self, source, browser, prepare_full, prepare_fragment, render_service=None, job_key=None):
+        """
+        :param source: Editor QTextDocument
+        :param browser: Preview CachedImageBrowser
+        :param prepare_full: Callable turning the editor's toHtml() into the preview document
+        :param prepare_fragment: Callable turning a fragment's HTML into preview HTML (no styles)
+        :param render_service: Optional RenderService for full renders of long notes
+        :param job_key: Key of this preview's jobs on the render service
+        """
+        self.source = source
+        self.browser = browser
+        self.prepare_full = prepare_full
+        self.prepare_fragment = prepare_fragment
+        self.render_service = render_service
+        self.job_key = job_key
+        self._queued = None         # (editor block count, start time) of a full render in flight
+
+        self._dirty = None          # (start, end) character range in the current editor document
+        self._synced_blocks = None  # editor block count when the preview last matched it
+        self._base_format = QTextCharFormat()  # body-level text format of the last full render
+        self.render_ms = 0.0        # smoothed time of recent updates
+        self.patches = 0
+        self.full_renders = 0
+
+        source.contentsChange.connect(self._on_contents_change)
+
+    @property
+    def stale(self) -> bool:
+        return self._synced_blocks is None or self._dirty is not None
+
+    @property
+    def queued(self) -> bool:
+        return self._queued is not None
+
+    def invalidate(self):
+        """Force the next update() to re-render everything."""
+        self._synced_blocks = None
+        if self._queued is not None:
+            self.render_service.cancel(self.job_key)
+            self._queued = None
+
+    def _on_contents_change(self, position, removed, added):
+        end = position + added
+        if self._dirty is None:
+            self._dirty = (position, end)
+            return
+
+        start, old_end = self._dirty
+        if old_end >= position + removed:
+            old_end += added - removed  # text after the edit moved
+        elif old_end > position:
+            old_end = end               # range ended inside the removed text
+        self._dirty = (min(start, position), max(old_end, end))
+
+    def update(self):
+        """
+        Bring the preview up to date.
+        :return: "patch", "full", "queued" (full render handed to the render service) or None
+        """
+        if not self.stale or self._queued is not None:
+            return None  # up to date, or waiting for apply_full()
+
+        started = time.perf_counter()
+        if self._synced_blocks is not None and self._patch():
+            mode = "patch"
+        elif self.render_service is not None and self.source.characterCount() >= ASYNC_RENDER_CHARS:
+            # Snapshot on the GUI thread; edits from here on are patched in after apply_full()
+            self._queued = (self.source.blockCount(), started)
+            self._dirty = None
+            self.render_service.submit(self.job_key, self.prepare_full, self.source.toHtml())
+            return "queued"
+        else:
+            mode = "full"
+            self._render_full(self.prepare_full(self.source.toHtml()))
+
+        self._dirty = None
+        self._synced(self.source.blockCount(), started)
+        return mode
+
+    def apply_full(self, html: str):
+        """Load a full render prepared by the render service."""
+        if self._queued is None:
+            return
+        blocks, started = self._queued
+        self._queued = None
+        self._render_full(html)
+        self._synced(blocks, started)
+
+    def render_failed(self):
+        """The queued full render failed on the render service; render it on the GUI thread instead."""
+        if self._queued is None:
+            return
+        self.invalidate()  # drops the queued job
+        started = time.perf_counter()
+        self._render_full(self.prepare_full(self.source.toHtml()))
+        self._dirty = None
+        self._synced(self.source.blockCount(), started)
+
+    def _synced(self, blocks, started):
+        self._synced_blocks = blocks
+        elapsed = (time.perf_counter() - started) * 1000
+        self.render_ms = elapsed if not self.render_ms else self.render_ms * 0.7 + elapsed * 0.3
+
+    def _render_full(self, html):
+        self.full_renders += 1
+        scroll = self.browser.verticalScrollBar().value()
+        self.browser.setHtml(html)
+        self.browser.verticalScrollBar().setValue(scroll)
+        # <body> styles only apply through setHtml(); patched text gets them from here
+        self._base_format = self.browser.document().firstBlock().charFormat()
+
+    def _patch(self) -> bool:
+        source = self.source
+        preview = self.browser.document()
+        chars = source.characterCount()
+
+        start, end = self._dirty
+        end = min(end, chars - 1)
+        if end - start > chars * PATCH_MAX_FRACTION:
+            return False
+
+        first = source.findBlock(start).blockNumber()
+        last = source.findBlock(end).blockNumber()
+        old_last = last - (source.blockCount() - self._synced_blocks)
+        if first < 0 or last < first or old_last < first or old_last >= preview.blockCount():
+            return False
+
+        src_first, src_last = source.findBlockByNumber(first), source.findBlockByNumber(last)
+        dst_first, dst_last = preview.findBlockByNumber(first), preview.findBlockByNumber(old_last)
+        if any(QTextCursor(block).currentTable() for block in (src_first, src_last, dst_first, dst_last)):
+            return False
+
+        selection = QTextCursor(src_first)
+        selection.setPosition(src_last.position() + src_last.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+        html = self.prepare_fragment(selection.selection().toHtml())
+
+        cursor = QTextCursor(dst_first)
+        cursor.setPosition(dst_last.position() + dst_last.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+        cursor.beginEditBlock()
+        cursor.removeSelectedText()
+        cursor.insertHtml(html)
+        cursor.endEditBlock()
+
+        # The preview now differs from the HTML last given to setHtml()
+        self.browser.invalidate_html()
+
+        # Patched blocks must line up with the editor's, otherwise start over
+        if preview.blockCount() != source.blockCount():
+            return False
+        src_block, dst_block = src_first, preview.findBlockByNumber(first)
+        for _ in range(last - first + 1):
+            if (src_block.text() != dst_block.text()
+                    or (src_block.textList() is None) != (dst_block.textList() is None)
+                    or src_block.blockFormat().alignment() != dst_block.blockFormat().alignment()):
+                return False
+            self._apply_base_format(dst_block)
+            src_block, dst_block = src_block.next(), dst_block.next()
+
+        self.patches += 1
+        return True
+
+    def _apply_base_format(self, block):
+        """Give a patched block's text the color/font a full render would inherit from <body>."""
+        base = self._base_format.properties()
+        cursor = QTextCursor(block)
+        fragments = []
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            if fragment.isValid():
+                fragments.append((fragment.position(), fragment.length(), fragment.charFormat()))
+            it += 1
+
+        for position, length, fmt in fragments:
+            missing = {key: value for key, value in base.items() if not fmt.hasProperty(key)}
+            if not missing:
+                continue
+            for key, value in missing.items():
+                fmt.setProperty(key, value)
+            cursor.setPosition(position)
+            cursor.setPosition(position + length, QTextCursor.MoveMode.KeepAnchor)
+            cursor.setCharFormat(fmt)
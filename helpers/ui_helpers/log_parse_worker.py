@@ -0,0 +1,75 @@
+import io
+from itertools import islice
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class LogParseWorker(QObject):
+    """
+    Streams a modem log through ModemLogParser on a background thread.
+
+    Lines are parsed in chunks into EventBatch objects, each emitted together
+    with the running summary, so the dialog can show results while a large
+    file is still being read.
+
+    The parser's RuleTable belongs to this thread while it runs. Outcomes it
+    gains (embedded tags) travel with each chunk, so the GUI extends its own
+    copy of the table instead of reading the one being written.
+    """
+    batch_ready = Signal(object, object, object)  # EventBatch chunk, summary so far, new RuleTable entries
+    finished = Signal(int)                # total events parsed
+    error = Signal(str)
+
+    def __init__(self, parser, source, from_file=False, batch_lines=5000):
+        """
+        :param parser: ModemLogParser instance
+        :param source: Pasted log text, or a path to a log file when from_file is True
+        :param batch_lines: Lines read per emitted chunk
+        """
+        super().__init__()
+        self.parser = parser
+        self.source = source
+        self.batch_lines = batch_lines
+        self.from_file = from_file
+        self._stopped = False
+        self._known_entries = len(parser.table.entries)  # entries the GUI's copy already has
+
+    def stop(self):
+        """Ask the worker to stop after the current chunk."""
+        self._stopped = True
+
+    @Slot()
+    def run(self):
+        total = 0
+        summary = {}
+
+        try:
+            if self.from_file:
+                lines = open(self.source, "r", encoding="utf-8", errors="replace")
+            else:
+                lines = io.StringIO(self.source)
+
+            with lines:
+                while not self._stopped:
+                    chunk = list(islice(lines, self.batch_lines))
+                    if not chunk:
+                        break
+
+                    batch = self.parser.parse_batch(chunk)
+                    if not len(batch):
+                        continue
+                    total += len(batch)
+                    batch.summarize(summary)
+                    entries = self.parser.table.entries
+                    new_entries = entries[self._known_entries:]
+                    self._known_entries = len(entries)
+                    self.batch_ready.emit(batch, self._snapshot(summary), new_entries)
+
+            self.finished.emit(total)
+        except Exception as e:
+            self.error.emit(str(e))
+
+    @staticmethod
+    def _snapshot(summary):
+        # The GUI thread reads this while parsing continues, so hand over a copy
+        return {cat: dict(data) for cat, data in summary.items()}
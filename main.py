@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 
 from PySide6.QtCore import QSharedMemory
@@ -10,7 +11,9 @@ from PySide6.QtWidgets import (QApplication,
                                QMessageBox)
 
 from services.nuke_service import NukeService
-from startup.startup_runner import run_startup
+from services.theme_service import ThemeService
+from services.view_registry_service import ViewRegistryService
+from startup.startup_runner import StartupRunner, StartupStep
 from helpers.ui_helpers.update_window_title import update_window_title
 from ui.menus.main_menu import MainMenuBar
 from views.splash.splash_screen import SplashScreen
@@ -21,24 +24,22 @@ from views.contacts.contacts_view import ContactsView
 from controllers.note_controller import NoteController
 from controllers.contacts_controller import ContactsController
 from models.note_model import NoteModel
+from utils.oui_lookup import OUIIndex
 from utils.resource_path import resource_path
 
 def load_styles(app):
     """
     This function loads and applies the global dark theme stylesheet.
 
-    The QSS file is read from the ui/themes resource directory and applies
-    it to the entire application. If the stylesheet fails to load, an exception
-    is thrown and prints the error message to the console, but execution continues.
+    The QSS file is read once from the ui/themes resource directory by ThemeService
+    and applied to the entire application, so individual widgets don't set their
+    own copy. If the stylesheet fails to load, the error is printed to the console,
+    but execution continues.
 
     Parameters:
         app (QApplication): The QApplication instance that the stylesheet is applied to.
     """
-    try:
-        with open(resource_path("ui/themes/main_theme.qss"), "r") as f:
-            app.setStyleSheet(f.read())
-    except Exception as e:
-        print("Failed to load stylesheet:", e)
+    ThemeService.apply_app(app)
 
 class MainWindow(QMainWindow):
     """
@@ -56,7 +57,7 @@ class MainWindow(QMainWindow):
     The MainWindow coordinates interactions between models, views, and controllers,
     and manages the initial display of the Dashboard as the default view.
     """
-    def __init__(self):
+    def __init__(self, model=None):
         super().__init__()
         self.setWindowTitle(f"Scratch Board")
         self.setWindowIcon(QIcon(resource_path("resources/icons/astronaut_main.ico")))
@@ -65,12 +66,12 @@ class MainWindow(QMainWindow):
         # Initialize dynamic window titles
         update_window_title(self)
 
-        # Initialize application data models
-        self.model = NoteModel()
+        # Initialize application data models (opened by the startup runner when launched from main())
+        self.model = model or NoteModel()
 
         # Instantiate primary UI views
         categories = ["Contacts", "Nexus", "Internet", "Email", "Phone", "Video", "Streaming", "Coaching", "Notes", "Ideas"]
-        self.main_view = MainNotesView(categories)
+        self.main_view = MainNotesView(categories, model=self.model)
         self.contacts_view = ContactsView(categories)
 
         # Connect sidebar to model and pass signals
@@ -152,6 +153,32 @@ class MainWindow(QMainWindow):
 
         update_window_title(self)
 
+def startup_steps():
+    """
+    The work done behind the splash screen, in dependency order.
+
+    The database is opened on the GUI thread without building the note search
+    index; the index is read on a worker over its own read-only connection
+    while the main window is constructed, and attached once both are done.
+    The OUI index for the MAC tools is opened in the background as well.
+    """
+    return [
+        StartupStep("model", "Opening database...",
+                    lambda r: NoteModel(build_index=False)),
+        StartupStep("note_index", "Indexing notes...",
+                    lambda r: NoteModel.load_index(r["model"].db_path),
+                    depends=("model",), background=True),
+        StartupStep("oui_index", "Loading vendor database...",
+                    lambda r: OUIIndex.shared(resource_path("resources/ieee_oui.csv")),
+                    background=True, optional=True),
+        StartupStep("window", "Building workspace...",
+                    lambda r: MainWindow(model=r["model"]),
+                    depends=("model",), weight=3),
+        StartupStep("ready", "Finishing up...",
+                    lambda r: r["model"].attach_index(r["note_index"]),
+                    depends=("window", "note_index")),
+    ]
+
 def main():
     """
     Main entry point for the Scratch Board application.
@@ -160,9 +187,9 @@ def main():
         1. Create the QApplication instance.
         2. Apply global QSS styles.
         3. Prevent multiple concurrent instances of the program using QSharedMemory.
-        4. Display the splash screen and run start_helpers initialization.
-        5. Initialize and display the main application window when the splash screen is finished.
-        6. Start the Qt event loop.
+        4. Display the splash screen and start the StartupRunner, which reports real progress.
+        5. Display the main application window once the runner has built it.
+        6. Start the Qt event loop (the runner advances inside it).
 
     Exits:
         - Terminates immediately if another instance of the program is already running.
@@ -182,22 +209,36 @@ def main():
         QMessageBox.warning(None, "Already Running", "Scratch Board is already running.")
         sys.exit(0)
 
-    # Initialize and run the start_helpers splash screen
+    # Display the splash screen and report the startup steps on it
     splash = SplashScreen(resource_path("resources/icons/astronaut_splash.png"))
-    run_startup(splash.set_progress)
-
-    # Initialize and display the main application window
-    window = MainWindow()
-
-    # Transition from splash screen to the fully initialized main window (order is important)
-    splash.close()  # 1. Close the splash screen before showing the main window
-    window.show()  # 2. Display the main application window
-    window.raise_()  # 3. Ensure the window appears above all other windows
-    window.activateWindow()  # 4. Give the window keyboard focus and activates it
+    runner = StartupRunner(startup_steps(), parent=app)
+    runner.progress.connect(splash.set_progress)
+
+    def on_started(results):
+        # Transition from splash screen to the fully initialized main window (order is important)
+        window = results["window"]
+        window.show()  # 1. Display the main application window (the event loop is running, so
+                       #    closing the splash first would leave no window open and quit the app)
+        splash.close()  # 2. Close the splash screen
+        window.raise_()  # 3. Ensure the window appears above all other windows
+        window.activateWindow()  # 4. Give the window keyboard focus and activates it
+
+        # Import the menu's tool windows while the app sits idle
+        ViewRegistryService.instance().prewarm()
+
+    def on_failed(message, error):
+        splash.close()
+        QMessageBox.critical(None, "Startup Failed", f"{message}\n\n{error}")
+        app.quit()
+
+    runner.finished.connect(on_started)
+    runner.failed.connect(on_failed)
+    runner.start()
 
     # Execute the Qt application loop and terminate the program when the window is closed
     sys.exit(app.exec())
 
 # Run the program
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # batch log analysis spawns worker processes (frozen builds)
     main()
@@ -1,8 +1,6 @@
 import os
 import re
-import shutil
 import webbrowser
-from pathlib import Path
 from helpers.calc_helpers.count_words import count_words
 from helpers.markdown.md_to_html import render_markdown_to_html
 from PySide6.QtGui import QTextCharFormat, QTextCursor, QTextBlockFormat, QTextListFormat, QFont, QColor, Qt
@@ -12,15 +10,6 @@ from PySide6.QtWidgets import QFileDialog, QInputDialog, QColorDialog
 class EditorManager:
     """Logic class to manage editor panels which includes formatting, preview rendering, and I/O helpers."""
 
-    # Path
-    BASE_DATA_DIR = Path(os.getenv("LOCALAPPDATA")) / "ScratchBoardData"
-
-    # Image storage folder
-    IMAGE_DIR = BASE_DATA_DIR / "images"
-
-    # Ensure directory exists
-    IMAGE_DIR.mkdir(parents=True, exist_ok=True)
-
     # Override CSS/QSS for preview HTML
     PREVIEW_STYLE = """
         <style>
@@ -29,6 +18,11 @@ class EditorManager:
         </style>
     """
 
+    @staticmethod
+    def is_markdown(content: str) -> bool:
+        """True for legacy Markdown content that has to be rendered before editing."""
+        return bool(content) and "<img" not in content and "<html" not in content
+
     @classmethod
     def load_initial_content(cls, content: str) -> str:
         """Normalize editor content (HTML  rather than legacy Markdown)."""
@@ -36,7 +30,7 @@ class EditorManager:
             return ""
 
         # If already HTML, load
-        if "<img" in content or "<html" in content:
+        if not cls.is_markdown(content):
             return content
 
         # Otherwise it's Markdown
@@ -46,7 +40,16 @@ class EditorManager:
     def prepare_preview(cls, html: str) -> str:
         """Prepare HTML and style for preview."""
         html = cls._convert_image_paths(html)
-        return cls.PREVIEW_STYLE + html
+        # Inside <head>, so the style doesn't add an empty first block to the preview
+        head_end = html.find("</head>")
+        if head_end == -1:
+            return cls.PREVIEW_STYLE + html
+        return html[:head_end] + cls.PREVIEW_STYLE + html[head_end:]
+
+    @classmethod
+    def prepare_preview_fragment(cls, html: str) -> str:
+        """Prepare the HTML of a few editor blocks for patching into an existing preview."""
+        return cls._convert_image_paths(html)
 
     @staticmethod
     def _convert_image_paths(html: str) -> str:
@@ -58,55 +61,22 @@ class EditorManager:
         return re.sub(r'<img\s+[^>]*src="([^"]+)"[^>]*>', repl, html)
 
     @classmethod
-    def insert_image_via_dialog(cls, parent, cursor) -> bool:
-        """Opens a file dialog, copies the image locally into a folder, and inserts the image into the editor."""
+    def insert_image_via_dialog(cls, parent, cursor, store) -> bool:
+        """Opens a file dialog, copies the image into the image store, and inserts the image into the editor."""
         path, _ = QFileDialog.getOpenFileName(parent, "Insert Image", "",
                                               "Images (*.png *.jpg *.jpeg *.gif *.webp)")
         if not path:
             return False
 
-        # Make sure image directory exists
-        cls.IMAGE_DIR.mkdir(parents=True, exist_ok=True)
-        dst = cls.IMAGE_DIR / Path(path).name
-        shutil.copy(path, dst)
+        # Identical files resolve to the same stored blob
+        dst = store.put_file(path)
+        if dst is None:
+            return False
 
         # Insert the image as HTML
         cursor.insertHtml(f'<img src="{dst.as_posix()}" style="max-width:350px; height:auto;">')
         return True
 
-    @staticmethod
-    def _extract_image_paths(html: str) -> set[Path]:
-        """
-        Extract all image src paths from HTML.
-        """
-        matches = re.findall(r'<img\s+[^>]*src="([^"]+)"', html)
-        return {Path(m).resolve() for m in matches}
-
-    @classmethod
-    def cleanup_orphaned_images(cls, all_notes_html: list[str]):
-        """
-        Deletes images in IMAGE_DIR that are no longer referenced by any note.
-        """
-        if not cls.IMAGE_DIR.exists():
-            return
-
-        # Collect all image paths still in use
-        used_images: set[Path] = set()
-
-        for html in all_notes_html:
-            used_images |= cls._extract_image_paths(html)
-
-        # Normalize paths
-        used_images = {p.resolve() for p in used_images}
-
-        # Delete unreferenced files
-        for img in cls.IMAGE_DIR.iterdir():
-            if img.is_file() and img.resolve() not in used_images:
-                try:
-                    img.unlink()
-                except Exception as e:
-                    print(f"[Image cleanup] Failed to delete {img}: {e}")
-
     @staticmethod
     def count_words_and_chars(source) -> tuple[int, int]:
         """Return number of words and characters in text."""
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+
+# Closed editors kept alive for reopening
+EDITOR_POOL_SIZE = 6
+
+
+class EditorPoolManager:
+    """
+    Recently closed note editors, one per note, kept for instant reopening.
+
+    A pooled EditorPanel keeps its QTextDocument, toolbar and rendered preview,
+    so reopening the note skips the database read, the HTML parse and the
+    preview render. Each entry remembers the note row's `updated` value; when
+    the row's current value differs (read with NoteModel.get_note_updated, not
+    from a possibly stale listing), the note changed elsewhere and the editor
+    is rebuilt. Editors closed with unsaved changes are never kept.
+    The least recently used editor is deleted once the pool is full.
+    """
+    def __init__(self, max_items=EDITOR_POOL_SIZE):
+        self.max_items = max_items
+        self._editors: OrderedDict[str, tuple[str, object]] = OrderedDict()  # note id -> (updated, editor)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._editors)
+
+    def take(self, note_id, updated):
+        """Remove and return the pooled editor of a note if it is still current, else None."""
+        entry = self._editors.pop(note_id, None)
+        if entry is not None:
+            version, editor = entry
+            if version == updated:
+                self.hits += 1
+                return editor
+            editor.deleteLater()
+        self.misses += 1
+        return None
+
+    def release(self, note_id, editor):
+        """Hand back a closed editor; it is kept only if it still shows the saved note."""
+        if editor.result() == editor.DialogCode.Accepted or not editor.is_pristine():
+            # Saved or deleted (the row changed), or closed with edits that were never saved
+            editor.deleteLater()
+            return
+
+        self.discard(note_id)
+        self._editors[note_id] = (editor.updated, editor)
+        while len(self._editors) > self.max_items:
+            _, (_, evicted) = self._editors.popitem(last=False)
+            evicted.deleteLater()
+
+    def discard(self, note_id):
+        """Forget a note's editor (note deleted or changed)."""
+        entry = self._editors.pop(note_id, None)
+        if entry is not None:
+            entry[1].deleteLater()
+
+    def clear(self):
+        for _, editor in self._editors.values():
+            editor.deleteLater()
+        self._editors.clear()
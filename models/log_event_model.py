@@ -0,0 +1,146 @@
+from array import array
+from heapq import merge
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+
+from helpers.parsers.log_parser_helper import EventBatch
+from helpers.parsers.timestamp_helper import format_epoch
+
+SEVERITY_COLORS = {
+    "Critical": QColor("#FF6B6B"),
+    "High": QColor("#FFB347"),
+    "Medium": QColor("#FFD966"),
+    "Low": QColor("#9AD0EC"),
+    "Info": QColor("#B0B0B0"),
+}
+
+
+class LogEventTableModel(QAbstractTableModel):
+    """
+    Table model over parsed modem log events (Timestamp, Category, Severity, Message).
+
+    Events are kept in one column-oriented EventBatch and a row-index list per
+    rule id, so category/severity filters are a merge of precomputed index lists
+    and text search only scans the rows those filters leave. Cell text is built
+    on request, so a QTableView only ever formats the rows on screen.
+    """
+    HEADERS = ["Timestamp", "Category", "Severity", "Message"]
+
+    def __init__(self, table, parent=None):
+        """
+        :param table: RuleTable shared with the parser that produces the batches
+        """
+        super().__init__(parent)
+        self.events = EventBatch(table)
+        self._by_rule: dict[int, array] = {}  # rule id -> rows of self.events
+        self._visible = array("I")            # rows of self.events that pass the filters
+
+        self.categories = None  # set of names, None = all
+        self.severities = None
+        self.search = ""
+
+    ### FEEDING ###
+    def append_batch(self, batch):
+        """Add a parsed chunk; matching rows appear at the end of the view."""
+        start = len(self.events)
+        self.events.extend(batch)
+
+        wanted = self._wanted_rules()
+        needle = self.search
+        new_rows = array("I")
+        for offset, rule_id in enumerate(batch.rule_ids):
+            row = start + offset
+            rows = self._by_rule.get(rule_id)
+            if rows is None:
+                rows = self._by_rule[rule_id] = array("I")
+            rows.append(row)
+            if rule_id in wanted and (not needle or needle in batch.messages[offset].lower()):
+                new_rows.append(row)
+
+        if new_rows:
+            first = len(self._visible)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._visible.extend(new_rows)
+            self.endInsertRows()
+
+    def clear(self, table=None):
+        """Drop all events; pass a RuleTable when the parser was rebuilt (e.g. rule packs reloaded)."""
+        self.beginResetModel()
+        self.events = EventBatch(table or self.events.table)
+        self._by_rule = {}
+        self._visible = array("I")
+        self.endResetModel()
+
+    ### FILTERING ###
+    def set_filters(self, categories=None, severities=None, search=""):
+        """Filter by category/severity names (None = all) and a case-insensitive substring."""
+        self.categories = set(categories) if categories else None
+        self.severities = set(severities) if severities else None
+        self.search = (search or "").strip().lower()
+
+        # Rows of the wanted rules, in order, from the per-rule indexes
+        wanted = sorted(self._wanted_rules())
+        candidates = merge(*(self._by_rule[r] for r in wanted if r in self._by_rule))
+
+        if self.search:
+            messages = self.events.messages
+            needle = self.search
+            candidates = (row for row in candidates if needle in messages[row].lower())
+
+        self.beginResetModel()
+        self._visible = array("I", candidates)
+        self.endResetModel()
+
+    def _wanted_rules(self):
+        table = self.events.table
+        return {
+            rule_id for rule_id, (category, severity, _, _) in enumerate(table.entries)
+            if (self.categories is None or category in self.categories)
+            and (self.severities is None or severity in self.severities)
+        }
+
+    ### ACCESS ###
+    def event_at(self, row):
+        """ModemEvent for a visible row."""
+        return self.events[self._visible[row]]
+
+    def total_count(self):
+        return len(self.events)
+
+    ### QT MODEL API ###
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._visible[index.row()]
+        category, severity, explanation, _ = self.events.table.entries[self.events.rule_ids[row]]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return format_epoch(self.events.epochs[row])
+            if column == 1:
+                return category
+            if column == 2:
+                return severity
+            return self.events.messages[row]
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return explanation
+
+        if role == Qt.ItemDataRole.ForegroundRole and column == 2:
+            return SEVERITY_COLORS.get(severity)
+
+        return None
@@ -5,19 +5,28 @@ import sqlite3
 import uuid
 import random
 from datetime import datetime
+from pathlib import Path
 
 from domain.autocomplete.note_index import NoteIndex
+from helpers.markdown.note_preview import make_preview
 from services.exp_imp_service import ImportExportService
+from services.image_store_service import ImageStoreService, IMG_SRC_RE
 
 PASTEL_COLORS = ["#FFEBEE", "#FFF3E0", "#E8F5E9", "#E3F2FD", "#F3E5F5"]
 
+# Note listing columns without the full body
+NOTE_LIST_COLUMNS = (
+    "notes.id, notes.category_id, notes.title, notes.preview, notes.color, "
+    "notes.image_path, notes.tags, notes.created, notes.updated"
+)
+
 class NoteModel:
     """
     A class to manage notes, contacts, reference links, and categories.
     Provides CRUD operations, search, and import/export functionality.
     Uses SQLite as the backend database.
     """
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, build_index=True):
         """
         Initialize the NoteModel instance.
         Creates the database and tables if they do not exist.
@@ -26,6 +35,9 @@ class NoteModel:
             db_path (str):
                         Path to SQLite database file.
                         Defaults to LOCALAPPDATA.
+            build_index (bool):
+                        Build the autocomplete index now. Startup passes False, builds it
+                        off the GUI thread with load_index() and hands it over with attach_index().
         """
         if db_path is None:
             base_dir = os.getenv("LOCALAPPDATA", os.path.expanduser("~"))
@@ -34,6 +46,7 @@ class NoteModel:
             os.makedirs(data_dir, exist_ok=True)
             db_path = os.path.join(data_dir, "notes.db")
 
+        self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
 
         # Enable dictionary access to rows
@@ -42,9 +55,17 @@ class NoteModel:
 
         self.import_export = ImportExportService(self)
 
+        # Content-addressed image store (dedupes images across notes)
+        self.image_store = ImageStoreService(self.conn)
+        self._migrate_image_keys()
+        self._migrate_image_refs()
+        self._migrate_inline_images()
+        self._migrate_previews()
+
         # Initialize the Trie algo for autocomplete
         self.index = NoteIndex()
-        self._build_autocomplete_index()
+        if build_index:
+            self._build_autocomplete_index()
 
     def _setup_db(self):
         """
@@ -89,7 +110,25 @@ class NoteModel:
                 );
             """)
 
-        #cur = self.conn.cursor()
+        # Content-addressed image blobs, one row per file (the same bytes may be stored as .png and .jpg)
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS images (
+                hash TEXT NOT NULL,
+                ext TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                added TEXT NOT NULL,
+                PRIMARY KEY (hash, ext)
+            );
+        """)
+
+        # Which notes reference which image blobs
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS note_images (
+                note_id TEXT NOT NULL,
+                image_hash TEXT NOT NULL,
+                PRIMARY KEY (note_id, image_hash)
+            ) WITHOUT ROWID;
+        """)
 
         # Backwards compatibility
         try:
@@ -98,6 +137,12 @@ class NoteModel:
             # Column already exists
             pass
 
+        # Bounded snippet the note cards render from, written on every save
+        try:
+            cur.execute("ALTER TABLE notes ADD COLUMN preview TEXT;")
+        except sqlite3.OperationalError:
+            pass
+
         self.conn.commit()
 
         # Contacts table
@@ -137,6 +182,7 @@ class NoteModel:
         cur.execute("CREATE INDEX IF NOT EXISTS idx_contacts_cat ON contacts(category_id)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_notes_title ON notes(title)")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_notes_updated ON notes(updated)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_note_images_hash ON note_images(image_hash)")
 
         cur.execute("""
             INSERT INTO notes_fts(note_id, title, content, tags)
@@ -170,16 +216,21 @@ class NoteModel:
             tags = [tags]
         tags_json = json.dumps(tags) if tags else None
 
+        # Inline base64 images go to the image store, content keeps a reference
+        content = self.image_store.extract_data_uris(content)
+
         self.conn.execute("""
-            INSERT INTO notes (id, category_id, title, content, color, image_path, tags, created, updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (note_id, category_id, title, content, color, image_path, tags_json, now, now))
+            INSERT INTO notes (id, category_id, title, content, preview, color, image_path, tags, created, updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (note_id, category_id, title, content, make_preview(content), color, image_path, tags_json, now, now))
 
         self.conn.execute("""
             INSERT INTO notes_fts(note_id, title, content, tags)
             VALUES (?, ?, ?, ?)
         """, (note_id, title, content, tags_json))
 
+        self.image_store.sync_note_refs(note_id, content, image_path)
+
         self.index.index_note(
             note_id=note_id,
             title=title,
@@ -190,13 +241,18 @@ class NoteModel:
         self.conn.commit()
         return note_id
 
-    def get_notes(self, category_name=None, search=None, order_by="updated DESC"):
+    def get_notes(self, category_name=None, search=None, order_by="updated DESC", with_content=True):
+        """
+        Notes with their category name.
+        with_content=False leaves out the full body (cards only need `preview`); fetch it with get_note_by_id.
+        """
         cur = self.conn.cursor()
         params = []
+        columns = "notes.*" if with_content else NOTE_LIST_COLUMNS
         # --- FTS search path ---
         if search:
-            query = """
-                   SELECT notes.*, categories.name AS category_name
+            query = f"""
+                   SELECT {columns}, categories.name AS category_name
                    FROM notes
                    JOIN notes_fts ON notes_fts.note_id = notes.id
                    LEFT JOIN categories ON notes.category_id = categories.id
@@ -214,8 +270,8 @@ class NoteModel:
             return cur.fetchall()
 
         # --- Non-search (normal listing) path ---
-        query = """
-               SELECT notes.*, categories.name AS category_name
+        query = f"""
+               SELECT {columns}, categories.name AS category_name
                FROM notes
                LEFT JOIN categories ON notes.category_id = categories.id
                WHERE 1=1
@@ -238,6 +294,11 @@ class NoteModel:
         """, (note_id,))
         return cur.fetchone()
 
+    def get_note_updated(self, note_id):
+        """The note's `updated` value straight from its row (None if it is gone); cheaper than get_note_by_id."""
+        row = self.conn.execute("SELECT updated FROM notes WHERE id=?", (note_id,)).fetchone()
+        return row[0] if row else None
+
     def edit_note(self, note_id, title=None, content=None, category_name=None, image_path=None, tags=None):
         note = self.get_note_by_id(note_id)
         if not note:
@@ -248,8 +309,11 @@ class NoteModel:
             fields.append("title=?")
             params.append(title)
         if content is not None:
+            content = self.image_store.extract_data_uris(content)
             fields.append("content=?")
             params.append(content)
+            fields.append("preview=?")
+            params.append(make_preview(content))
         if category_name is not None:
             category_id = self.add_category(category_name)
             fields.append("category_id=?")
@@ -282,6 +346,14 @@ class NoteModel:
             WHERE id = ?
         """, (note_id,))
 
+        # --- Image reference sync (this note only) ---
+        if content is not None or image_path is not None:
+            self.image_store.sync_note_refs(
+                note_id,
+                content if content is not None else note["content"],
+                image_path if image_path is not None else note["image_path"]
+            )
+
         self.index.remove_note(note_id)
 
         self.index.index_note(
@@ -297,6 +369,7 @@ class NoteModel:
     def delete_note(self, note_id):
         self.conn.execute("DELETE FROM notes_fts WHERE note_id=?", (note_id,))
         self.conn.execute("DELETE FROM notes WHERE id=?", (note_id,))
+        self.image_store.clear_note_refs(note_id)
 
         self.index.remove_note(note_id)
 
@@ -467,10 +540,11 @@ class NoteModel:
         """
         Build Trie + inverted index from all existing notes.
         """
-        cur = self.conn.cursor()
-        cur.execute("SELECT id, title, content, tags FROM notes")
+        self._index_rows(self.index, self.conn.execute("SELECT id, title, content, tags FROM notes"))
 
-        for row in cur.fetchall():
+    @staticmethod
+    def _index_rows(index, rows):
+        for row in rows:
             tags = row["tags"]
             if tags:
                 try:
@@ -478,13 +552,142 @@ class NoteModel:
                 except json.JSONDecodeError:
                     tags = [tags]
 
-            self.index.index_note(
+            index.index_note(
                 note_id=row["id"],
                 title=row["title"],
                 content=row["content"],
                 tags=tags
             )
 
+    @classmethod
+    def load_index(cls, db_path) -> NoteIndex:
+        """
+        Build the autocomplete index on a separate read-only connection.
+        Safe to call from a worker thread while the GUI thread uses the model's own connection.
+        """
+        index = NoteIndex()
+        conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            conn.row_factory = sqlite3.Row
+            cls._index_rows(index, conn.execute("SELECT id, title, content, tags FROM notes"))
+        finally:
+            conn.close()
+        return index
+
+    def attach_index(self, index: NoteIndex):
+        """Use an index built by load_index() (before any note is edited through this model)."""
+        self.index = index
+
+    def _migrate_image_keys(self):
+        """
+        Re-key an images table created with `hash` alone as its primary key.
+
+        That table kept one row per digest, so when the same bytes were stored under
+        two extensions, one of the files had no row and GC never removed it. Those
+        blobs are recorded again after the rebuild.
+        """
+        key_columns = [row["name"] for row in self.conn.execute("PRAGMA table_info(images)") if row["pk"]]
+        if key_columns != ["hash"]:
+            return
+
+        self.conn.executescript("""
+            ALTER TABLE images RENAME TO images_old;
+            CREATE TABLE images (
+                hash TEXT NOT NULL,
+                ext TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                added TEXT NOT NULL,
+                PRIMARY KEY (hash, ext)
+            );
+            INSERT INTO images (hash, ext, size, added) SELECT hash, ext, size, added FROM images_old;
+            DROP TABLE images_old;
+        """)
+        self.image_store.record_untracked_blobs()
+
+    def _migrate_image_refs(self):
+        """
+        One-time migration to the content-addressed image store.
+
+        Legacy images (named after the original file) are copied into the store,
+        note HTML is repointed at the stored blob, and the note_images reference
+        table is filled so orphan collection never needs to scan note content.
+        """
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= 1:
+            return
+
+        store = self.image_store
+        rows = self.conn.execute("SELECT id, content, image_path FROM notes").fetchall()
+
+        for row in rows:
+            content = row["content"] or ""
+            image_path = row["image_path"]
+
+            def adopt(src):
+                if store.parse_ref(src):
+                    return src
+                legacy = Path(src)
+                if not legacy.is_file():
+                    return src
+                return store.put_file(legacy).as_posix()
+
+            new_content = IMG_SRC_RE.sub(lambda m: f"{m.group(1)}{adopt(m.group(2))}{m.group(3)}", content)
+            new_image_path = adopt(image_path) if image_path else image_path
+
+            if new_content != content or new_image_path != image_path:
+                self.conn.execute(
+                    "UPDATE notes SET content=?, image_path=? WHERE id=?",
+                    (new_content, new_image_path, row["id"])
+                )
+                self.conn.execute("UPDATE notes_fts SET content=? WHERE note_id=?", (new_content, row["id"]))
+
+            store.sync_note_refs(row["id"], new_content, new_image_path)
+
+        self.conn.execute("PRAGMA user_version = 1")
+        self.conn.commit()
+
+    def _migrate_inline_images(self):
+        """
+        One-time migration moving base64 data-URI images out of existing notes
+        into the image store, so content, FTS and listings stop carrying them.
+        """
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= 2:
+            return
+
+        rows = self.conn.execute(
+            "SELECT id, content, image_path FROM notes WHERE instr(content, 'data:image/') > 0"
+        ).fetchall()
+
+        for row in rows:
+            new_content = self.image_store.extract_data_uris(row["content"])
+            if new_content == row["content"]:
+                continue
+            self.conn.execute("UPDATE notes SET content=? WHERE id=?", (new_content, row["id"]))
+            self.conn.execute("UPDATE notes_fts SET content=? WHERE note_id=?", (new_content, row["id"]))
+            self.image_store.sync_note_refs(row["id"], new_content, row["image_path"])
+
+        self.conn.execute("PRAGMA user_version = 2")
+        self.conn.commit()
+
+    def _migrate_previews(self):
+        """
+        One-time migration filling the preview column of notes saved before it existed.
+        Version 4 recomputes them once more, now that the budget counts visible text only.
+        """
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= 4:
+            return
+
+        rows = self.conn.execute("SELECT id, content FROM notes").fetchall()
+        self.conn.executemany(
+            "UPDATE notes SET preview=? WHERE id=?",
+            [(make_preview(row["content"]), row["id"]) for row in rows]
+        )
+
+        self.conn.execute("PRAGMA user_version = 4")
+        self.conn.commit()
+
     def autocomplete(self, prefix: str, limit: int = 10) -> list[str]:
         return self.index.autocomplete(prefix, limit)
 
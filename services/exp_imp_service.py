@@ -6,8 +6,6 @@ import uuid
 from pathlib import Path
 from zipfile import ZipFile, ZIP_DEFLATED
 
-from utils.image_io import save_file_drop
-
 local_appdata = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
 BASE_DATA_DIR = Path(local_appdata) / "ScratchBoardData"
 
@@ -81,13 +79,14 @@ class ImportExportService:
 
                 export_data["notes"].append(note_dict)
 
-            # Copy image folder
+            # Copy image folder (including content-addressed shard folders)
             sb_images = BASE_DATA_DIR / "images"
             if sb_images.is_dir():
-                for file in sb_images.glob("*.*"):
+                for file in sb_images.rglob("*.*"):
                     # Avoid name collisions: only copy if filename not already used
-                    dst = images_dir / file.name
+                    dst = images_dir / file.relative_to(sb_images)
                     if not dst.exists():
+                        dst.parent.mkdir(parents=True, exist_ok=True)
                         shutil.copy(file, dst)
 
             # Copy notepad folder
@@ -118,8 +117,8 @@ class ImportExportService:
                 zipf.write(json_path, arcname="notes_export.json")
 
                 # Add images
-                for img_file in images_dir.glob("*.*"):
-                    zipf.write(img_file, arcname=f"images/{img_file.name}")
+                for img_file in images_dir.rglob("*.*"):
+                    zipf.write(img_file, arcname=f"images/{img_file.relative_to(images_dir).as_posix()}")
 
                 # Add notepad txt files
                 for txt_file in notepad_dst.glob("*.txt"):
@@ -144,10 +143,16 @@ class ImportExportService:
         dst_images = BASE_DATA_DIR / "images"
         dst_images.mkdir(parents=True, exist_ok=True)
 
+        store = self.note_model.image_store
+
         if src_images.exists():
-            for file in src_images.glob("*.*"):
+            for file in src_images.rglob("*.*"):
                 try:
-                    shutil.copy(file, dst_images / file.name)
+                    if store.parse_ref(file.relative_to(src_images).as_posix()):
+                        # Content-addressed blob: dedupes against images already stored
+                        store.put_file(file)
+                    else:
+                        shutil.copy(file, dst_images / file.name)
                 except Exception as e:
                     print("Failed copying image:", file, e)
 
@@ -175,9 +180,9 @@ class ImportExportService:
             if img_path:
                 src = import_dir / img_path
                 if src.is_file():
-                    # Copies image to local folder and returns relative path
-                    new_path = save_file_drop(str(src))
-                    note["image_path"] = new_path
+                    # Copies image into the image store and returns the blob path
+                    new_path = store.put_file(src)
+                    note["image_path"] = new_path.as_posix() if new_path else None
 
             tags = note.get("tags")
             if isinstance(tags, str):
@@ -188,7 +193,7 @@ class ImportExportService:
             self.note_model.add_note(
                 category_name=note.get("category_name", "Notes"),
                 title=note["title"],
-                content=note["content"],
+                content=store.localize_refs(note["content"]),
                 image_path=note.get("image_path"),
                 tags=tags
             )
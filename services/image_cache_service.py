@@ -0,0 +1,145 @@
+import os
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, QSettings
+from PySide6.QtGui import QImage, QImageReader
+
+DEFAULT_BUDGET_MB = 64
+
+
+class ImageDecodeJob(QRunnable):
+    """Decode one full-size image off the GUI thread."""
+    def __init__(self, service, path):
+        super().__init__()
+        self.service = service
+        self.path = path
+
+    def run(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        self.service._job_done.emit(self.path, reader.read())
+
+
+class ImageCacheService(QObject):
+    """
+    Application-wide cache of decoded full-size images.
+
+    Shared by ImagePopup, note cards and the editor preview so the same file is
+    decoded once. Entries are evicted least-recently-used once the total decoded
+    size exceeds the byte budget (QSettings "image_cache_mb", default 64 MB).
+
+    Images are kept as QImage so they can be decoded in a worker pool; callers
+    convert to QPixmap on the GUI thread when they need one.
+    """
+    image_ready = Signal(str)  # normalized path
+    image_failed = Signal(str)  # normalized path of a file that could not be decoded
+    _job_done = Signal(str, QImage)
+
+    _instance = None
+
+    def __init__(self, budget_bytes=None, parent=None):
+        super().__init__(parent)
+        if budget_bytes is None:
+            settings = QSettings("DefaultUser", "ScratchBoard")
+            budget_bytes = int(settings.value("image_cache_mb", DEFAULT_BUDGET_MB)) * 1024 * 1024
+
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._memory: OrderedDict[str, QImage] = OrderedDict()
+        self._pending: set[str] = set()
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+
+        self._job_done.connect(self._on_job_done)
+
+    @classmethod
+    def instance(cls) -> "ImageCacheService":
+        """Shared, process-wide cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        """Cache key for a file path or file:/// URL."""
+        if path.startswith("file:///"):
+            path = path[8:] if os.name == "nt" else path[7:]
+        if os.name != "nt" and path.startswith("//"):
+            path = "/" + path.lstrip("/")
+        return os.path.normcase(os.path.abspath(path))
+
+    ### LOOKUPS ###
+    def get(self, path: str) -> QImage | None:
+        """Return a cached image or None without touching the disk."""
+        key = self.normalize(path)
+        image = self._memory.get(key)
+        if image is not None:
+            self._memory.move_to_end(key)
+        return image
+
+    def request(self, path: str) -> QImage | None:
+        """
+        Return a cached image, or queue an asynchronous decode and return None.
+        `image_ready` fires with the normalized path once it is available.
+        """
+        image = self.get(path)
+        if image is not None:
+            return image
+
+        key = self.normalize(path)
+        if key not in self._pending and os.path.isfile(key):
+            self._pending.add(key)
+            self._pool.start(ImageDecodeJob(self, key))
+        return None
+
+    def is_loading(self, path: str) -> bool:
+        """True while a decode queued by request() is running (a missing file is never queued)."""
+        return self.normalize(path) in self._pending
+
+    def load(self, path: str) -> QImage:
+        """Return an image, decoding synchronously on a miss."""
+        image = self.get(path)
+        if image is not None:
+            return image
+
+        key = self.normalize(path)
+        reader = QImageReader(key)
+        reader.setAutoTransform(True)
+        image = reader.read()
+        if not image.isNull():
+            self._remember(key, image)
+        return image
+
+    def set_budget(self, budget_bytes: int):
+        """Change the memory budget and evict down to it."""
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    ### INTERNALS ###
+    def _remember(self, key: str, image: QImage):
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self.used_bytes -= old.sizeInBytes()
+
+        cost = image.sizeInBytes()
+        if cost > self.budget_bytes:
+            return  # never cache something that would evict everything else
+
+        self._memory[key] = image
+        self.used_bytes += cost
+        self._evict()
+
+    def _evict(self):
+        while self.used_bytes > self.budget_bytes and self._memory:
+            _, image = self._memory.popitem(last=False)
+            self.used_bytes -= image.sizeInBytes()
+
+    def _on_job_done(self, key: str, image: QImage):
+        self._pending.discard(key)
+        if image.isNull():
+            # Not remembered: the key is only the path, so a fixed file must be retried
+            self.image_failed.emit(key)
+            return
+        self._remember(key, image)
+        self.image_ready.emit(key)
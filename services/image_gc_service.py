@@ -0,0 +1,102 @@
+import sqlite3
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, Signal, Slot
+
+from services.image_store_service import ImageStoreService
+
+
+class ImageGCWorker(QObject):
+    """
+    Worker that deletes unreferenced image blobs on a background thread.
+    Uses its own SQLite connection since connections can't cross threads.
+    """
+    finished = Signal(int)  # number of blobs removed
+    error = Signal(str)
+
+    def __init__(self, db_path, root, batch_size=50, grace_seconds=600, keep=()):
+        """:param keep: Digests referenced by open editors, never collected"""
+        super().__init__()
+        self.db_path = db_path
+        self.root = root
+        self.batch_size = batch_size
+        self.grace_seconds = grace_seconds
+        self.keep = set(keep)
+
+    @Slot()
+    def run(self):
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_path)
+            store = ImageStoreService(conn, self.root)
+            removed = store.collect_garbage(self.batch_size, self.grace_seconds, self.keep)
+            self.finished.emit(removed)
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            if conn is not None:
+                conn.close()
+
+
+class ImageGCService(QObject):
+    """
+    Schedules orphan image collection off the UI thread.
+
+    Saving or deleting a note only calls schedule(); bursts of requests are
+    coalesced by a short timer and at most one collection pass runs at a time.
+    """
+    def __init__(self, model, delay_ms=2000, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self._thread = None
+        self._worker = None
+        self._pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._start)
+
+        # Don't tear down the app while a pass is still deleting files
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.wait)
+
+    def schedule(self):
+        """Request a collection pass soon."""
+        if self._thread is not None:
+            # A pass is already running; run once more when it ends
+            self._pending = True
+            return
+        self._timer.start()
+
+    def _start(self):
+        thread = QThread()
+        # Open editors' documents live on this thread, so their image references are read here
+        store = self.model.image_store
+        worker = ImageGCWorker(self.model.db_path, store.root, keep=store.open_refs())
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        worker.error.connect(lambda msg: print(f"[Image cleanup] {msg}"))
+
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_finished)
+
+        # Keep references while running
+        self._thread, self._worker = thread, worker
+        thread.start()
+
+    def _on_finished(self):
+        self._thread, self._worker = None, None
+        if self._pending:
+            self._pending = False
+            self.schedule()
+
+    def wait(self):
+        """Block until a running pass ends (used on shutdown)."""
+        self._timer.stop()
+        if self._thread is not None:
+            self._thread.wait()
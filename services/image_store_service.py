@@ -0,0 +1,322 @@
+# Content-addressed image store
+import base64
+import binascii
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+local_appdata = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+BASE_DATA_DIR = Path(local_appdata) / "ScratchBoardData"
+
+# File extensions a stored blob may carry
+STORE_EXT_RE = re.compile(r"\.[A-Za-z0-9]{2,5}")
+
+# Matches "<aa>/<sha256><ext>" where <aa> is the first two hex chars of the digest
+STORE_REF_RE = re.compile(
+    r"(?P<shard>[0-9a-f]{2})[/\\](?P<digest>(?P=shard)[0-9a-f]{62})(?P<ext>" + STORE_EXT_RE.pattern + ")"
+)
+
+# Matches the src attribute of an <img> tag
+IMG_SRC_RE = re.compile(r'(<img\s+[^>]*src=")([^"]+)(")')
+
+# Matches an inline base64 image, e.g. in <img src="data:..."> or ![](data:...)
+DATA_URI_RE = re.compile(r"data:image/(?P<type>[\w.+-]+);base64,(?P<data>[A-Za-z0-9+/=\r\n]+)")
+
+# MIME subtypes whose usual extension differs from the subtype
+MIME_EXTS = {"jpeg": ".jpg", "pjpeg": ".jpg", "svg+xml": ".svg", "x-icon": ".ico"}
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ImageStoreService:
+    """
+    Content-addressed storage for note images.
+
+    Every image is stored exactly once, named after the SHA-256 of its bytes and
+    sharded by the first two hex characters:
+
+        ScratchBoardData/images/ab/ab3f...e9.png
+
+    Inserting is a hash plus a single existence check, so the same screenshot pasted
+    into ten notes is written to disk once. Stored blobs are recorded in the
+    `images` table, one row per (hash, ext) file, and notes reference them by hash
+    through `note_images`, which makes orphan detection a single query.
+    """
+    def __init__(self, conn, root=None):
+        """
+        :param conn: sqlite3 connection owning the images/note_images tables
+        :param root: Store directory, defaults to ScratchBoardData/images
+        """
+        self.conn = conn
+        self.root = Path(root) if root else BASE_DATA_DIR / "images"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._open_documents = {}  # owner -> callable returning the HTML of a document not saved yet
+
+    ### PATH HELPERS ###
+    def path_for(self, digest: str, ext: str) -> Path:
+        """Return the on-disk location of a blob."""
+        return self.root / digest[:2] / f"{digest}{ext.lower()}"
+
+    @staticmethod
+    def parse_ref(path: str) -> tuple[str, str] | None:
+        """
+        Return (digest, ext) if the path points into a content-addressed store,
+        otherwise None (legacy or external image).
+        """
+        match = STORE_REF_RE.search(path)
+        if not match:
+            return None
+        return match.group("digest"), match.group("ext").lower()
+
+    ### INSERTS ###
+    def put_bytes(self, data: bytes, ext: str = ".png") -> Path:
+        """Store raw image bytes and return the blob path."""
+        ext = self._normalize_ext(ext)
+        digest = hashlib.sha256(data).hexdigest()
+        dst = self.path_for(digest, ext)
+
+        # Record before touching disk so a concurrent GC pass never unlinks a blob being re-added
+        self._record(digest, ext, len(data))
+        if not dst.exists():
+            self._write_atomic(dst, lambda f: f.write(data))
+        return dst
+
+    def put_file(self, src) -> Path | None:
+        """Copy an image file into the store and return the blob path."""
+        src = Path(src)
+        if not src.is_file():
+            return None
+
+        ext = self._normalize_ext(src.suffix)
+        hasher = hashlib.sha256()
+        with open(src, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        dst = self.path_for(digest, ext)
+
+        self._record(digest, ext, src.stat().st_size)
+        if not dst.exists():
+            def copy(out):
+                with open(src, "rb") as f:
+                    shutil.copyfileobj(f, out, CHUNK_SIZE)
+            self._write_atomic(dst, copy)
+        return dst
+
+    ### REFERENCES ###
+    def blob_refs(self, html: str | None, image_path: str | None = None) -> set[tuple[str, str]]:
+        """
+        Return (digest, ext) for every stored blob referenced by a note.
+        Scans the whole text, so <img> tags and Markdown ![](...) references both count.
+        """
+        refs = {(m.group("digest"), m.group("ext").lower()) for m in STORE_REF_RE.finditer(html or "")}
+
+        if image_path:
+            ref = self.parse_ref(image_path)
+            if ref:
+                refs.add(ref)
+        return refs
+
+    def image_refs(self, html: str | None, image_path: str | None = None) -> set[str]:
+        """Return the digests of every stored blob referenced by a note."""
+        return {digest for digest, _ in self.blob_refs(html, image_path)}
+
+    def sync_note_refs(self, note_id: str, html: str | None, image_path: str | None = None):
+        """
+        Replace the reference rows for one note.
+        Cost depends only on this note, never on the size of the corpus.
+        Referenced blobs still on disk get their images row back if it went missing.
+        The caller owns the transaction.
+        """
+        refs = self.blob_refs(html, image_path)
+        added = datetime.now().isoformat()
+        for digest, ext in refs:
+            blob = self.path_for(digest, ext)
+            if blob.is_file():
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO images (hash, ext, size, added) VALUES (?, ?, ?, ?)",
+                    (digest, ext, blob.stat().st_size, added)
+                )
+
+        self.conn.execute("DELETE FROM note_images WHERE note_id=?", (note_id,))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO note_images (note_id, image_hash) VALUES (?, ?)",
+            [(note_id, digest) for digest in {digest for digest, _ in refs}]
+        )
+
+    def clear_note_refs(self, note_id: str):
+        """Drop all reference rows for a deleted note. The caller owns the transaction."""
+        self.conn.execute("DELETE FROM note_images WHERE note_id=?", (note_id,))
+
+    ### OPEN DOCUMENTS ###
+    def track_open(self, owner, html_source):
+        """
+        Protect the images of a document being edited from GC until untrack_open().
+        :param html_source: Callable returning the document's current HTML
+        """
+        self._open_documents[owner] = html_source
+
+    def untrack_open(self, owner):
+        self._open_documents.pop(owner, None)
+
+    def open_refs(self) -> set[str]:
+        """Digests referenced by documents still being edited (read on the thread owning them)."""
+        refs = set()
+        for html_source in list(self._open_documents.values()):
+            refs |= self.image_refs(html_source())
+        return refs
+
+    ### QUERIES ###
+    def orphaned_images(self, limit: int | None = None) -> list[tuple[str, str]]:
+        """Return (digest, ext) for every stored blob no note references."""
+        query = """
+            SELECT hash, ext FROM images
+            WHERE NOT EXISTS (
+                SELECT 1 FROM note_images WHERE note_images.image_hash = images.hash
+            )
+        """
+        params = []
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [(row[0], row[1]) for row in self.conn.execute(query, params).fetchall()]
+
+    def collect_garbage(self, batch_size: int = 50, grace_seconds: int = 600, keep=()) -> int:
+        """
+        Delete unreferenced blobs in batches and return how many were removed.
+
+        Blobs whose digest is in `keep` (see open_refs()) are referenced by an
+        editor that has not been saved yet and are never removed; blobs added
+        within the grace period are kept as well, for editors not tracked that
+        way. Each row is re-checked inside the DELETE, so a note saved mid-pass
+        keeps its images.
+        """
+        cutoff = (datetime.now() - timedelta(seconds=grace_seconds)).isoformat()
+        kept = json.dumps(sorted(keep))
+        removed = 0
+
+        while True:
+            rows = self.conn.execute("""
+                SELECT hash, ext FROM images
+                WHERE added < ? AND hash NOT IN (SELECT value FROM json_each(?)) AND NOT EXISTS (
+                    SELECT 1 FROM note_images WHERE note_images.image_hash = images.hash
+                )
+                LIMIT ?
+            """, (cutoff, kept, batch_size)).fetchall()
+            if not rows:
+                break
+
+            for digest, ext in rows:
+                cur = self.conn.execute("""
+                    DELETE FROM images
+                    WHERE hash = ? AND ext = ? AND added < ? AND NOT EXISTS (
+                        SELECT 1 FROM note_images WHERE note_images.image_hash = ?
+                    )
+                """, (digest, ext, cutoff, digest))
+                if not cur.rowcount:
+                    continue
+
+                blob = self.path_for(digest, ext)
+                try:
+                    blob.unlink(missing_ok=True)
+                    blob.parent.rmdir()  # only succeeds once the shard is empty
+                except OSError:
+                    pass
+                removed += 1
+
+            self.conn.commit()
+
+            if len(rows) < batch_size:
+                break
+
+        return removed
+
+    def record_untracked_blobs(self) -> int:
+        """
+        Add an images row for every blob on disk that has none, so GC can see it.
+        Returns how many were added. Used once when upgrading from the hash-only table.
+        """
+        known = {(row[0], row[1]) for row in self.conn.execute("SELECT hash, ext FROM images")}
+        added = datetime.now().isoformat()
+        rows = []
+        for blob in self.root.glob("??/*"):
+            match = STORE_REF_RE.fullmatch(f"{blob.parent.name}/{blob.name}")
+            if match and (match.group("digest"), match.group("ext").lower()) not in known:
+                rows.append((match.group("digest"), match.group("ext").lower(), blob.stat().st_size, added))
+
+        self.conn.executemany("INSERT OR IGNORE INTO images (hash, ext, size, added) VALUES (?, ?, ?, ?)", rows)
+        self.conn.commit()
+        return len(rows)
+
+    def extract_data_uris(self, html: str | None) -> str | None:
+        """
+        Move inline base64 images into the store and point the HTML at the blobs.
+
+        Keeps note content (and everything derived from it: FTS, autocomplete,
+        listings) free of encoded image data. Malformed payloads are left as-is.
+        """
+        if not html or "data:image/" not in html:
+            return html
+
+        def repl(m):
+            try:
+                data = base64.b64decode(m.group("data"), validate=False)
+            except (binascii.Error, ValueError):
+                return m.group(0)
+            if not data:
+                return m.group(0)
+            subtype = m.group("type").lower()
+            ext = MIME_EXTS.get(subtype, f".{subtype}")
+            if not STORE_EXT_RE.fullmatch(ext):
+                return m.group(0)  # extension the store can't reference
+            return self.put_bytes(data, ext).as_posix()
+
+        return DATA_URI_RE.sub(repl, html)
+
+    def localize_refs(self, html: str) -> str:
+        """
+        Point store references in HTML at this store's root.
+        Used when importing notes exported from another machine.
+        """
+        if not html:
+            return html
+
+        def repl(m):
+            ref = self.parse_ref(m.group(2))
+            if not ref:
+                return m.group(0)
+            return f"{m.group(1)}{self.path_for(*ref).as_posix()}{m.group(3)}"
+
+        return IMG_SRC_RE.sub(repl, html)
+
+    ### INTERNALS ###
+    @staticmethod
+    def _normalize_ext(ext: str) -> str:
+        ext = (ext or ".png").lower()
+        return ext if ext.startswith(".") else f".{ext}"
+
+    @staticmethod
+    def _write_atomic(dst: Path, writer):
+        """Write into a temp file next to dst, then rename so readers never see partial blobs."""
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=dst.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                writer(f)
+            os.replace(tmp, dst)
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _record(self, digest: str, ext: str, size: int):
+        self.conn.execute("""
+            INSERT INTO images (hash, ext, size, added)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(hash, ext) DO UPDATE SET added = excluded.added
+        """, (digest, ext, size, datetime.now().isoformat()))
+        self.conn.commit()
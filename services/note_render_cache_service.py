@@ -0,0 +1,140 @@
+import hashlib
+import re
+from collections import OrderedDict
+
+from helpers.markdown.md_to_html import MarkdownRenderer
+from helpers.markdown.note_preview import make_preview
+from services.image_store_service import IMG_SRC_RE
+from services.thumbnail_cache_service import ThumbnailCacheService
+
+CARD_STYLE = """
+    <style>
+        a {
+            color: #5dade2;
+            text-decoration: none;
+        }
+        img {
+            max-width: 180px;
+            height: auto;
+            border-radius: 6px;
+            cursor: pointer;
+        }
+    </style>
+"""
+
+# Raw HTML a note may carry that has no place in a card preview
+UNSAFE_BLOCK_RE = re.compile(r"<(script|style|iframe|object|embed)\b.*?(?:</\1\s*>|$)", re.IGNORECASE | re.DOTALL)
+EVENT_ATTR_RE = re.compile(r"""\s+on\w+\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+)""", re.IGNORECASE)
+JS_URL_RE = re.compile(r"""(href|src)\s*=\s*(["'])\s*javascript:[^"']*\2""", re.IGNORECASE)
+
+
+class RenderedCard:
+    """Cached card body: HTML with "thumb:" image URLs, and the image path behind each URL."""
+    __slots__ = ("html", "sources")
+
+    def __init__(self, html, sources):
+        self.html = html
+        self.sources = sources  # thumb url -> original image path
+
+
+def sanitize_html(html):
+    """Drop scripts, embedded styles/frames, event handlers and javascript: links."""
+    html = UNSAFE_BLOCK_RE.sub("", html)
+    html = EVENT_ATTR_RE.sub("", html)
+    return JS_URL_RE.sub(r'\1=\2#\2', html)
+
+
+class NoteRenderCacheService:
+    """
+    LRU cache of rendered note card bodies, keyed by a hash of the note's preview.
+
+    Rendering a card means Markdown conversion (through the MarkdownRenderer
+    shared with the editor), sanitizing and rewriting image sources to
+    thumbnail URLs; repeated for every card on each category switch, search
+    keystroke and grid/list toggle, it dominated refreshes. Entries live
+    until evicted or until invalidate() is called for the note (on edit/delete).
+
+    Cards render notes.preview, the bounded snippet NoteModel stores on save, so
+    the cost per card stays constant however long a note is (rows without a
+    preview are cut with make_preview here).
+    """
+    _instance = None
+
+    def __init__(self, max_items=256):
+        self.max_items = max_items
+        self._cards: OrderedDict[str, RenderedCard] = OrderedDict()
+        self._keys_by_note: dict[int, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def instance(cls) -> "NoteRenderCacheService":
+        """Shared, process-wide cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def key_for(content, image_path=None):
+        h = hashlib.sha256(content.encode("utf-8"))
+        if image_path:
+            h.update(b"\0" + image_path.encode("utf-8"))
+        return h.hexdigest()
+
+    def render(self, note) -> RenderedCard:
+        """Return the cached card body for a note row, rendering it on a miss."""
+        keys = note.keys()
+        if "preview" in keys and note["preview"] is not None:
+            content = note["preview"]
+        else:
+            content = make_preview(note["content"] if "content" in keys else "")
+        image_path = note["image_path"] if "image_path" in keys else None
+        key = self.key_for(content, image_path)
+
+        if "id" in keys:
+            self._keys_by_note[note["id"]] = key
+
+        card = self._cards.get(key)
+        if card is not None:
+            self._cards.move_to_end(key)
+            self.hits += 1
+            return card
+
+        self.misses += 1
+        card = self._render(content, image_path)
+        self._cards[key] = card
+        while len(self._cards) > self.max_items:
+            self._cards.popitem(last=False)
+        return card
+
+    def invalidate(self, note_id):
+        """Forget the rendered card of a note that was edited or deleted."""
+        key = self._keys_by_note.pop(note_id, None)
+        if key is not None:
+            self._cards.pop(key, None)
+
+    def clear(self):
+        self._cards.clear()
+        self._keys_by_note.clear()
+
+    @staticmethod
+    def _render(content, image_path):
+        thumbs = ThumbnailCacheService.instance()
+        sources = {}
+
+        def thumb_url(path):
+            # Images are shown as cached thumbnails rather than decoded full-size per card
+            path = path[8:] if path.startswith("file:///") else path
+            key = thumbs.key_for(path)
+            if key is None:
+                return path
+            url = f"thumb:{key}"
+            sources[url] = path
+            return url
+
+        body = sanitize_html(MarkdownRenderer.instance().render_body(content))
+        body = IMG_SRC_RE.sub(lambda m: f"{m.group(1)}{thumb_url(m.group(2))}{m.group(3)}", body)
+
+        img_html = f'<br><img src="{thumb_url(image_path)}" />' if image_path else ""
+
+        return RenderedCard(f"{CARD_STYLE}{body}{img_html}", sources)
@@ -0,0 +1,84 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class RenderJob(QRunnable):
+    """Run one render function (Markdown -> HTML, preview preparation) off the GUI thread."""
+    def __init__(self, service, key, generation, fn, args):
+        super().__init__()
+        self.service = service
+        self.key = key
+        self.generation = generation
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            result, error = self.fn(*self.args), ""
+        except Exception as e:
+            result, error = "", str(e)
+        self.service._job_done.emit(self.key, self.generation, result, error)
+
+
+class RenderService(QObject):
+    """
+    Application-wide worker pool for HTML rendering.
+
+    Callers submit jobs under a key of their own (one per editor and purpose).
+    Every submit bumps the key's generation, so when several jobs for the same
+    key are in flight only the newest result is delivered through `rendered`;
+    older ones are dropped when they finish. The functions must not touch
+    widgets or documents owned by the GUI thread.
+    """
+    rendered = Signal(str, str)     # job key, HTML from the latest job
+    failed = Signal(str, str)       # job key, error message
+    _job_done = Signal(str, int, str, str)
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._generations: dict[str, int] = {}
+        self._pending: set[str] = set()
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+
+        self._job_done.connect(self._on_job_done)
+
+    @classmethod
+    def instance(cls) -> "RenderService":
+        """Shared, process-wide render pool."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(self, key: str, fn, *args) -> int:
+        """Queue fn(*args) for key, superseding any job still running for it; returns its generation."""
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        self._pending.add(key)
+        self._pool.start(RenderJob(self, key, generation, fn, args))
+        return generation
+
+    def cancel(self, key: str):
+        """Drop the result of any job in flight for key."""
+        if key in self._generations:
+            self._generations[key] += 1
+        self._pending.discard(key)
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._pending
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until every queued job has run (results still arrive through the event loop)."""
+        return self._pool.waitForDone(msecs)
+
+    def _on_job_done(self, key, generation, result, error):
+        if generation != self._generations.get(key):
+            return  # superseded or cancelled
+        self._pending.discard(key)
+        if error:
+            print(f"Render job {key} failed:", error)
+            self.failed.emit(key, error)
+        else:
+            self.rendered.emit(key, result)
@@ -0,0 +1,44 @@
+from utils.resource_path import resource_path
+
+# Sheets applied once to the whole application; widgets pick their rules up by
+# type or object name without calling setStyleSheet themselves
+APP_THEMES = ("main_theme.qss",)
+
+
+class ThemeService:
+    """
+    Reads each QSS file under ui/themes once and hands out the cached text.
+
+    Application-wide sheets are applied to QApplication at startup. Views with
+    their own look (chart dialogs, editor, password generator, the note grid)
+    set one sheet on their top-level container, which outranks the app sheet
+    for everything inside it; no constructor re-reads a file and widgets
+    created in bulk, like note cards, set no stylesheet at all. Every chart
+    dialog under views/info_widgets shares charts_theme.qss, so only the first
+    one opened reads it.
+    """
+    _sheets: dict[str, str] = {}
+
+    @classmethod
+    def stylesheet(cls, name: str) -> str:
+        """QSS text of ui/themes/<name>, read from disk on first use ("" if unreadable)."""
+        sheet = cls._sheets.get(name)
+        if sheet is None:
+            try:
+                with open(resource_path(f"ui/themes/{name}"), "r", encoding="utf-8") as f:
+                    sheet = f.read()
+            except OSError as e:
+                print(f"Failed to load {name}:", e)
+                sheet = ""
+            cls._sheets[name] = sheet
+        return sheet
+
+    @classmethod
+    def apply(cls, widget, name: str):
+        """Style a top-level container (dialog, window, card grid) with one cached sheet."""
+        widget.setStyleSheet(cls.stylesheet(name))
+
+    @classmethod
+    def apply_app(cls, app):
+        """Apply the application-wide sheets to QApplication in a single call."""
+        app.setStyleSheet("\n".join(cls.stylesheet(name) for name in APP_THEMES))
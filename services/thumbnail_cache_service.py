@@ -0,0 +1,146 @@
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Qt, QSize
+from PySide6.QtGui import QImage, QImageReader
+
+from services.image_store_service import BASE_DATA_DIR, ImageStoreService
+
+THUMB_SIZE = 250
+
+
+class ThumbnailJob(QRunnable):
+    """Decode and downscale one image off the GUI thread (QImage only, never QPixmap)."""
+    def __init__(self, service, key, src, dst, size):
+        super().__init__()
+        self.service = service
+        self.key = key
+        self.src = src
+        self.dst = dst
+        self.size = size
+
+    def run(self):
+        reader = QImageReader(str(self.src))
+        reader.setAutoTransform(True)
+
+        # Let the decoder scale while reading instead of decoding full-size first
+        original = reader.size()
+        if original.isValid() and (original.width() > self.size or original.height() > self.size):
+            reader.setScaledSize(original.scaled(QSize(self.size, self.size), Qt.AspectRatioMode.KeepAspectRatio))
+
+        image = reader.read()
+        if image.isNull():
+            self.service._job_done.emit(self.key, QImage())
+            return
+
+        try:
+            self.dst.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.dst.with_suffix(".tmp")
+            if image.save(str(tmp), "PNG"):
+                os.replace(tmp, self.dst)
+        except OSError as e:
+            print(f"[Thumbnails] Failed to persist {self.dst}: {e}")
+
+        self.service._job_done.emit(self.key, image)
+
+
+class ThumbnailCacheService(QObject):
+    """
+    Two-level thumbnail cache for note card images.
+
+    - In-memory LRU of QImage thumbnails (GUI thread only).
+    - On-disk PNGs under ScratchBoardData/thumbs/<size>/<aa>/<key>.png that survive restarts.
+
+    Keys come from the image store digest, so a thumbnail is generated once per image
+    and size no matter how many notes show it. Misses are generated in a small
+    QThreadPool and announced through `thumbnail_ready`.
+    """
+    thumbnail_ready = Signal(str)  # key
+    _job_done = Signal(str, QImage)
+
+    _instance = None
+
+    def __init__(self, root=None, max_items=512, parent=None):
+        super().__init__(parent)
+        self.root = Path(root) if root else BASE_DATA_DIR / "thumbs"
+        self.max_items = max_items
+        self._memory: OrderedDict[str, QImage] = OrderedDict()
+        self._pending: set[str] = set()
+        self._failed: set[str] = set()
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(4, QThreadPool.globalInstance().maxThreadCount() - 1)))
+
+        self._job_done.connect(self._on_job_done)
+
+    @classmethod
+    def instance(cls) -> "ThumbnailCacheService":
+        """Shared, process-wide cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    ### KEYS ###
+    @staticmethod
+    def key_for(path: str, size: int = THUMB_SIZE) -> str | None:
+        """
+        Cache key for an image at a given size.
+        Store blobs use their content digest; other files fall back to path + mtime + length.
+        """
+        ref = ImageStoreService.parse_ref(path)
+        if ref:
+            return f"{ref[0]}_{size}"
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        fingerprint = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}"
+        return f"{hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()}_{size}"
+
+    def _disk_path(self, key: str, size: int) -> Path:
+        return self.root / str(size) / key[:2] / f"{key}.png"
+
+    ### LOOKUPS ###
+    def get(self, path: str, size: int = THUMB_SIZE) -> QImage | None:
+        """
+        Return a cached thumbnail or None.
+        On a miss, generation is queued and `thumbnail_ready` fires with the key when done.
+        """
+        key = self.key_for(path, size)
+        if key is None or key in self._failed:
+            return None
+
+        image = self._memory.get(key)
+        if image is not None:
+            self._memory.move_to_end(key)
+            return image
+
+        disk = self._disk_path(key, size)
+        if disk.exists():
+            image = QImage(str(disk))
+            if not image.isNull():
+                self._remember(key, image)
+                return image
+
+        if key not in self._pending:
+            self._pending.add(key)
+            self._pool.start(ThumbnailJob(self, key, path, disk, size))
+        return None
+
+    ### INTERNALS ###
+    def _remember(self, key: str, image: QImage):
+        self._memory[key] = image
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _on_job_done(self, key: str, image: QImage):
+        self._pending.discard(key)
+        if image.isNull():
+            self._failed.add(key)
+            return
+        self._remember(key, image)
+        self.thumbnail_ready.emit(key)
@@ -0,0 +1,115 @@
+import importlib
+import time
+
+from PySide6.QtCore import QObject, QTimer
+
+# Tool windows opened from the menus and sidebar: name -> (module, class).
+# Nothing here is imported until the view is first opened or prewarmed.
+VIEWS = {
+    "about": ("views.widgets.about_widget", "AboutWidget"),
+    "asteroids": ("views.games.asteroid", "AsteroidsWidget"),
+    "batch_manager": ("views.widgets.batch_pop_widget", "BatchPopup"),
+    "calculator": ("views.widgets.calc_widget", "SimpleCalcView"),
+    "log_parser": ("views.widgets.log_widget", "ModemLogParserView"),
+    "mac_vendor": ("views.widgets.mac_pop_widget", "MacVendorPopup"),
+    "markdown_guide": ("views.widgets.md_widget", "MarkdownGuideWidget"),
+    "notepad": ("views.notepad.notepad_view", "NotepadDialog"),
+    "password": ("views.widgets.password_widget", "PassGenWidget"),
+    "references": ("views.widgets.ref_pop_widget", "ReferencePopup"),
+    "shortcuts": ("views.widgets.shortcut_widget", "ShortcutGuide"),
+    "sticky_notes": ("managers.sticky_manager", "StickyManager"),
+    # Reference charts
+    "ethernet_chart": ("views.info_widgets.ethernet_widget", "EthernetReference"),
+    "fiber_chart": ("views.info_widgets.fiber_widget", "FiberReferenceDialog"),
+    "gaming_chart": ("views.info_widgets.gaming_widget", "GamingReference"),
+    "protocol_chart": ("views.info_widgets.protocol_widget", "InternetProtocolsTimeline"),
+    "signal_chart": ("views.info_widgets.signal_widget", "SignalReference"),
+    "speed_chart": ("views.info_widgets.speed_widget", "InternetSpeedRequirements"),
+    "storage_chart": ("views.info_widgets.storage_widget", "DiskStorageChart"),
+    "voip_chart": ("views.info_widgets.voip_widget", "VoIPReference"),
+    "wifi_chart": ("views.info_widgets.wifi_standards_widget", "WifiStandardsReference"),
+}
+
+# Wait after the main window is shown before prewarming (ms)
+PREWARM_DELAY = 1500
+
+
+class ViewRegistryService(QObject):
+    """
+    Application-wide registry of tool windows, imported on first use.
+
+    The menu bar and sidebar open tools by name instead of importing every
+    dialog module (and QtCharts, psutil, pygments and friends behind them)
+    at startup. prewarm() imports the remaining modules after the window is
+    up, one per event loop turn, so the first open of a tool is fast too
+    without holding up the first paint. Import times are kept in `timings`
+    (seconds).
+    """
+    _instance = None
+
+    def __init__(self, views=None, parent=None):
+        super().__init__(parent)
+        self._specs: dict[str, tuple[str, str]] = dict(VIEWS if views is None else views)
+        self._classes: dict[str, type] = {}
+        self._prewarm_queue: list[str] = []
+        self.timings: dict[str, float] = {}
+
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.timeout.connect(self._prewarm_next)
+
+    @classmethod
+    def instance(cls) -> "ViewRegistryService":
+        """Shared, process-wide registry of the VIEWS table."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def register(self, name: str, module: str, attribute: str):
+        """Add (or replace) a view by module path and class name."""
+        self._specs[name] = (module, attribute)
+        self._classes.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._classes
+
+    def resolve(self, name: str) -> type:
+        """The view's class, importing its module on first use."""
+        cls = self._classes.get(name)
+        if cls is None:
+            module, attribute = self._specs[name]
+            started = time.perf_counter()
+            cls = getattr(importlib.import_module(module), attribute)
+            self.timings[name] = time.perf_counter() - started
+            self._classes[name] = cls
+        return cls
+
+    def create(self, name: str, *args, **kwargs):
+        """Instantiate a view by name."""
+        return self.resolve(name)(*args, **kwargs)
+
+    def prewarm(self, names=None, delay: int = PREWARM_DELAY):
+        """Import the given views (default: all) in the background of the event loop, starting after delay ms."""
+        names = self._specs if names is None else names
+        self._prewarm_queue = [name for name in names if name not in self._classes]
+        if self._prewarm_queue:
+            self._prewarm_timer.start(delay)
+
+    def stop_prewarm(self):
+        self._prewarm_timer.stop()
+        self._prewarm_queue.clear()
+
+    def _prewarm_next(self):
+        while self._prewarm_queue:
+            name = self._prewarm_queue.pop(0)
+            if name in self._classes:
+                continue
+            try:
+                self.resolve(name)
+            except Exception as e:
+                print(f"Failed to prewarm view {name}:", e)
+            break
+
+        if self._prewarm_queue:
+            # Zero-delay timers fire once pending input and paint events are handled
+            self._prewarm_timer.start(0)
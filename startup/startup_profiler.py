@@ -0,0 +1,194 @@
+"""
+Cold-start profile of Scratch Board.
+
+Starts the app in a fresh interpreter under `-X importtime` (offscreen unless
+QT_QPA_PLATFORM says otherwise), runs the same phases as main() up to the
+main window's first paint and reports where the time went: wall-clock time
+per phase, the StartupRunner step timings and the slowest imports. The
+single-instance lock and NukeService are skipped. Run from the repo root:
+
+    python -m startup.startup_profiler [--report startup_report.txt] [--json profile.json] [--top 25]
+
+tests/test_startup_budget.py runs it against STARTUP_BUDGET_MS.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Cold start to first paint, offscreen (ms); SCRATCHBOARD_STARTUP_BUDGET_MS overrides it
+STARTUP_BUDGET_MS = 3000
+
+ROOT = Path(__file__).resolve().parent.parent
+CHILD_FLAG = "--child"
+RESULT_PREFIX = "STARTUP_PROFILE "
+
+
+def startup_budget_ms() -> float:
+    return float(os.getenv("SCRATCHBOARD_STARTUP_BUDGET_MS", STARTUP_BUDGET_MS))
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """Rows of `-X importtime` output as {"module", "self_ms", "cumulative_ms", "depth"}."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append({
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            })
+        except ValueError:
+            continue  # header line
+    return rows
+
+
+def profile_startup(env=None, timeout=120) -> dict:
+    """
+    Profile one cold start in a child process.
+    :param env: Extra environment variables for the child (e.g. LOCALAPPDATA for a scratch database)
+    :return: {"phases", "steps", "first_paint_ms", "process_ms", "imports", "modules"}; times in ms
+    """
+    child_env = {**os.environ, "QT_QPA_PLATFORM": os.getenv("QT_QPA_PLATFORM", "offscreen"), **(env or {})}
+    child_env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(ROOT), child_env.get("PYTHONPATH"))))
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "startup.startup_profiler", CHILD_FLAG],
+        cwd=ROOT, env=child_env, capture_output=True, text=True, timeout=timeout,
+    )
+    process_ms = (time.perf_counter() - started) * 1000
+
+    result = next((line[len(RESULT_PREFIX):] for line in proc.stdout.splitlines() if line.startswith(RESULT_PREFIX)), None)
+    if proc.returncode != 0 or result is None:
+        errors = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"Startup profile failed (exit code {proc.returncode}):\n{errors}")
+
+    profile = json.loads(result)
+    profile["process_ms"] = process_ms
+    profile["imports"] = parse_importtime(proc.stderr)
+    return profile
+
+
+def format_report(profile: dict, top: int = 25) -> str:
+    """Plain-text report of a profile_startup() result."""
+    lines = [
+        f"Cold start to first paint: {profile['first_paint_ms']:.0f} ms "
+        f"(budget {startup_budget_ms():.0f} ms, whole process {profile['process_ms']:.0f} ms)",
+        "",
+        "Phases (wall clock, in order):",
+    ]
+    lines += [f"  {name:<16} {ms:8.1f} ms" for name, ms in profile["phases"].items()]
+
+    lines += ["", "Startup steps (background steps overlap the others):"]
+    lines += [f"  {name:<16} {ms:8.1f} ms" for name, ms in profile["steps"].items()]
+
+    imports = profile["imports"]
+    lines += ["", f"Slowest imports, cumulative ({len(imports)} modules imported):"]
+    for row in sorted(imports, key=lambda r: r["cumulative_ms"], reverse=True)[:top]:
+        lines.append(f"  {row['cumulative_ms']:8.1f} ms  {row['module']}")
+
+    lines += ["", "Slowest imports, self:"]
+    for row in sorted(imports, key=lambda r: r["self_ms"], reverse=True)[:top]:
+        lines.append(f"  {row['self_ms']:8.1f} ms  {row['module']}")
+    return "\n".join(lines) + "\n"
+
+
+def _run_child():
+    """The profiled start: main()'s phases up to the first paint of the main window, then quit."""
+    started = last = time.perf_counter()
+    phases = {}
+
+    def mark(name):
+        nonlocal last
+        now = time.perf_counter()
+        phases[name] = (now - last) * 1000
+        last = now
+
+    import main
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+    from startup.startup_runner import StartupRunner
+    from utils.resource_path import resource_path
+    from views.splash.splash_screen import SplashScreen
+    mark("imports")
+
+    app = QApplication(sys.argv[:1])
+    mark("qapplication")
+
+    main.load_styles(app)
+    mark("styles")
+
+    splash = SplashScreen(resource_path("resources/icons/astronaut_splash.png"))
+    mark("splash")
+
+    runner = StartupRunner(main.startup_steps(), parent=app)
+    outcome = {}
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and "first_paint_ms" not in outcome:
+                outcome["first_paint_ms"] = (time.perf_counter() - started) * 1000
+                mark("first_paint")
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    first_paint = FirstPaint()
+
+    def on_started(results):
+        mark("startup_steps")
+        window = results["window"]
+        window.installEventFilter(first_paint)
+        window.show()
+        splash.close()
+
+    def on_failed(message, error):
+        outcome["error"] = f"{message} {error}"
+        app.quit()
+
+    runner.finished.connect(on_started)
+    runner.failed.connect(on_failed)
+    runner.start()
+    app.exec()
+
+    if "error" in outcome:
+        print(outcome["error"], file=sys.stderr)
+        sys.exit(1)
+
+    print(RESULT_PREFIX + json.dumps({
+        "first_paint_ms": outcome["first_paint_ms"],
+        "phases": phases,
+        "steps": {name: seconds * 1000 for name, seconds in runner.timings.items()},
+        "modules": sorted(sys.modules),
+    }), flush=True)
+
+
+def main():
+    if CHILD_FLAG in sys.argv:
+        _run_child()
+        return
+
+    parser = argparse.ArgumentParser(description="Profile Scratch Board's cold start.")
+    parser.add_argument("--report", help="Also write the text report to this file")
+    parser.add_argument("--json", help="Write the raw profile as JSON to this file")
+    parser.add_argument("--top", type=int, default=25, help="Imports listed per table")
+    args = parser.parse_args()
+
+    profile = profile_startup()
+    report = format_report(profile, args.top)
+    print(report)
+    if args.report:
+        Path(args.report).write_text(report, encoding="utf-8")
+    if args.json:
+        Path(args.json).write_text(json.dumps(profile, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,139 @@
 import time
 
-def run_startup(progress_callback):
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+
+class StartupStep:
+    """
+    One unit of startup work.
+
+    fn receives the results of the steps finished so far (by name) and returns
+    this step's result. Background steps run on a worker thread and must not
+    create or touch widgets; GUI steps run on the GUI thread one per event loop
+    turn so the splash screen repaints in between. A step starts as soon as
+    everything in `depends` has finished, so independent steps overlap.
+    """
+    __slots__ = ("name", "message", "fn", "depends", "background", "optional", "weight")
+
+    def __init__(self, name, message, fn, depends=(), background=False, optional=False, weight=1):
+        self.name = name
+        self.message = message
+        self.fn = fn
+        self.depends = tuple(depends)
+        self.background = background
+        self.optional = optional  # a failure is printed and startup continues with None
+        self.weight = weight      # share of the progress bar
+
+
+class StartupJob(QRunnable):
+    """Run a background startup step off the GUI thread."""
+    def __init__(self, runner, step, results):
+        super().__init__()
+        self.runner = runner
+        self.step = step
+        self.results = results
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            value, error = self.step.fn(self.results), ""
+        except Exception as e:
+            value, error = None, str(e)
+        self.runner._step_done.emit(self.step.name, value, error, time.perf_counter() - started)
+
+
+class StartupRunner(QObject):
     """
-    Simulates (since it's a one-file bundled exe with PyInstaller) a startup sequence with progress updates.
+    Runs the startup steps in dependency order and reports real progress.
+
+    Progress is the finished share of the steps' weights, emitted with the
+    message of the step being started. `finished` fires with every step's
+    result once all of them are done; `failed` stops startup when a required
+    step raises. Per-step wall times are kept in `timings` (seconds).
     """
+    progress = Signal(int, str)
+    finished = Signal(object)   # {step name: result}
+    failed = Signal(str, str)   # step message, error
+    _step_done = Signal(str, object, str, float)
+
+    def __init__(self, steps, parent=None):
+        super().__init__(parent)
+        self.steps = {step.name: step for step in steps}
+        self.results = {}
+        self.timings = {}
+        self._started: set[str] = set()
+        self._gui_queue = []
+        self._done_weight = 0
+        self._total_weight = sum(step.weight for step in steps) or 1
+        self._stopped = False
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(4, QThreadPool.globalInstance().maxThreadCount())))
+
+        self._step_done.connect(self._finish_step)
+
+    def start(self):
+        """Begin startup; the event loop has to be running (or be started) for it to advance."""
+        self.progress.emit(0, "Starting...")
+        self._schedule()
 
-    # Initial progress message at 0%
-    progress_callback(0, "Starting...")
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until background steps have run (their results still arrive through the event loop)."""
+        return self._pool.waitForDone(msecs)
 
-    # Define sequence of startup steps
-    steps = [
-        (20, "Initializing...", 1),
-        (45, "Loading models...", 1),
-        (71, "Loading controllers...", 1),
-        (90, "Loading resources...", 1),
-        (100, "Enjoy!", 1),
-    ]
+    def _percent(self):
+        return int(100 * self._done_weight / self._total_weight)
 
-    last_progress = 0 # Keep track of last progress percent
+    def _schedule(self):
+        for step in self.steps.values():
+            if step.name in self._started or not all(dep in self.results for dep in step.depends):
+                continue
+            self._started.add(step.name)
+            if step.background:
+                self.progress.emit(self._percent(), step.message)
+                self._pool.start(StartupJob(self, step, self.results))
+            else:
+                self._gui_queue.append(step)
+                if len(self._gui_queue) == 1:
+                    QTimer.singleShot(0, self._run_gui_step)
 
-    # Iterate over each startup step
-    for target, message, duration in steps:
+    def _run_gui_step(self):
+        if self._stopped or not self._gui_queue:
+            return
+        step = self._gui_queue[0]
+        self.progress.emit(self._percent(), step.message)
 
-        # Calculate  how many increments to divide the duration into
-        increments = max(1, target - last_progress)
+        started = time.perf_counter()
+        try:
+            value, error = step.fn(self.results), ""
+        except Exception as e:
+            value, error = None, str(e)
 
-        # Gradually increase progress from last_progress + 1
-        for p in range(last_progress + 1, target + 1):
+        self._gui_queue.pop(0)
+        self._finish_step(step.name, value, error, time.perf_counter() - started)
+        if self._gui_queue and not self._stopped:
+            QTimer.singleShot(0, self._run_gui_step)
 
-            # Call the progress callback with current progress and it's message
-            progress_callback(p, message)
+    def _finish_step(self, name, value, error, seconds):
+        if self._stopped:
+            return
+        step = self.steps[name]
+        self.timings[name] = seconds
 
-            # Sleep for a fraction of the step duration for even spread
-            time.sleep(duration / increments)
+        if error:
+            print(f"Startup step '{name}' failed:", error)
+            if not step.optional:
+                self._stopped = True
+                self.failed.emit(step.message, error)
+                return
+            value = None
 
-        # Update last_progress for the next step
-        last_progress = target
+        self.results[name] = value
+        self._done_weight += step.weight
 
+        if len(self.results) == len(self.steps):
+            self.progress.emit(100, "Enjoy!")
+            self.finished.emit(self.results)
+        else:
+            self.progress.emit(self._percent(), "")
+            self._schedule()
@@ -0,0 +1,106 @@
+"""
+Benchmark for ModemLogParser on a synthetic DOCSIS event log.
+
+Not collected by pytest. Run from the repo root:
+
+    python -m tests.bench_log_parser [line_count]
+"""
+import random
+import re
+import sys
+import time
+
+from helpers.parsers.log_parser_helper import ModemEvent, ModemLogParser
+
+SAMPLE_MESSAGES = [
+    "T3 time-out;CM-MAC=a0:b1:c2:d3:e4:f5;CMTS-MAC=00:01:5c:aa:bb:cc;CM-QOS=1.1;CM-VER=3.1;",
+    "No Ranging Response received - T3 time-out;CM-MAC=a0:b1:c2:d3:e4:f5;",
+    "Started Unicast Maintenance Ranging - No Response received - T3 time-out",
+    "T4 timeout - CM-MAC=a0:b1:c2:d3:e4:f5;CMTS-MAC=00:01:5c:aa:bb:cc;",
+    "SYNC Timing Synchronization failure - Loss of Sync;CM-MAC=a0:b1:c2:d3:e4:f5;",
+    "MDD Timeout;CM-MAC=a0:b1:c2:d3:e4:f5;CMTS-MAC=00:01:5c:aa:bb:cc;",
+    "OFDM Profile failure - Loss of FEC lock on DS OFDM channel 33",
+    "DHCP RENEW WARNING - Field invalid in response v4 option",
+    "DHCP FAILED - Discover sent, no offer received",
+    "TOD Failure - No Response received;CM-MAC=a0:b1:c2:d3:e4:f5;",
+    "Cold Start - Power Reset detected",
+    "WiFi interface wl0 channel changed to 36",
+    "Honoring MDD; IP provisioning mode = IPv6",
+    "US profile assignment change. US Chan ID: 2; Previous Profile: 12; New Profile: 13.",
+    "Downstream channel 24 partial service (UPSTREAM/HIGH)",
+]
+
+
+def synthetic_log(line_count: int, seed: int = 42) -> str:
+    """Build a log with realistic timestamps and a mix of matching and unmatched lines."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(line_count):
+        minute, second = divmod(i % 3600, 60)
+        stamp = f"2025-11-20 {i // 3600 % 24:02d}:{minute:02d}:{second:02d}"
+        if i % 7 == 0:
+            stamp = f"11/20/2025 {i // 3600 % 24}:{minute}:{second}"
+        lines.append(f"[{stamp}] {rng.choice(SAMPLE_MESSAGES)}")
+    return "\n".join(lines)
+
+
+def legacy_parse(parser, raw_text):
+    """The per-rule re.search pipeline the compiled engine replaced, kept for comparison."""
+    timestamp_patterns = [
+        r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]",
+        r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})",
+        r"(\d+/\d+/\d+ \d+:\d+:\d+)",
+    ]
+    events = []
+    for line in raw_text.splitlines():
+        clean = line.strip()
+        if not clean:
+            continue
+
+        timestamp = "Unknown"
+        for pattern in timestamp_patterns:
+            match = re.search(pattern, clean)
+            if match:
+                timestamp = match.group(1)
+                break
+
+        category, severity, explanation, steps = "General", "Info", "No detailed rule matched.", []
+        for pattern, cat, sev, expl, rule_steps in parser.RULES:
+            if re.search(pattern, clean, re.IGNORECASE):
+                category, severity, explanation, steps = cat, sev, expl, rule_steps
+                break
+        else:
+            tag = parser.CATEGORY_SEVERITY_PATTERN.search(clean)
+            if tag:
+                category, severity = tag.group("category").strip(), tag.group("severity").strip()
+            else:
+                for kw, (cat, sev) in parser.GENERIC_KEYWORDS.items():
+                    if kw.lower() in clean.lower():
+                        category, severity = cat, sev
+                        break
+
+        events.append(ModemEvent(timestamp, clean, category, severity, explanation, steps))
+    return events
+
+
+def main(line_count: int = 1_000_000):
+    raw = synthetic_log(line_count)
+    parser = ModemLogParser()
+    print(f"{line_count:,} lines, {len(raw) / 1024 / 1024:.1f} MB")
+
+    start = time.perf_counter()
+    legacy = legacy_parse(parser, raw)
+    legacy_time = time.perf_counter() - start
+    print(f"legacy per-rule search: {legacy_time:.2f}s ({line_count / legacy_time:,.0f} lines/s)")
+
+    start = time.perf_counter()
+    events = parser.parse(raw)
+    compiled_time = time.perf_counter() - start
+    print(f"compiled rule engine:   {compiled_time:.2f}s ({line_count / compiled_time:,.0f} lines/s)")
+
+    assert [ev.category for ev in events] == [ev.category for ev in legacy], "engines disagree"
+    print(f"speedup: {legacy_time / compiled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+# Set before anything creates a QApplication
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The QApplication shared by every test that needs one."""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+@pytest.fixture
+def write_image():
+    """Function writing a solid-color PNG of the given size."""
+    from PySide6.QtGui import QColor, QImage
+
+    def write(path, width, height, color="red"):
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        image.fill(QColor(color))
+        assert image.save(str(path), "PNG")
+    return write
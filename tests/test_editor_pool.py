@@ -0,0 +1,67 @@
+from PySide6.QtWidgets import QDialog
+
+from managers.editor_pool_manager import EditorPoolManager
+
+
+class FakeEditor:
+    DialogCode = QDialog.DialogCode
+
+    def __init__(self, updated, result=QDialog.DialogCode.Rejected, pristine=True):
+        self.updated = updated
+        self._result = result
+        self._pristine = pristine
+        self.deleted = False
+
+    def result(self):
+        return self._result
+
+    def is_pristine(self):
+        return self._pristine
+
+    def deleteLater(self):
+        self.deleted = True
+
+def test_editors_are_reused_until_the_row_changes():
+    """Test that a closed, unchanged editor is handed back only while the note's version matches."""
+    pool = EditorPoolManager(max_items=2)
+    editor = FakeEditor("v1")
+
+    assert pool.take("a", "v1") is None
+    pool.release("a", editor)
+    assert pool.take("a", "v1") is editor and not editor.deleted
+
+    pool.release("a", editor)
+    assert pool.take("a", "v2") is None and editor.deleted
+    assert (pool.hits, pool.misses) == (1, 2)
+
+def test_saved_dirty_and_evicted_editors_are_dropped():
+    """Test that saved or unsaved-edit editors aren't kept and the pool stays bounded."""
+    pool = EditorPoolManager(max_items=2)
+    saved = FakeEditor("v1", result=QDialog.DialogCode.Accepted)
+    dirty = FakeEditor("v1", pristine=False)
+    pool.release("a", saved)
+    pool.release("b", dirty)
+    assert saved.deleted and dirty.deleted and len(pool) == 0
+
+    editors = [FakeEditor("v1") for _ in range(3)]
+    for note_id, editor in zip("xyz", editors):
+        pool.release(note_id, editor)
+    assert len(pool) == 2 and editors[0].deleted
+    assert pool.take("z", "v1") is editors[2]
+
+def test_pooled_editor_is_dropped_after_an_edit_outside_the_grid(tmp_path):
+    """Test that an edit made without refreshing the listing (like a sticky note save) invalidates the editor."""
+    from models.note_model import NoteModel
+
+    model = NoteModel(str(tmp_path / "notes.db"), build_index=False)
+    note_id = model.add_note("Sticky Notes", "Sticky", "before")
+    listing_updated = model.get_note_updated(note_id)
+
+    pool = EditorPoolManager()
+    editor = FakeEditor(listing_updated)
+    pool.release(note_id, editor)
+
+    model.edit_note(note_id, content="after")  # what ScratchNote.save_to_db does
+    assert model.get_note_updated(note_id) != listing_updated
+    assert pool.take(note_id, model.get_note_updated(note_id)) is None and editor.deleted
+    assert model.get_note_updated("missing") is None
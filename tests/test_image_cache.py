@@ -0,0 +1,94 @@
+from PySide6.QtCore import QUrl
+from PySide6.QtGui import QTextDocument
+
+from services.image_cache_service import ImageCacheService
+
+
+def test_cache_evicts_least_recently_used_by_byte_budget(app, tmp_path, write_image):
+    """Test that decoded images are dropped oldest-first once their total size passes the budget."""
+    paths = []
+    for name in ("a", "b", "c"):
+        paths.append(str(tmp_path / f"{name}.png"))
+        write_image(paths[-1], 100, 100)
+    cost = 100 * 100 * 4
+    cache = ImageCacheService(budget_bytes=2 * cost)
+
+    first = cache.load(paths[0])
+    cache.load(paths[1])
+    assert cache.used_bytes == 2 * cost
+    assert cache.get(paths[0]) is first  # a is now the most recently used
+
+    cache.load(paths[2])
+    assert cache.used_bytes == 2 * cost
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[0]) is first and cache.get(paths[2]) is not None
+
+    cache.set_budget(cost)
+    assert cache.used_bytes == cost
+    assert cache.get(paths[0]) is None and cache.get(paths[2]) is not None
+
+    # An image larger than the whole budget is returned but never cached
+    big = str(tmp_path / "big.png")
+    write_image(big, 200, 200)
+    assert cache.load(big).width() == 200
+    assert cache.get(big) is None and cache.used_bytes == cost
+
+def test_browser_rerenders_when_its_images_arrive(app, tmp_path, write_image, monkeypatch):
+    """Test that image_ready re-renders a browser that asked for an image before it was decoded."""
+    from helpers.ui_helpers.cached_image_browser import CachedImageBrowser
+
+    source = tmp_path / "photo.png"
+    write_image(source, 64, 48)
+    cache = ImageCacheService(budget_bytes=1024 * 1024)
+    monkeypatch.setattr(ImageCacheService, "_instance", cache)
+    ready = []
+    cache.image_ready.connect(ready.append)
+
+    url = QUrl.fromLocalFile(str(source))
+    browser = CachedImageBrowser()
+    browser.setHtml(f'<p>note</p><img src="{url.toString()}" />')
+    browser.show()  # images are requested when the document is laid out for display
+    key = cache.normalize(str(source))
+    assert browser._waiting_images == {key}
+
+    cache._pool.waitForDone()
+    app.processEvents()
+    assert ready == [key]
+    assert not browser._waiting_images
+    image = browser.document().resource(QTextDocument.ResourceType.ImageResource, url)
+    assert image is not None and image.size().toTuple() == (64, 48)
+    browser.close()
+
+def test_popup_reports_missing_and_undecodable_images(app, tmp_path, write_image, monkeypatch):
+    """Test that the image popup replaces "Loading..." with an error when the file is missing or can't be decoded."""
+    from PySide6.QtWidgets import QDialog, QLabel
+    from helpers.ui_helpers.image_pop import ImagePopup
+
+    cache = ImageCacheService(budget_bytes=1024 * 1024)
+    monkeypatch.setattr(ImageCacheService, "_instance", cache)
+    monkeypatch.setattr(QDialog, "exec", lambda self: None)  # leave the popup open without blocking
+
+    def popup_text(path):
+        ImagePopup.show(None, str(path))
+        dialog = [w for w in app.topLevelWidgets() if isinstance(w, QDialog) and w.isVisible()][-1]
+        return dialog, dialog.findChild(QLabel)
+
+    dialog, label = popup_text(tmp_path / "missing.png")
+    assert label.text().startswith("Image not found")
+    dialog.close()
+
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+    dialog, label = popup_text(broken)
+    assert label.text() == "Loading..."
+    cache._pool.waitForDone()
+    app.processEvents()
+    assert label.text().startswith("Could not load image")
+    dialog.close()
+
+    write_image(broken, 20, 10)  # fixed on disk: failures aren't remembered
+    dialog, label = popup_text(broken)
+    cache._pool.waitForDone()
+    app.processEvents()
+    assert label.original_pixmap is not None and label.original_pixmap.width() == 20
+    dialog.close()
@@ -0,0 +1,132 @@
+import sqlite3
+
+import pytest
+
+from services.image_store_service import ImageStoreService
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Image store backed by an in-memory database and a temp folder."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE images (hash TEXT NOT NULL, ext TEXT NOT NULL, size INTEGER NOT NULL, added TEXT NOT NULL, "
+        "PRIMARY KEY (hash, ext))"
+    )
+    conn.execute("CREATE TABLE note_images (note_id TEXT NOT NULL, image_hash TEXT NOT NULL, PRIMARY KEY (note_id, image_hash))")
+    return ImageStoreService(conn, root=tmp_path / "images")
+
+def test_duplicate_images_are_stored_once(store, tmp_path):
+    """Test that identical bytes and files resolve to a single sharded blob."""
+    src = tmp_path / "shot.PNG"
+    src.write_bytes(b"same screenshot")
+
+    first = store.put_bytes(b"same screenshot", ".png")
+    second = store.put_file(src)
+
+    assert first == second
+    assert first.parent.name == first.stem[:2]
+    assert len(list(store.root.rglob("*.png"))) == 1
+
+def test_orphaned_images_query(store):
+    """Test that only unreferenced blobs are reported as orphans."""
+    kept = store.put_bytes(b"kept")
+    orphan = store.put_bytes(b"orphan")
+    kept_hash, _ = store.parse_ref(kept.as_posix())
+    store.conn.execute("INSERT INTO note_images VALUES ('note-1', ?)", (kept_hash,))
+
+    assert store.orphaned_images() == [store.parse_ref(orphan.as_posix())]
+
+def test_localize_refs_rewrites_foreign_store_paths(store):
+    """Test that store references exported from another machine point at the local store."""
+    blob = store.put_bytes(b"portable")
+    shard_and_name = "/".join(blob.as_posix().split("/")[-2:])
+    html = f'<p><img src="C:/Users/other/ScratchBoardData/images/{shard_and_name}"></p><img src="legacy.png">'
+
+    localized = store.localize_refs(html)
+
+    assert f'src="{blob.as_posix()}"' in localized
+    assert 'src="legacy.png"' in localized
+
+def test_collect_garbage_keeps_referenced_and_recent_blobs(store):
+    """Test that GC only removes unreferenced blobs older than the grace period."""
+    kept = store.put_bytes(b"kept")
+    old_orphan = store.put_bytes(b"old orphan")
+    new_orphan = store.put_bytes(b"new orphan")
+    store.sync_note_refs("note-1", f'<p><img src="{kept.as_posix()}"></p>')
+
+    old_hash, _ = store.parse_ref(old_orphan.as_posix())
+    store.conn.execute("UPDATE images SET added='2000-01-01T00:00:00' WHERE hash != ?", (
+        store.parse_ref(new_orphan.as_posix())[0],
+    ))
+
+    assert store.collect_garbage(batch_size=1) == 1
+    assert kept.exists() and new_orphan.exists()
+    assert not old_orphan.exists()
+    assert store.conn.execute("SELECT COUNT(*) FROM images WHERE hash=?", (old_hash,)).fetchone()[0] == 0
+
+def test_extract_data_uris_moves_inline_images_into_store(store):
+    """Test that base64 images in note HTML are replaced by store references."""
+    html = '<p>a</p><img src="data:image/png;base64,aW5saW5l"><p>![x](data:image/jpeg;base64,aW5saW5l)</p>'
+
+    extracted = store.extract_data_uris(html)
+
+    assert "base64" not in extracted
+    png, jpg = store.put_bytes(b"inline", ".png"), store.put_bytes(b"inline", ".jpg")
+    assert f'src="{png.as_posix()}"' in extracted
+    assert f"({jpg.as_posix()})" in extracted
+    assert store.image_refs(extracted) == {store.parse_ref(png.as_posix())[0]}
+
+def test_same_bytes_under_two_extensions_are_both_collected(store):
+    """Test that each extension of a blob gets its own row, so GC removes every file."""
+    png = store.put_bytes(b"same bytes", ".png")
+    jpg = store.put_bytes(b"same bytes", ".jpg")
+    assert png != jpg and png.stem == jpg.stem
+    assert len(store.orphaned_images()) == 2
+
+    store.conn.execute("UPDATE images SET added='2000-01-01T00:00:00'")
+    assert store.collect_garbage() == 2
+    assert not png.exists() and not jpg.exists()
+
+def test_hash_keyed_images_table_is_migrated(tmp_path, monkeypatch):
+    """Test that an images table keyed on hash alone is re-keyed and its untracked blobs recorded."""
+    import hashlib
+    import services.image_store_service as image_store_service
+    from models.note_model import NoteModel
+
+    monkeypatch.setattr(image_store_service, "BASE_DATA_DIR", tmp_path)
+    db_path = str(tmp_path / "notes.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE images (hash TEXT PRIMARY KEY, ext TEXT NOT NULL, size INTEGER NOT NULL, added TEXT NOT NULL)")
+    old = ImageStoreService(conn, root=tmp_path / "images")
+    digest = hashlib.sha256(b"same bytes").hexdigest()
+    for ext in (".png", ".jpg"):
+        old.path_for(digest, ext).parent.mkdir(exist_ok=True)
+        old.path_for(digest, ext).write_bytes(b"same bytes")
+    conn.execute("INSERT INTO images VALUES (?, '.png', 10, '2000-01-01T00:00:00')", (digest,))  # .jpg has no row
+    conn.execute("PRAGMA user_version = 4")
+    conn.commit()
+    conn.close()
+
+    model = NoteModel(db_path, build_index=False)
+    rows = model.conn.execute("SELECT hash, ext FROM images ORDER BY ext").fetchall()
+    assert [tuple(row) for row in rows] == [(digest, ".jpg"), (digest, ".png")]
+    model.image_store.put_bytes(b"same bytes", ".gif")
+    assert model.conn.execute("SELECT COUNT(*) FROM images").fetchone()[0] == 3
+
+def test_gc_keeps_images_of_open_editors_and_saves_restore_lost_rows(store):
+    """Test that blobs referenced by an unsaved editor survive GC past the grace period, and a save re-records a lost row."""
+    draft = store.put_bytes(b"pasted into an open editor")
+    digest, _ = store.parse_ref(draft.as_posix())
+    html = f'<p><img src="{draft.as_posix()}"></p>'
+    store.conn.execute("UPDATE images SET added='2000-01-01T00:00:00'")
+
+    store.track_open("editor", lambda: html)
+    assert store.open_refs() == {digest}
+    assert store.collect_garbage(keep=store.open_refs()) == 0 and draft.exists()
+
+    store.untrack_open("editor")
+    store.conn.execute("DELETE FROM images")  # e.g. a pass that dropped the row but couldn't unlink the file
+    store.sync_note_refs("note-1", html)
+    assert store.conn.execute("SELECT COUNT(*) FROM images WHERE hash=?", (digest,)).fetchone()[0] == 1
+    assert store.collect_garbage(grace_seconds=0) == 0 and draft.exists()
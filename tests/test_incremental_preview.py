@@ -0,0 +1,46 @@
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QTextEdit
+
+from helpers.ui_helpers.cached_image_browser import CachedImageBrowser
+from helpers.ui_helpers.incremental_preview import IncrementalPreview, adaptive_delay, PREVIEW_MIN_DELAY, \
+    PREVIEW_MAX_DELAY
+from managers.editor_manager import EditorManager
+
+
+def test_edits_are_patched_into_the_preview(app):
+    """Test that small edits patch only their blocks and the preview matches a full render."""
+    editor = QTextEdit()
+    editor.setHtml("".join(f"<p>Paragraph {i} with <b>bold</b> text</p>" for i in range(200)))
+    browser = CachedImageBrowser()
+    preview = IncrementalPreview(editor.document(), browser, EditorManager.prepare_preview,
+                                 EditorManager.prepare_preview_fragment)
+
+    assert preview.update() == "full"
+    assert preview.update() is None
+
+    cursor = QTextCursor(editor.document().findBlockByNumber(100))
+    cursor.insertText("typed ")
+    cursor.insertText("\nsplit ")
+    assert preview.update() == "patch"
+
+    # Backspace at the start of a block merges it into the previous one
+    cursor = QTextCursor(editor.document().findBlockByNumber(50))
+    cursor.deletePreviousChar()
+    assert preview.update() == "patch"
+
+    assert browser.toPlainText() == editor.toPlainText()
+    patched = browser.document().findBlockByNumber(101).begin().fragment().charFormat()
+    first = browser.document().findBlockByNumber(0).begin().fragment().charFormat()
+    assert patched.foreground() == first.foreground()
+
+    # Replacing most of the note re-renders it
+    cursor.select(QTextCursor.SelectionType.Document)
+    cursor.insertText("short")
+    assert preview.update() == "full" and browser.toPlainText() == "short"
+    assert (preview.patches, preview.full_renders) == (2, 2)
+
+def test_debounce_follows_render_time():
+    """Test that the preview delay scales with render time within its bounds."""
+    assert adaptive_delay(0) == PREVIEW_MIN_DELAY
+    assert adaptive_delay(100) == 300
+    assert adaptive_delay(10_000) == PREVIEW_MAX_DELAY
@@ -0,0 +1,319 @@
+from helpers.parsers.log_parser_helper import ModemLogParser
+
+
+def test_rule_order_wins_over_position_in_line():
+    """Test that the merged pattern still picks the earliest rule, not the leftmost match."""
+    parser = ModemLogParser()
+
+    event = parser.parse_line("[2025-11-20 08:15:23] WiFi reset after T3 time-out")
+
+    assert event.category == "Upstream / Noise"
+    assert event.timestamp == "2025-11-20 08:15:23"
+
+def test_unmatched_line_falls_back_to_general():
+    """Test that lines no rule matches keep the default classification."""
+    events = ModemLogParser().parse("\n  \n11/20/2025 8:15:23 nothing to see here\n")
+
+    assert len(events) == 1
+    assert (events[0].timestamp, events[0].category, events[0].severity) == ("2025-11-20 08:15:23", "General", "Info")
+
+def test_embedded_tags_and_keywords_back_up_the_rules():
+    """Test the classification order: rules, then (CATEGORY/SEVERITY) tags, then fallback keywords."""
+    parser = ModemLogParser()
+
+    tagged = parser.parse_line("Downstream channel 24 partial service (UPSTREAM/HIGH)")
+    keyword = parser.parse_line("LAN port 2 link up")
+    rule = parser.parse_line("T3 time-out on channel 3 (LAN/LOW)")
+
+    assert (tagged.category, tagged.severity) == ("UPSTREAM", "HIGH")
+    assert (keyword.category, keyword.severity) == ("LAN/WiFi", "Low")
+    assert rule.category == "Upstream / Noise"
+
+def test_keyword_automaton_agrees_with_linear_scan():
+    """Test that large keyword sets (automaton) pick the same first keyword as a plain scan."""
+    import random
+    from helpers.parsers.keyword_matcher import AUTOMATON_MIN_KEYWORDS, KeywordMatcher
+
+    rng = random.Random(7)
+    keywords = ["".join(rng.choice("abcd") for _ in range(rng.randint(1, 4))) for _ in range(AUTOMATON_MIN_KEYWORDS * 2)]
+    matcher = KeywordMatcher(keywords)
+    assert matcher._automaton is not None
+
+    for _ in range(300):
+        text = "".join(rng.choice("abcde") for _ in range(rng.randint(0, 12)))
+        expected = next((i for i, kw in enumerate(keywords) if kw in text), -1)
+        assert matcher.first(text) == expected
+
+def test_parse_stream_reads_files_lazily_and_summary_accumulates(tmp_path):
+    """Test that streaming a file yields the same events as parse() and summaries add up per batch."""
+    raw = "[2025-11-20 08:15:23] T3 time-out\n\nDHCP Discover sent\n[2025-11-20 08:16:00] T4 timeout\n"
+    log = tmp_path / "modem.log"
+    log.write_text(raw, encoding="utf-8")
+    parser = ModemLogParser()
+
+    stream = parser.parse_stream(log)
+    first = [next(stream)]
+    rest = list(stream)
+
+    summary = parser.summarize(first)
+    parser.summarize(rest, summary)
+
+    assert [ev.message for ev in first + rest] == [ev.message for ev in parser.parse(raw)]
+    assert summary == parser.summarize(parser.parse(raw))
+
+def test_batch_analysis_merges_files_chunks_and_zips(tmp_path):
+    """Test that split files, folders and ZIP members add up to the same counts as parsing them directly."""
+    import zipfile
+    from helpers.parsers.log_batch_helper import analyze_batch, split_file
+
+    raw = "\n".join(["[2025-11-20 08:15:23] T3 time-out", "DHCP Discover sent", "nothing"] * 200)
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "a.log").write_text(raw, encoding="utf-8")
+    with zipfile.ZipFile(tmp_path / "logs" / "dump.zip", "w") as zf:
+        zf.writestr("b.txt", raw)
+
+    ranges = split_file(tmp_path / "logs" / "a.log", chunk_bytes=1000)
+    assert len(ranges) > 1 and ranges[-1][1] == len(raw.encode())
+
+    report = analyze_batch([tmp_path / "logs"], max_workers=2, chunk_bytes=1000)
+
+    expected = ModemLogParser().summarize(ModemLogParser().parse(raw))
+    assert report.total_events == 1200
+    assert {name.replace("\\", "/").split("/")[-1] for name in report.files} == {"a.log", "b.txt"}
+    for summary in report.files.values():
+        assert summary == expected
+
+def test_batch_severity_follows_input_order(tmp_path, monkeypatch):
+    """Test that a category's severity comes from its first line in input order, however the workers finish."""
+    from helpers.parsers import log_batch_helper
+    from helpers.parsers.log_batch_helper import analyze_batch
+
+    # Workers finishing the last unit first (futures are keyed in submission order)
+    monkeypatch.setattr(log_batch_helper, "as_completed", lambda futures: list(futures)[::-1])
+    raw = "\n".join(["modem note (CUSTOM/LOW)"] * 50 + ["modem note (CUSTOM/HIGH)"] * 400)
+    (tmp_path / "tags.log").write_text(raw, encoding="utf-8")
+
+    report = analyze_batch([tmp_path / "tags.log"], max_workers=4, chunk_bytes=500)
+
+    assert report.summary == ModemLogParser().summarize(ModemLogParser().parse(raw))
+    assert report.summary["CUSTOM"] == {"count": 450, "severity": "LOW"}
+
+def test_event_batch_matches_per_event_results():
+    """Test that the columnar batch yields the same events, summary and filters as per-event parsing."""
+    raw = "T4 timeout\nDHCP Discover sent\nnothing\n[2025-11-20 08:15:23] T4 timeout\n"
+    parser = ModemLogParser()
+
+    batch = parser.parse_batch(raw.splitlines())
+    events = parser.parse(raw)
+
+    assert [ev.to_dict() for ev in batch] == [ev.to_dict() for ev in events]
+    assert list(batch.summarize().items()) == list(parser.summarize(events).items())
+    assert batch.category_counts() == {"Upstream Failure": 2, "Provisioning / IP": 1, "General": 1}
+    assert batch.select(severities={"Critical"}) == [0, 3]
+    assert batch[0].steps is parser.rules[1][4]
+
+def test_timestamps_normalize_to_epoch_and_bin_per_minute():
+    """Test that both timestamp formats become the same epoch and histograms bucket by minute."""
+    from helpers.parsers.timestamp_helper import to_epoch
+
+    raw = "\n".join([
+        "[2025-11-20 08:15:23] T3 time-out",
+        "11/20/2025 8:15:59 T3 time-out",
+        "2025-11-20 08:16:01 T4 timeout",
+        "T4 timeout without a time",
+    ])
+    parser = ModemLogParser()
+    batch = parser.parse_batch(raw.splitlines())
+
+    minute = to_epoch(2025, 11, 20, 8, 15, 0)
+    assert batch.epochs[0] == minute + 23
+    assert to_epoch(1970, 1, 1, 0, 0, 0) == 0 and to_epoch(2024, 2, 29, 0, 0, 0) == 1709164800
+
+    expected = {minute: {"Upstream / Noise": 2}, minute + 60: {"Upstream Failure": 1}}
+    assert batch.histogram("minute") == expected
+    assert parser.histogram(parser.parse(raw), "minute") == expected
+    assert batch.histogram("hour", by="severity", severities={"Critical"}) == {minute - 15 * 60: {"Critical": 1}}
+
+def test_impossible_and_out_of_range_timestamps():
+    """Test that impossible dates get no timestamp and formatting never fails on odd epochs."""
+    from helpers.parsers.timestamp_helper import NO_TIMESTAMP, extract_epoch, format_epoch, to_epoch
+
+    assert extract_epoch("2025-02-31 08:15:23 T3 time-out") == NO_TIMESTAMP
+    assert extract_epoch("13/01/2025 8:15:23 T3 time-out") == NO_TIMESTAMP
+    assert extract_epoch("1969-12-31 23:59:59 T3 time-out") == NO_TIMESTAMP
+    assert to_epoch(2023, 2, 29, 0, 0, 0) == NO_TIMESTAMP and to_epoch(2000, 2, 29, 0, 0, 0) != NO_TIMESTAMP
+    assert to_epoch(2025, 4, 31, 0, 0, 0) == NO_TIMESTAMP and to_epoch(2025, 1, 1, 24, 0, 0) == NO_TIMESTAMP
+
+    assert format_epoch(to_epoch(9999, 12, 31, 23, 59, 59)) == "9999-12-31 23:59:59"
+    assert format_epoch(-86400) == "1969-12-31 00:00:00"
+    assert format_epoch(2 ** 62) == "Unknown"
+
+def test_table_model_filters_from_indexes_and_keeps_appending():
+    """Test that filters and search narrow the table rows and later chunks respect the active filters."""
+    from models.log_event_model import LogEventTableModel
+
+    parser = ModemLogParser()
+    model = LogEventTableModel(parser.table)
+    model.append_batch(parser.parse_batch(["T4 timeout on CMTS", "DHCP Discover sent", "T4 timeout"]))
+
+    model.set_filters(severities={"Critical"}, search="cmts")
+    assert model.rowCount() == 1
+    assert model.event_at(0).message == "T4 timeout on CMTS"
+
+    model.append_batch(parser.parse_batch(["T4 timeout CMTS again", "DHCP CMTS"]))
+    assert [model.event_at(r).message for r in range(model.rowCount())] == ["T4 timeout on CMTS", "T4 timeout CMTS again"]
+    assert model.index(1, 1).data() == "Upstream Failure"
+
+    model.set_filters()
+    assert model.rowCount() == model.total_count() == 5
+
+def test_parse_worker_sends_new_outcomes_with_each_chunk():
+    """Test that tag outcomes found on the worker reach the GUI's own RuleTable copy through batch_ready."""
+    from helpers.ui_helpers.log_parse_worker import LogParseWorker
+    from models.log_event_model import LogEventTableModel
+
+    parser = ModemLogParser()
+    model = LogEventTableModel(parser.table.copy())
+    raw = "T3 time-out\nmodem note (VENDOR/LOW)\nDHCP\nother note (CUSTOM/HIGH)\nmodem note (VENDOR/LOW)\n"
+    worker = LogParseWorker(parser, raw, batch_lines=2)
+    sizes = []
+
+    def on_batch(batch, summary, new_entries):
+        sizes.append(len(new_entries))
+        model.events.table.extend(new_entries)
+        model.append_batch(batch)
+    worker.batch_ready.connect(on_batch)
+    worker.run()
+
+    assert sizes == [1, 1, 0]
+    assert model.events.table is not parser.table
+    assert model.events.table.entries == parser.table.entries
+    assert model.events.table.categories == parser.table.categories
+    assert [model.index(row, 1).data() for row in range(model.rowCount())] == [
+        "Upstream / Noise", "VENDOR", "Provisioning / IP", "CUSTOM", "VENDOR"
+    ]
+
+def test_rule_packs_load_cache_and_reload(tmp_path):
+    """Test that packs add rules, get cached by hash, report bad rules and are reloaded on change."""
+    import json
+    import os
+    from helpers.parsers.rule_pack_helper import RulePackLoader
+
+    pack = tmp_path / "arris.json"
+    pack.write_text(json.dumps({"name": "Arris", "override": True, "rules": [
+        {"pattern": "Lost MDD Timeout", "category": "Arris MDD", "severity": "high"},
+        {"pattern": "(", "category": "Broken"},
+    ]}), encoding="utf-8")
+    loader = RulePackLoader(tmp_path)
+
+    parser = loader.parser()
+    assert parser.parse_line("Lost MDD Timeout").category == "Arris MDD"
+    assert loader.origins[0] == "Arris" and len(loader.errors) == 1
+    assert len(os.listdir(tmp_path / ".cache")) == 1
+    assert not loader.changed()
+
+    parser.hits.clear()
+    parser.parse_batch(["Lost MDD Timeout", "T3 time-out", "Lost MDD Timeout"])
+    stats = {stat["category"]: stat["hits"] for stat in parser.profile_rules(["T3 time-out"])}
+    assert stats["Arris MDD"] == 2 and stats["Upstream / Noise"] == 1
+
+    pack.write_text(json.dumps({"rules": [{"pattern": "Lost MDD", "category": "Vendor", "override": False}]}))
+    os.utime(pack, ns=(1, 1))
+    assert loader.changed()
+    parser = loader.parser()
+    assert parser.parse_line("Lost MDD Timeout").category == "Downstream / SNR"  # built-in rule wins now
+    assert parser.parse_line("Lost MDD").category == "Vendor"
+    assert len(os.listdir(tmp_path / ".cache")) == 1  # the old pack's cache entry is pruned
+
+def test_pack_rules_sharing_an_outcome_keep_their_own_ids(tmp_path):
+    """Test that pack rules with the same category, severity and default explanation classify and count separately."""
+    import json
+    from helpers.parsers.rule_pack_helper import RulePackLoader
+
+    for name, category, severity in (("Arris A", "Vendor", "high"), ("Arris B", "Vendor", "high"), ("Arris C", "Other", "low")):
+        (tmp_path / f"{name}.json").write_text(json.dumps({"name": name, "rules": [
+            {"pattern": f"{name} event", "category": category, "severity": severity},
+        ]}), encoding="utf-8")
+    loader = RulePackLoader(tmp_path)
+    parser = loader.parser()
+
+    events = parser.parse("Arris A event\nArris B event\nArris C event\nnothing here")
+    assert [(ev.category, ev.severity) for ev in events] == [
+        ("Vendor", "High"), ("Vendor", "High"), ("Other", "Low"), ("General", "Info")
+    ]
+
+    parser.hits.clear()
+    parser.parse_batch(["Arris B event", "Arris C event", "Arris C event"])
+    hits = {loader.origins[stat["index"]]: stat["hits"] for stat in parser.profile_rules([])}
+    assert hits["Arris A"] == 0 and hits["Arris B"] == 1 and hits["Arris C"] == 2
+
+def test_character_escapes_in_rule_patterns_match_case_insensitively():
+    """Test that rules spelling letters as \\x41, \\u0041, \\N{...} or octal escapes still match any case."""
+    rules = [
+        (r"\u00543 time-\x4fut", "Escaped", "High", "hex and unicode escapes", []),
+        (r"\N{LATIN CAPITAL LETTER M}DD\x20\124imeout", "Named", "High", "named and octal escapes", []),
+        (r"[\x41-\x43]rris\x2e", "Class", "Low", "escapes in a class, escaped metacharacter", []),
+        (r"\d+\s\D", "Digits", "Low", "other escapes are kept", []),
+    ]
+    parser = ModemLogParser(rules=rules)
+
+    assert parser.parse_line("t3 TIME-OUT on channel 3").category == "Escaped"
+    assert parser.parse_line("mdd timeout").category == "Named"
+    assert parser.parse_line("BRRIS. modem").category == "Class"
+    assert parser.parse_line("Arrisx modem").category == "General"  # \x2e is a literal dot, not "any character"
+    assert parser.parse_line("error 42 X").category == "Digits"
+
+def test_named_groups_backreferences_and_inline_flags_in_rule_patterns():
+    """Test that rules with their own groups or (?i)/(?x) flags compile into the merged pattern."""
+    rules = [
+        (r"(?P<code>E\d+) lost (?P=code)", "Named", "High", "named group and backreference", []),
+        (r"(?P<code>X\d+)(?P<r0>Y)", "Clash", "High", "same group name, and one named like a rule group", []),
+        (r"(?i)Lost MDD", "Flag", "High", "global flag", []),
+        (r"(?x) T3 \s time  # verbose comment", "Verbose", "Low", "verbose flag with a trailing comment", []),
+        (r"(Reboot)\s(\w+)\s\2", "Numbered", "Info", "numbered backreference", []),
+    ]
+    parser = ModemLogParser(rules=rules)
+
+    assert parser.parse_line("e12 LOST E12").category == "Named"
+    assert parser.parse_line("e12 lost e13").category == "General"
+    assert parser.parse_line("x7y").category == "Clash"
+    assert parser.parse_line("Modem LOST MDD lock").category == "Flag"
+    assert parser.parse_line("T3 time-out").category == "Verbose"
+    assert parser.parse_line("reboot twice twice").category == "Numbered"
+    assert len(parser.profile_rules(["e1 lost e1"])) == len(rules)  # each rule also compiles on its own
+
+def test_pack_rules_are_validated_as_the_parser_compiles_them(tmp_path):
+    """Test that a pattern valid on its own but not once lowered and wrapped is reported, not loaded."""
+    import json
+    from helpers.parsers.rule_pack_helper import read_pack
+
+    pack = tmp_path / "vendor.json"
+    pack.write_text(json.dumps({"rules": [
+        {"pattern": r"(?P<code>E\d+) lost", "category": "Named"},
+        {"pattern": "(?i)Lost MDD", "category": "Flag"},
+        {"pattern": "(?(1)a|b)(q)", "category": "Forward conditional"},
+    ]}), encoding="utf-8")
+
+    _, _, rules, warnings = read_pack(str(pack))
+    assert [rule[1] for rule in rules] == ["Named", "Flag"]
+    assert len(warnings) == 1 and warnings[0].startswith("rule 3:")
+
+def test_log_dialog_falls_back_to_built_in_rules(tmp_path, monkeypatch, qtbot):
+    """Test that the log parser dialog still opens, with the built-in rules, when the rule packs can't be compiled."""
+    import re
+    from helpers.parsers.rule_pack_helper import RulePackLoader
+    from views.widgets.log_widget import ModemLogParserView
+
+    def broken_parser(self):
+        self.load()
+        raise re.error("too many groups")
+
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    monkeypatch.setattr(RulePackLoader, "parser", broken_parser)
+    view = ModemLogParserView()
+    qtbot.addWidget(view)
+
+    assert view.parser.rules == ModemLogParser.RULES
+    assert "too many groups" in view.details.toPlainText()
+    view._reload_rule_packs(force=True)
+    assert view.parser.rules == ModemLogParser.RULES
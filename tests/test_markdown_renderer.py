@@ -0,0 +1,29 @@
+from helpers.markdown.md_to_html import MarkdownRenderer, render_markdown_to_html
+
+
+def test_renderer_reuses_bodies_and_highlights_code():
+    """Test that a source is converted once and code blocks go through Pygments."""
+    renderer = MarkdownRenderer(max_items=2)
+    text = "Subject: kept\n\n**bold**\n\n    print(1)\n"
+
+    body = renderer.render_body(text)
+    assert renderer.render_body(text) is body
+    assert (renderer.hits, renderer.misses) == (1, 1)
+    assert "Subject: kept" in body and "<strong>bold</strong>" in body
+    assert '<pre><code class="codehilite">print(1)' in body
+
+    document = renderer.render_document(text)
+    assert document.startswith("<html>") and body in document and renderer.hits == 2
+
+    # Least recently used bodies go first
+    renderer.render_body("one")
+    renderer.render_body("two")
+    assert renderer.render_body(text) is not body and renderer.misses == 4
+
+def test_module_function_uses_the_shared_renderer():
+    """Test that render_markdown_to_html goes through the shared cache."""
+    shared = MarkdownRenderer.instance()
+    misses = shared.misses
+    render_markdown_to_html("# Same note")
+    render_markdown_to_html("# Same note")
+    assert shared.misses <= misses + 1
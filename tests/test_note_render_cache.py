@@ -0,0 +1,73 @@
+from helpers.markdown.note_preview import PREVIEW_CHARS
+from services.note_render_cache_service import NoteRenderCacheService
+
+
+def test_cards_are_rendered_once_until_the_note_is_edited():
+    """Test that refreshes reuse the rendered card and edits drop it."""
+    cache = NoteRenderCacheService(max_items=2)
+    note = {"id": 1, "content": "# Title\n\nSome **bold** text", "image_path": None}
+
+    first = cache.render(note)
+    assert cache.render(dict(note)) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert "<strong>bold</strong>" in first.html
+
+    cache.invalidate(1)
+    assert cache.render(note) is not first
+
+    # Least recently used entries go first
+    cache.render({"id": 2, "content": "two"})
+    cache.render({"id": 3, "content": "three"})
+    assert cache.render(note) is not first and cache.misses == 5
+
+def test_card_html_is_truncated_and_sanitized():
+    """Test that long notes are cut at a paragraph and scripts/handlers never reach the card."""
+    cache = NoteRenderCacheService()
+    long_text = "\n\n".join(f"Paragraph {i} " + "x" * 80 for i in range(100))
+    unsafe = '<script>alert(1)</script><a href="javascript:alert(2)" onclick="x()">link</a>'
+
+    card = cache.render({"id": 1, "content": long_text})
+    assert "Paragraph 0" in card.html and "Paragraph 99" not in card.html
+    assert len(card.html) < PREVIEW_CHARS * 2
+
+    card = cache.render({"id": 2, "content": unsafe})
+    assert "script" not in card.html and "onclick" not in card.html and "javascript" not in card.html
+    assert ">link</a>" in card.html
+
+def test_preview_is_stored_on_save_and_bounded(tmp_path):
+    """Test that notes keep a bounded preview column and listings can skip the full body."""
+    from helpers.markdown.note_preview import PREVIEW_LINES, make_preview
+    from models.note_model import NoteModel
+
+    model = NoteModel(str(tmp_path / "notes.db"))
+    body = "```\n" + "\n".join(f"line {i}" for i in range(500)) + "\n```"
+    note_id = model.add_note("Notes", "Long", body)
+
+    row = model.get_notes(with_content=False)[0]
+    assert "content" not in row.keys()
+    assert row["preview"] == make_preview(body)
+    assert row["preview"].count("\n") <= PREVIEW_LINES + 3 and row["preview"].count("```") == 2
+
+    model.edit_note(note_id, content="short <b>note</b>")
+    assert model.get_note_by_id(note_id)["preview"] == "short <b>note</b>"
+    assert make_preview("x" * 5000 + "<img src='a.png'") == "x" * PREVIEW_CHARS + "\n\n…"
+    model.close()
+
+def test_rich_text_preview_budget_counts_visible_text(app):
+    """Test that a note saved by the editor (QTextDocument.toHtml) previews as many lines as its plain text would."""
+    from PySide6.QtGui import QTextDocument
+    from helpers.markdown.note_preview import PREVIEW_LINES, make_preview
+
+    doc = QTextDocument()
+    doc.setHtml("".join(f"<p>Line {i} of the note with <b>bold</b> text</p>" for i in range(60)))
+    html = doc.toHtml()
+    preview = make_preview(html)
+
+    assert "<head>" not in preview and "<!DOCTYPE" not in preview and "</body>" not in preview
+    assert preview.endswith("\n\n…")
+    shown = [f"Line {i} of" in preview for i in range(60)]
+    assert sum(shown) == PREVIEW_LINES and shown[:PREVIEW_LINES] == [True] * PREVIEW_LINES
+
+    short = QTextDocument()
+    short.setHtml("<p>Only <i>this</i></p>")
+    assert "<head>" not in make_preview(short.toHtml()) and "…" not in make_preview(short.toHtml())
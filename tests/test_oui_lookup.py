@@ -0,0 +1,79 @@
+from utils.oui_lookup import OUIIndex, OUILookup, build_index
+
+CSV = (
+    "Registry,Assignment,Organization Name,Organization Address\n"
+    'MA-L,001A2B,"Acme, Inc.",1 Road  Springfield US 12345 \n'
+    "MA-M,001A2BC,Acme Sub,2 Road US\n"
+    "MA-S,70B3D5123,Tiny Vendor,\n"
+    'MA-L,A0B1C2,"Acme, Inc.",1 Road  Springfield US 12345 \n'
+)
+
+
+def test_binary_index_matches_longest_prefix(tmp_path):
+    """Test that the compiled index finds 36/28/24-bit assignments and shares vendor strings."""
+    csv_path = tmp_path / "oui.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    build_index(csv_path, tmp_path / "oui.idx")
+    index = OUIIndex(tmp_path / "oui.idx")
+
+    assert index.find("001A2BC00000") == ("Acme Sub", "2 Road US", 28)
+    assert index.find("001A2B000000") == ("Acme, Inc.", "1 Road  Springfield US 12345", 24)
+    assert index.find("70B3D5123ABC") == ("Tiny Vendor", "", 36)
+    assert index.find("70B3D5000000") is None
+    assert index.source_size == csv_path.stat().st_size
+
+    lookup = OUILookup(str(csv_path))
+    assert lookup.index is OUILookup(str(csv_path)).index  # opened once per process
+    assert lookup.lookup("a0:b1:c2:00:11:22") == ("Acme, Inc.", "1 Road  Springfield US 12345", "MA-L (24-bit)")
+    assert lookup.lookup("ff-ff-ff-00-11-22") == ("Unknown Vendor", "Unknown", "")
+    assert lookup.lookup("12:34") == ("Invalid MAC", "", "")
+
+def test_lookup_many_matches_single_lookups(tmp_path):
+    """Test that bulk lookups agree with lookup() for every notation, including unknown and invalid MACs."""
+    from utils.oui_lookup import find_macs
+
+    csv_path = tmp_path / "bulk.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    lookup = OUILookup(str(csv_path))
+
+    text = [
+        "? (10.0.0.1) at 0:1a:2b:c4:4:55 on en0",
+        "lease 001a.2b00.0001 and 70-B3-D5-12-3F-FF, not 192.168.100.200",
+        "cpe A0B1C2000001 ff:ff:ff:00:00:01 00:11:22:33:44:55:66",
+        "last seen at 00:1A:2B:00:00:02. Then 70-B3-D5-12-30-00-",
+    ]
+    macs = list(find_macs(text))
+    assert macs == [
+        "0:1a:2b:c4:4:55", "001a.2b00.0001", "70-B3-D5-12-3F-FF", "A0B1C2000001", "ff:ff:ff:00:00:01",
+        "00:1A:2B:00:00:02", "70-B3-D5-12-30-00",
+    ]
+
+    results = lookup.lookup_many(macs + ["not a mac"])
+    assert [vendor for vendor, _, _ in results] == [
+        "Acme Sub", "Acme, Inc.", "Tiny Vendor", "Acme, Inc.", "Unknown Vendor",
+        "Acme, Inc.", "Tiny Vendor", "Invalid MAC",
+    ]
+    assert results == [lookup.lookup(mac) for mac in macs + ["not a mac"]]
+    assert lookup.lookup("0:1a:2b:c4:4:55") == lookup.lookup("00:1A:2B:C4:04:55")
+
+def test_stale_cached_index_is_closed_and_rebuilt(tmp_path, monkeypatch):
+    """Test that an index built from an older CSV of the same size is unmapped and rebuilt."""
+    from utils.oui_lookup import OUIIndex
+
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "appdata"))
+    csv_path = tmp_path / "same_size.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    first = OUIIndex._open_for(str(csv_path))
+    assert first.find("A0B1C2000000")[0] == "Acme, Inc."
+    first.close()
+
+    csv_path.write_text(CSV.replace("A0B1C2", "A0B1C3"), encoding="utf-8")  # same size, new content
+    closed = []
+    close = OUIIndex.close
+    monkeypatch.setattr(OUIIndex, "close", lambda self: (closed.append(self), close(self)))
+
+    index = OUIIndex._open_for(str(csv_path))
+    assert len(closed) == 1  # the stale cached index, before build_index replaced its file
+    assert index.find("A0B1C2000000") is None
+    assert index.find("A0B1C3000000")[0] == "Acme, Inc."
+    index.close()
@@ -0,0 +1,81 @@
+import time
+
+from services.render_service import RenderService
+
+
+def slow_render(text, delay):
+    time.sleep(delay)
+    return text
+
+def test_only_the_latest_render_is_delivered(app):
+    """Test that a superseded job's result is dropped and cancelled keys deliver nothing."""
+    service = RenderService()
+    results = []
+    service.rendered.connect(lambda key, html: results.append((key, html)))
+
+    service.submit("note", slow_render, "<p>old</p>", 0.2)
+    service.submit("note", slow_render, "<p>new</p>", 0)
+    service.submit("other", slow_render, "<p>other</p>", 0)
+    service.cancel("other")
+    assert service.is_pending("note") and not service.is_pending("other")
+
+    service.wait()
+    app.processEvents()
+    assert results == [("note", "<p>new</p>")]
+    assert not service.is_pending("note")
+
+def test_failed_preview_job_falls_back_to_a_synchronous_render(app):
+    """Test that a queued preview whose job fails is rendered on the GUI thread and keeps updating."""
+    from PySide6.QtGui import QTextCursor
+    from PySide6.QtWidgets import QTextEdit
+    from helpers.ui_helpers.cached_image_browser import CachedImageBrowser
+    from helpers.ui_helpers.incremental_preview import ASYNC_RENDER_CHARS, IncrementalPreview
+    from managers.editor_manager import EditorManager
+
+    calls = []
+
+    def flaky_prepare(html):
+        calls.append(html)
+        if len(calls) == 1:
+            raise RuntimeError("render worker failed")
+        return EditorManager.prepare_preview(html)
+
+    service = RenderService()
+    editor = QTextEdit()
+    editor.setPlainText("\n".join(f"Line {i} " + "x" * 80 for i in range(ASYNC_RENDER_CHARS // 80)))
+    browser = CachedImageBrowser()
+    preview = IncrementalPreview(editor.document(), browser, flaky_prepare, EditorManager.prepare_preview_fragment,
+                                 render_service=service, job_key="preview")
+    service.failed.connect(lambda key, error: preview.render_failed())
+
+    assert preview.update() == "queued"
+    service.wait()
+    app.processEvents()
+    assert not preview.queued and preview.full_renders == 1
+    assert browser.document().blockCount() == editor.document().blockCount()
+
+    QTextCursor(editor.document().findBlockByNumber(3)).insertText("edited ")
+    assert preview.update() == "patch"
+    assert browser.document().findBlock(0).next().next().next().text().startswith("edited ")
+
+def test_failed_content_render_leaves_the_note_editable(app, monkeypatch, tmp_path):
+    """Test that an editor whose long Markdown note fails to render shows the source and can be saved."""
+    from helpers.ui_helpers.incremental_preview import ASYNC_RENDER_CHARS
+    from managers.editor_manager import EditorManager
+    from models.note_model import NoteModel
+    from views.editor.editor_view import EditorPanel
+
+    def broken(content):
+        raise RuntimeError("markdown failed")
+
+    monkeypatch.setattr(EditorManager, "load_initial_content", broken)
+    content = "# Title\n\n" + "- item\n" * (ASYNC_RENDER_CHARS // 7)
+    model = NoteModel(str(tmp_path / "notes.db"), build_index=False)
+    editor = EditorPanel(None, "n1", "Title", content, save_callback=lambda *a: None, model=model)
+    assert editor.content_edit.isReadOnly() and not editor.btn_save.isEnabled()
+
+    RenderService.instance().wait()
+    app.processEvents()
+    assert not editor.content_edit.isReadOnly() and editor.btn_save.isEnabled()
+    assert editor.content_edit.toPlainText() == content
+    editor.deleteLater()
@@ -0,0 +1,24 @@
+import pytest
+
+from services.view_registry_service import VIEWS
+from startup.startup_profiler import format_report, profile_startup, startup_budget_ms
+
+# Loaded on first use, never on the way to the first paint
+DEFERRED_MODULES = ("markdown2", "pygments") + tuple(module for module, _ in VIEWS.values())
+
+
+@pytest.fixture(scope="module")
+def profile(tmp_path_factory):
+    """One offscreen cold start against an empty database."""
+    return profile_startup(env={"LOCALAPPDATA": str(tmp_path_factory.mktemp("appdata"))})
+
+def test_cold_start_within_budget(profile):
+    """Test that the main window paints within the startup budget (SCRATCHBOARD_STARTUP_BUDGET_MS)."""
+    assert profile["first_paint_ms"] <= startup_budget_ms(), format_report(profile)
+    assert {"imports", "qapplication", "styles", "startup_steps", "first_paint"} <= set(profile["phases"])
+
+def test_deferred_modules_are_not_imported_at_startup(profile):
+    """Test that tool windows and the Markdown stack stay out of the cold start."""
+    loaded = set(profile["modules"])
+    imported = [name for name in DEFERRED_MODULES if name in loaded]
+    assert not imported, format_report(profile)
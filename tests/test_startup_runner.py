@@ -0,0 +1,46 @@
+import threading
+
+from startup.startup_runner import StartupRunner, StartupStep
+
+
+def test_steps_run_in_dependency_order(app, qtbot):
+    """Test that steps wait for their dependencies, background steps leave the GUI thread and progress ends at 100."""
+    gui_thread = threading.get_ident()
+    threads = {}
+
+    def record(name, value):
+        def step(results):
+            threads[name] = threading.get_ident()
+            return value(results)
+        return step
+
+    runner = StartupRunner([
+        StartupStep("ready", "Ready", record("ready", lambda r: r["db"] + r["index"]), depends=("db", "index")),
+        StartupStep("index", "Index", record("index", lambda r: r["db"] * 10), depends=("db",), background=True),
+        StartupStep("db", "Database", record("db", lambda r: 4)),
+        StartupStep("extra", "Extra", lambda r: 1 / 0, background=True, optional=True),
+    ])
+    progress = []
+    runner.progress.connect(lambda value, message: progress.append(value))
+
+    with qtbot.waitSignal(runner.finished, timeout=5000) as blocker:
+        runner.start()
+
+    results = blocker.args[0]
+    assert results["ready"] == 44 and results["extra"] is None
+    assert threads["db"] == threads["ready"] == gui_thread != threads["index"]
+    assert progress[-1] == 100 and progress == sorted(progress)
+    assert set(runner.timings) == {"db", "index", "ready", "extra"}
+
+def test_required_step_failure_stops_startup(app, qtbot):
+    """Test that a failing required step emits failed and later steps never run."""
+    ran = []
+    runner = StartupRunner([
+        StartupStep("db", "Opening database...", lambda r: 1 / 0),
+        StartupStep("window", "Window", lambda r: ran.append("window"), depends=("db",)),
+    ])
+    with qtbot.waitSignal(runner.failed, timeout=5000) as blocker:
+        runner.start()
+
+    assert blocker.args[0] == "Opening database..."
+    assert not ran
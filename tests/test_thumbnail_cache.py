@@ -0,0 +1,79 @@
+import os
+
+from PySide6.QtCore import QUrl
+from PySide6.QtGui import QTextDocument
+
+from services.note_render_cache_service import RenderedCard
+from services.thumbnail_cache_service import THUMB_SIZE, ThumbnailCacheService
+
+
+def finish_jobs(app, service):
+    service._pool.waitForDone()
+    app.processEvents()
+
+def test_thumbnails_are_generated_cached_and_persisted(app, tmp_path, write_image):
+    """Test that a miss generates a downscaled thumbnail once, then memory and disk serve it."""
+    source = tmp_path / "photo.png"
+    write_image(source, 1000, 600)
+    service = ThumbnailCacheService(root=tmp_path / "thumbs")
+    ready = []
+    service.thumbnail_ready.connect(ready.append)
+
+    assert service.get(str(source)) is None
+    assert service.get(str(source)) is None  # still pending: not queued twice
+    finish_jobs(app, service)
+
+    key = service.key_for(str(source))
+    assert ready == [key]
+    thumb = service.get(str(source))
+    assert (thumb.width(), thumb.height()) == (THUMB_SIZE, THUMB_SIZE * 600 // 1000)
+    assert service.get(str(source)) is thumb  # memory hit
+    assert service._disk_path(key, THUMB_SIZE).exists()
+
+    # A new cache over the same folder reads the PNG instead of decoding the source again
+    restarted = ThumbnailCacheService(root=tmp_path / "thumbs")
+    assert restarted.get(str(source)).size() == thumb.size()
+    assert not restarted._pending
+
+def test_changed_source_gets_a_new_thumbnail(app, tmp_path, write_image):
+    """Test that replacing the image file changes its key, so the old thumbnail is never shown."""
+    source = tmp_path / "photo.png"
+    write_image(source, 400, 400)
+    service = ThumbnailCacheService(root=tmp_path / "thumbs")
+    service.get(str(source))
+    finish_jobs(app, service)
+    old_key = service.key_for(str(source))
+    assert service.get(str(source)).width() == THUMB_SIZE
+
+    write_image(source, 100, 50, color="blue")
+    os.utime(source, ns=(1, 1))
+    assert service.key_for(str(source)) != old_key
+    assert service.get(str(source)) is None
+    finish_jobs(app, service)
+    assert service.get(str(source)).size().toTuple() == (100, 50)
+
+    os.remove(source)
+    assert service.key_for(str(source)) is None and service.get(str(source)) is None
+
+def test_thumbnail_browser_rerenders_when_its_images_arrive(app, tmp_path, write_image, monkeypatch):
+    """Test that a card shown before its thumbnail exists picks the image up once it is generated."""
+    from views.notes.single_note_view import ThumbnailBrowser
+
+    source = tmp_path / "photo.png"
+    write_image(source, 800, 800)
+    service = ThumbnailCacheService(root=tmp_path / "thumbs")
+    monkeypatch.setattr(ThumbnailCacheService, "_instance", service)
+
+    url = f"thumb:{service.key_for(str(source))}"
+    browser = ThumbnailBrowser()
+    browser.set_card(RenderedCard(f'<p>card</p><img src="{url}" />', {url: str(source)}))
+    browser.show()  # images are requested when the document is laid out for display
+    app.processEvents()
+    assert browser._waiting
+
+    finish_jobs(app, service)
+    app.processEvents()
+    assert not browser._waiting
+    image = browser.document().resource(QTextDocument.ResourceType.ImageResource, QUrl(url))
+    assert image is not None and image.width() == THUMB_SIZE
+    browser.close()
@@ -0,0 +1,24 @@
+import sys
+
+from services.view_registry_service import VIEWS, ViewRegistryService
+
+
+def test_views_are_imported_on_first_use(app):
+    """Test that registering a view imports nothing until it is created."""
+    registry = ViewRegistryService(views={})
+    registry.register("calc", "views.widgets.calc_widget", "SimpleCalcView")
+    sys.modules.pop("views.widgets.calc_widget", None)
+
+    assert not registry.is_loaded("calc")
+    assert "views.widgets.calc_widget" not in sys.modules
+
+    view = registry.create("calc")
+    assert type(view).__name__ == "SimpleCalcView"
+    assert registry.is_loaded("calc") and "calc" in registry.timings
+    view.deleteLater()
+
+def test_prewarm_resolves_every_registered_view(app, qtbot):
+    """Test that prewarming imports every entry of the VIEWS table."""
+    registry = ViewRegistryService()
+    registry.prewarm(delay=0)
+    qtbot.waitUntil(lambda: all(registry.is_loaded(name) for name in VIEWS), timeout=10000)
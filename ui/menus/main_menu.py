@@ -5,33 +5,13 @@ import webbrowser
 from PySide6.QtGui import QAction, QCursor, QIcon, QPixmap, QShortcut, QKeySequence
 from PySide6.QtWidgets import QMenuBar, QToolTip, QApplication, QMessageBox, QFileDialog, QMenu
 
-from managers.batch_manager import BatchManager
 from services.nuke_service import NukeService
 from services.sync_service import sync_db
+from services.view_registry_service import ViewRegistryService
 from models.note_model import NoteModel
 from ui.themes.menu_theme import menu_style
 from utils.resource_path import resource_path
 from utils.run_update import run_update_batch_file
-from views.games.asteroid import AsteroidsWidget
-from views.info_widgets.fiber_widget import FiberReferenceDialog
-from views.info_widgets.gaming_widget import GamingReference
-from views.info_widgets.protocol_widget import InternetProtocolsTimeline
-from views.info_widgets.signal_widget import SignalReference
-from views.info_widgets.ethernet_widget import EthernetReference
-from views.info_widgets.speed_widget import InternetSpeedRequirements
-from views.info_widgets.storage_widget import DiskStorageChart
-from views.info_widgets.voip_widget import VoIPReference
-from views.widgets.batch_pop_widget import BatchPopup
-from views.widgets.calc_widget import SimpleCalcView
-from views.widgets.log_widget import ModemLogParserView
-from views.notepad.notepad_view import NotepadDialog
-from views.widgets.about_widget import AboutWidget
-from views.info_widgets.wifi_standards_widget import WifiStandardsReference
-from views.widgets.mac_pop_widget import MacVendorPopup
-from views.widgets.md_widget import MarkdownGuideWidget
-from views.widgets.password_widget import PassGenWidget
-from views.widgets.ref_pop_widget import ReferencePopup
-from views.widgets.shortcut_widget import ShortcutGuide
 
 # Internal tooltip hover function
 def _connect_hover_tooltips(menu):
@@ -70,8 +50,11 @@ class MainMenuBar(QMenuBar):
     def __init__(self, parent=None, model: NoteModel | None = None, dashboard=None):
         super().__init__(parent)
 
+        # Tool windows are imported on first use
+        self.views = ViewRegistryService.instance()
+
         # Hidden attributes
-        self._asteroids_window: AsteroidsWidget | None = None
+        self._asteroids_window = None
         self._asteroids_shortcut = QShortcut(QKeySequence("Ctrl+Shift+A"), self)
 
         # Calls the note model to allow import/export
@@ -426,89 +409,89 @@ class MainMenuBar(QMenuBar):
         self.shortcut_action.triggered.connect(self._open_shortcuts)
         self.repo_action.triggered.connect(self._open_repo)
 
-        self.about_action.triggered.connect(lambda: AboutWidget().exec())
+        self.about_action.triggered.connect(lambda: self.views.create("about").exec())
 
         # Hidden Easter egg games
         self._asteroids_shortcut.activated.connect(self._open_asteroids_widget)
 
     # Internal Helpers: opens non-category menu items
     def _open_notepad(self):
-        ntp = NotepadDialog(self.parent())
+        ntp = self.views.create("notepad", self.parent())
         ntp.exec()  # modal dialog
 
     def _open_modem_parser(self):
-        mdm = ModemLogParserView(self.parent())
+        mdm = self.views.create("log_parser", self.parent())
         mdm.exec()  # modal; blocks main window until closed
 
     def _open_signal_chart(self):
-        sgnl = SignalReference(self.parent())
+        sgnl = self.views.create("signal_chart", self.parent())
         sgnl.exec()
 
     def _open_ethernet_chart(self):
-        eth = EthernetReference(self.parent())
+        eth = self.views.create("ethernet_chart", self.parent())
         eth.exec()
 
     def _open_wifi_chart(self):
-        wfi = WifiStandardsReference(self.parent())
+        wfi = self.views.create("wifi_chart", self.parent())
         wfi.exec()
 
     def _open_speed_chart(self):
-        spd = InternetSpeedRequirements(self.parent())
+        spd = self.views.create("speed_chart", self.parent())
         spd.exec()
 
     def _open_fiber_chart(self):
-        fbr = FiberReferenceDialog(self.parent())
+        fbr = self.views.create("fiber_chart", self.parent())
         fbr.exec()
 
     def _open_protocol_chart(self):
-        prot = InternetProtocolsTimeline(self.parent())
+        prot = self.views.create("protocol_chart", self.parent())
         prot.exec()
 
     def _open_voip_chart(self):
-        voip = VoIPReference(self.parent())
+        voip = self.views.create("voip_chart", self.parent())
         voip.exec()
 
     def _open_gaming_chart(self):
-        gaming = GamingReference(self.parent())
+        gaming = self.views.create("gaming_chart", self.parent())
         gaming.exec()
 
     def _open_storage_chart(self):
-        storage = DiskStorageChart(self.parent())
+        storage = self.views.create("storage_chart", self.parent())
         storage.exec()
 
     def _open_shortcuts(self):
-        short = ShortcutGuide(self.parent())
+        short = self.views.create("shortcuts", self.parent())
         short.exec()
 
     def _open_md_guide(self):
         if not hasattr(self, '_md_widget'):
-            self._md_widget = MarkdownGuideWidget()
+            self._md_widget = self.views.create("markdown_guide")
         self._md_widget.show()
 
     def _open_repo(self):
         webbrowser.open("https://github.com/Quantum-Yeti/ScratchBoard")
 
     def _open_pw_gen(self):
-        pwgen = PassGenWidget(self.parent())
+        pwgen = self.views.create("password", self.parent())
         pwgen.exec()
 
     def _open_calc(self):
-        calc = SimpleCalcView(self.parent())
+        calc = self.views.create("calculator", self.parent())
         calc.exec()
 
     def _open_mac(self):
         if not hasattr(self, '_mac_popup') or self._mac_popup is None:
-            self._mac_popup = MacVendorPopup(self.parent())
+            self._mac_popup = self.views.create("mac_vendor", self.parent())
         self._mac_popup.show()
         self._mac_popup.raise_()
 
     def _open_ref(self):
-        self.reference_popup = ReferencePopup(self.note_model, self)
+        self.reference_popup = self.views.create("references", self.note_model, self)
         self.reference_popup.show()
 
     def _open_asteroids_widget(self):
         if getattr(self, '_asteroids_window', None) is None:
-            self._asteroids_window = AsteroidsWidget()
+            self._asteroids_window = self.views.create("asteroids")
         self._asteroids_window.show()
         self._asteroids_window.raise_()
 
@@ -519,7 +502,7 @@ class MainMenuBar(QMenuBar):
     def open_batch_manager(self):
         # Uses self. to keep a reference
         if not hasattr(self, '_batch_manager') or self._batch_manager is None:
-            self._batch_manager = BatchPopup(self.parent())
+            self._batch_manager = self.views.create("batch_manager", self.parent())
         self._batch_manager.show()
         self._batch_manager.raise_()
 
@@ -1,6 +1,5 @@
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QTextEdit, QLineEdit
-from pygments.lexers import q
 
 
 class CustomQEdit(QTextEdit):
@@ -1,30 +1,27 @@
-import os
-import shutil
 from pathlib import Path
+from PySide6.QtCore import QBuffer, QIODevice
 from PySide6.QtGui import QPixmap
 
 IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")
 
-def ensure_image_dir() -> Path:
-    dst_dir = Path(os.getcwd()) / "data" / "images"
-    dst_dir.mkdir(parents=True, exist_ok=True)
-    return dst_dir
 
+def save_qimage(image, store) -> str | None:
+    """Save an image from clipboard-drag data into the image store and return markdown path."""
+    pm = QPixmap.fromImage(image) if not isinstance(image, QPixmap) else image
+    if pm.isNull():
+        return None
 
-def save_qimage(image) -> str | None:
-    """Save an image from clipboard-drag data and return markdown path."""
-    dst = ensure_image_dir()
-
-    # Note to self - Using a timestamp avoids collisions
-    fname = dst / f"dropped_{os.times()[4]}.png"
-    pm = QPixmap.fromImage(image) if hasattr(image, "save") else image
-    pm.save(str(fname), "PNG")
+    # Encode to PNG in memory so identical pastes hash to the same blob
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    pm.save(buffer, "PNG")
+    dst = store.put_bytes(bytes(buffer.data()), ".png")
 
-    return format_markdown_reference(fname)
+    return format_markdown_reference(dst)
 
 
-def save_file_drop(local_path: str) -> str | None:
-    """Copy a dropped file into images folder and return markdown path."""
+def save_file_drop(local_path: str, store) -> str | None:
+    """Copy a dropped file into the image store and return markdown path."""
     if not Path(local_path).is_file():
         return None
 
@@ -32,19 +29,9 @@ def save_file_drop(local_path: str) -> str | None:
     if ext not in IMAGE_EXTS:
         return None
 
-    dst_dir = ensure_image_dir()
-    dst = dst_dir / Path(local_path).name
-
-    # avoid overwriting existing filenames
-    i = 1
-    while dst.exists():
-        dst = dst_dir / f"{Path(local_path).stem}_{i}{ext}"
-        i += 1
-
-    shutil.copy(local_path, dst)
+    dst = store.put_file(local_path)
     return format_markdown_reference(dst)
 
 
 def format_markdown_reference(path: Path) -> str:
-    rel = os.path.relpath(path, os.getcwd()).replace("\\", "/")
-    return f"![image]({rel})"
+    return f"![image]({Path(path).as_posix()})"
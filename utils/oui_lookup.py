@@ -1,73 +1,360 @@
-import os
 import csv
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+
 from utils.resource_path import resource_path
 
+# Binary index layout (native byte order, every section 4- or 8-byte aligned):
+#   header: magic, version, byte order, CSV size, entry counts for 24/28/36-bit prefixes, CSV digest
+#   keys36 (uint64), keys24 (uint32), keys28 (uint32)   sorted integer prefixes
+#   recs36, recs24, recs28 (uint32)                       offset of each prefix's vendor record
+#   string table                                          b"name\x1faddress\x00" records, deduplicated
+INDEX_MAGIC = b"OUIX"
+INDEX_VERSION = 2
+HEADER = struct.Struct("<4sHHQIIIIQ")
+BYTE_ORDER = 1 if sys.byteorder == "little" else 2
+
+# Assignment length (hex digits) -> prefix bits
+PREFIX_BITS = {6: 24, 7: 28, 9: 36}
+ASSIGNMENT_TYPES = {36: "MA-S (36-bit)", 28: "MA-M (28-bit)", 24: "MA-L (24-bit)"}
+
+# MACs in the notations found in ARP tables, DHCP lease dumps and CMTS CPE lists:
+# 00:1a:2b:33:44:55, 0:1a:2b:3:44:55, 00-1A-2B-33-44-55, 001a.2b33.4455, 001A2B334455
+MAC_RE = re.compile(
+    r"[0-9A-Fa-f]{1,2}(?::[0-9A-Fa-f]{1,2}){5}"
+    r"|[0-9A-Fa-f]{2}(?:-[0-9A-Fa-f]{2}){5}"
+    r"|[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}"
+    r"|[0-9A-Fa-f]{12}"
+)
+
+# Runs of hex digits and separators long enough to hold a MAC; cheap to find, then checked with MAC_RE
+MAC_CANDIDATE_RE = re.compile(r"[0-9A-Fa-f:.\-]{12,}")
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def mac_to_int(mac):
+    """
+    48-bit integer for a MAC in any common notation, or None if it isn't one.
+    Shorter input (a bare OUI like "001A2B") is padded with zeros.
+    """
+    mac = mac.strip()
+    if len(mac) < 17 and ":" in mac:
+        parts = mac.split(":")
+        if len(parts) == 6:
+            mac = "".join(part.zfill(2) for part in parts)
+    digits = mac.replace(":", "").replace("-", "").replace(".", "")
+    if not 6 <= len(digits) <= 12 or not (digits.isascii() and digits.isalnum()):
+        return None
+    try:
+        value = int(digits, 16)
+    except ValueError:
+        return None
+    return value << (4 * (12 - len(digits)))
+
+
+def csv_digest(csv_path):
+    """First 64 bits of the CSV's SHA-256, stored in the index to tell when it is out of date."""
+    h = hashlib.sha256()
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return int.from_bytes(h.digest()[:8], "little")
+
+
+def find_macs(lines):
+    """Yield every MAC found in an iterable of text lines."""
+    candidates = MAC_CANDIDATE_RE.findall
+    is_mac = MAC_RE.fullmatch
+    for line in lines:
+        for candidate in candidates(line):
+            # Separators around a MAC belong to the sentence ("...at 00:11:22:33:44:55.")
+            candidate = candidate.strip(":.-")
+            if is_mac(candidate):
+                yield candidate
+
+
+def build_index(csv_path, out_path):
+    """
+    Compile the IEEE OUI CSV into the binary index read by OUIIndex.
+    Run `python -m utils.oui_lookup` after updating resources/ieee_oui.csv.
+    """
+    tables = {24: {}, 28: {}, 36: {}}  # bits -> {prefix int: record offset}
+    records = {}                       # encoded record -> offset in the string table
+    strings = bytearray()
+
+    with open(csv_path, encoding="utf-8", errors="ignore", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col = {name: i for i, name in enumerate(header)}
+        assignment_col = col.get("Assignment", 1)
+        name_col = col.get("Organization Name", 2)
+        address_col = col.get("Organization Address", 3)
+
+        for row in reader:
+            if len(row) <= name_col:
+                continue
+            assignment = row[assignment_col].replace("-", "").upper()
+            bits = PREFIX_BITS.get(len(assignment))
+            if bits is None:
+                continue
+            try:
+                prefix = int(assignment, 16)
+            except ValueError:
+                continue
+
+            name = row[name_col].strip() or "Unknown"
+            address = row[address_col].strip() if len(row) > address_col else ""
+            record = f"{name}\x1f{address}".encode("utf-8") + b"\x00"
+
+            offset = records.get(record)
+            if offset is None:
+                offset = records[record] = len(strings)
+                strings += record
+            tables[bits][prefix] = offset
+
+    sections = []
+    for bits in (36, 24, 28):
+        keys = sorted(tables[bits])
+        sections.append(array("Q" if bits == 36 else "I", keys))
+    for bits in (36, 24, 28):
+        table = tables[bits]
+        sections.append(array("I", (table[key] for key in sorted(table))))
+
+    tmp_path = f"{out_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(
+            INDEX_MAGIC, INDEX_VERSION, BYTE_ORDER, os.path.getsize(csv_path),
+            len(tables[24]), len(tables[28]), len(tables[36]), 0, csv_digest(csv_path)
+        ))
+        for section in sections:
+            section.tofile(f)
+        f.write(strings)
+    os.replace(tmp_path, out_path)
+
+
+class OUIIndex:
+    """
+    Read-only view over a binary OUI index.
+
+    The file is memory-mapped and its prefix arrays are used in place through
+    memoryview casts, so opening it costs a header read; bisect searches the
+    sorted prefixes and a vendor's strings are only decoded when looked up.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._data = f.read()  # empty file or no mmap support
+
+        try:
+            magic, version, order, self.source_size, n24, n28, n36, _, self.source_digest = HEADER.unpack_from(self._data, 0)
+        except struct.error:
+            magic = None
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or order != BYTE_ORDER:
+            self.close()
+            raise ValueError(f"Not a usable OUI index: {path}")
+
+        view = self._view = memoryview(self._data)
+        pos = HEADER.size
+        sections = []
+        for count, fmt, size in ((n36, "Q", 8), (n24, "I", 4), (n28, "I", 4), (n36, "I", 4), (n24, "I", 4), (n28, "I", 4)):
+            sections.append(view[pos:pos + count * size].cast(fmt))
+            pos += count * size
+        keys36, keys24, keys28, recs36, recs24, recs28 = self._sections = sections
+
+        # Longest prefix first
+        self._tables = ((36, keys36, recs36), (28, keys28, recs28), (24, keys24, recs24))
+        self._strings_start = pos
+        self._deeper = None  # 24-bit prefixes split into MA-M/MA-S blocks, built on first bulk lookup
+
+    @classmethod
+    def shared(cls, csv_path):
+        """
+        The process-wide index for a CSV, opened once.
+
+        Uses the index shipped next to the CSV when it matches, otherwise builds
+        one into the user data folder on first use.
+        """
+        with _shared_lock:
+            index = _shared.get(csv_path)
+            if index is None:
+                index = _shared[csv_path] = cls._open_for(csv_path)
+            return index
+
+    @classmethod
+    def _open_for(cls, csv_path):
+        csv_size = os.path.getsize(csv_path)
+        bundled = os.path.splitext(csv_path)[0] + ".idx"
+        cached = resource_path(os.path.join("cache", os.path.basename(bundled)), data=True)
+
+        digest = None
+        for path in (bundled, cached):
+            try:
+                index = cls(path)
+            except (OSError, ValueError):
+                continue
+            if index.source_size == csv_size:
+                if digest is None:
+                    digest = csv_digest(csv_path)
+                if index.source_digest == digest:
+                    return index
+            # Unmap the stale index; Windows won't let build_index replace a mapped file
+            index.close()
+
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        build_index(csv_path, cached)
+        return cls(cached)
+
+    def close(self):
+        """Release the memory map (the index can't be used afterwards)."""
+        for section in getattr(self, "_sections", ()):
+            section.release()
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+        self._sections, self._view, self._tables = (), None, ()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def find(self, hex_mac):
+        """
+        Longest-prefix match for a MAC given as uppercase hex digits.
+        :return: (name, address, bits) or None
+        """
+        for bits, keys, recs in self._tables:
+            digits = bits // 4
+            if len(hex_mac) < digits or not len(keys):
+                continue
+            prefix = int(hex_mac[:digits], 16)
+            i = bisect_left(keys, prefix)
+            if i < len(keys) and keys[i] == prefix:
+                name, address = self.record(recs[i])
+                return name, address, bits
+        return None
+
+    def find_int(self, value):
+        """
+        Longest-prefix match for a 48-bit MAC integer.
+        :return: (record offset, bits) or None
+        """
+        for bits, keys, recs in self._tables:
+            if not len(keys):
+                continue
+            prefix = value >> (48 - bits)
+            i = bisect_left(keys, prefix)
+            if i < len(keys) and keys[i] == prefix:
+                return recs[i], bits
+        return None
+
+    def find_many(self, values):
+        """
+        Resolve many 48-bit MAC integers (None entries stay None).
+
+        MACs from one network mostly share a few vendors, so results are cached
+        per 24-bit prefix. Only prefixes the IEEE split into MA-M/MA-S blocks
+        need a full longest-prefix search per MAC.
+        :return: list of (record offset, bits) or None, in input order
+        """
+        if self._deeper is None:
+            (_, keys36, _), (_, keys28, _), _ = self._tables
+            self._deeper = {key >> 12 for key in keys36} | {key >> 4 for key in keys28}
+
+        deeper = self._deeper
+        find_int = self.find_int
+        by_oui = {}
+        missing = object()
+        results = []
+        append = results.append
+        for value in values:
+            if value is None:
+                append(None)
+                continue
+            oui = value >> 24
+            if oui in deeper:
+                append(find_int(value))
+                continue
+            found = by_oui.get(oui, missing)
+            if found is missing:
+                found = by_oui[oui] = find_int(value)
+            append(found)
+        return results
+
+    def record(self, offset):
+        """(name, address) stored at a string table offset."""
+        start = self._strings_start + offset
+        end = self._data.find(b"\x00", start)
+        name, _, address = self._data[start:end].decode("utf-8").partition("\x1f")
+        return name, address
+
+
 class OUILookup:
     """
-    Helper utility class that parses the included IEEE OUI csv file.
+    Helper utility class that looks up MAC vendors in the included IEEE OUI data.
+
+    The CSV is compiled into a binary index once (see build_index) and the
+    index is shared by every OUILookup in the process.
     """
     def __init__(self, csv_path="resources/ieee_oui.csv"):
         self.csv_path = resource_path(csv_path)
         if not os.path.exists(self.csv_path):
             raise FileNotFoundError(f"OUI CSV not found: {self.csv_path}")
 
-        self.oui_24 = {}  # MA-L
-        self.oui_28 = {}  # MA-M
-        self.oui_36 = {}  # MA-S
-
-        self.load_oui_data()
-
-    def load_oui_data(self):
-        with open(self.csv_path, encoding="utf-8", errors="ignore") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                # Normal 24-bit OUI ("XX-XX-XX")
-                assignment = row.get("Assignment", "").replace("-", "").upper()
-                if len(assignment) == 6:
-                    name = row.get("Organization Name", "Unknown").strip()
-                    address = row.get("Organization Address", "").strip()
-                    self.oui_24[assignment] = (name, address)
-
-                # MA-M → 28-bit (7 hex chars)
-                mam = row.get("MA-M", "").replace("-", "").upper()
-                if len(mam) == 7:
-                    name = row.get("Organization Name", "Unknown").strip()
-                    address = row.get("Organization Address", "").strip()
-                    self.oui_28[mam] = (name, address)
-
-                # MA-S → 36-bit (9 hex chars)
-                mas = row.get("MA-S", "").replace("-", "").upper()
-                if len(mas) == 9:
-                    name = row.get("Organization Name", "Unknown").strip()
-                    address = row.get("Organization Address", "").strip()
-                    self.oui_36[mas] = (name, address)
+        self.index = OUIIndex.shared(self.csv_path)
 
     def lookup(self, mac: str) -> tuple[str, str, str]:
         """
         Function that returns: (Vendor Name, Address, Assignment Type) from the included IEEE oui csv.
+        Accepts the same notations as lookup_many() (unpadded octets included) via mac_to_int.
         """
-        mac = mac.replace(":", "").replace("-", "").replace(".", "").upper()
-
-        if len(mac) < 6:
+        value = mac_to_int(mac)
+        if value is None:
             return "Invalid MAC", "", ""
 
-        # MA-S: longest match first (36 bit)
-        prefix_36 = mac[:9]
-        if prefix_36 in self.oui_36:
-            name, address = self.oui_36[prefix_36]
-            return name, address, "MA-S (36-bit)"
-
-        # MA-M: next longest match (28 bit)
-        prefix_28 = mac[:7]
-        if prefix_28 in self.oui_28:
-            name, address = self.oui_28[prefix_28]
-            return name, address, "MA-M (28-bit)"
-
-        # MA-L: fallback (24 bit)
-        prefix_24 = mac[:6]
-        if prefix_24 in self.oui_24:
-            name, address = self.oui_24[prefix_24]
-            return name, address, "MA-L (24-bit)"
-
-        return "Unknown Vendor", "Unknown", ""
+        found = self.index.find_int(value)
+        if found is None:
+            return "Unknown Vendor", "Unknown", ""
+
+        offset, bits = found
+        name, address = self.index.record(offset)
+        return name, address, ASSIGNMENT_TYPES[bits]
+
+    def lookup_many(self, macs) -> list[tuple[str, str, str]]:
+        """
+        Bulk version of lookup(): one (Vendor Name, Address, Assignment Type) per MAC, in order.
+        MACs are converted to integers and resolved in one pass; each vendor's strings are decoded once.
+        """
+        values = [mac_to_int(mac) for mac in macs]
+        found = self.index.find_many(values)
+
+        invalid = ("Invalid MAC", "", "")
+        unknown = ("Unknown Vendor", "Unknown", "")
+        decoded = {}
+        results = []
+        for value, item in zip(values, found):
+            if item is None:
+                results.append(invalid if value is None else unknown)
+                continue
+            result = decoded.get(item)
+            if result is None:
+                offset, bits = item
+                name, address = self.index.record(offset)
+                result = decoded[item] = (name, address, ASSIGNMENT_TYPES[bits])
+            results.append(result)
+        return results
+
+
+if __name__ == "__main__":
+    # Build step: python -m utils.oui_lookup [csv_path] [index_path]
+    source = sys.argv[1] if len(sys.argv) > 1 else resource_path("resources/ieee_oui.csv")
+    target = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(source)[0] + ".idx"
+    build_index(source, target)
+    print(f"Wrote {target} ({os.path.getsize(target):,} bytes)")
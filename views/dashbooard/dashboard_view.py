@@ -52,8 +52,6 @@ class DashboardView(QWidget):
         charts_layout = QHBoxLayout()
         content_layout.addLayout(charts_layout, stretch=3)
 
-        self.dash_arm = dashboard_left_panel(self.model)
-
         self.stacked_dash_panel = dashboard_left_panel(self.model)
         charts_layout.addWidget(self.stacked_dash_panel, stretch=1)
 
@@ -108,17 +106,28 @@ class DashboardView(QWidget):
         self.view_layout.setSpacing(0)
         main_layout.addWidget(self.view_container)
 
-        # Pre-create Notes & Contacts views
-        self.notes_view = MainNotesView(self.model.get_all_categories())
-        self.notes_view.add_btn.hide()
-        self.contacts_view = ContactsView(self.model.get_all_categories())
+        # Notes & Contacts views are built the first time their category is selected
+        self._notes_view = None
+        self._contacts_view = None
 
         # Show dashboard by default
         self.set_current_view(self.content_widget)
 
-        self.load_stylesheet()
         self.refresh_dashboard()
 
+    @property
+    def notes_view(self):
+        if self._notes_view is None:
+            self._notes_view = MainNotesView(self.model.get_all_categories(), model=self.model)
+            self._notes_view.add_btn.hide()
+        return self._notes_view
+
+    @property
+    def contacts_view(self):
+        if self._contacts_view is None:
+            self._contacts_view = ContactsView(self.model.get_all_categories())
+        return self._contacts_view
+
     # View Switching
     def set_current_view(self, view: QWidget):
         """Removes old view and adds new one to container"""
@@ -155,7 +164,6 @@ class DashboardView(QWidget):
             self.multi_line_view.chart().removeAllSeries()
 
         # --- Create new charts ---
-        self.dash_arm = dashboard_left_panel(self.model)
         self.multi_line_chart = create_multi_line_chart(self.model)
 
         # --- Replace charts in QChartView ---
@@ -183,10 +191,3 @@ class DashboardView(QWidget):
         self.set_current_view(self.content_widget)  # Switch to dashboard view (content_widget in this case)
         self.refresh_dashboard()  # Refresh the dashboard stats and graphs
 
-    # Stylesheet
-    def load_stylesheet(self):
-        try:
-            with open(resource_path("ui/themes/main_theme.qss"), "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print("Failed to load main_theme.qss:", e)
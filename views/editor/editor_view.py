@@ -7,28 +7,46 @@ from PySide6.QtCore import Qt, QTimer, QEvent, QUrl
 from PySide6.QtGui import QIcon, QTextCursor, QKeySequence, QAction, QPixmap
 from PySide6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QTextBrowser, QLabel, QPushButton, QToolBar, QStackedWidget,
+    QLabel, QPushButton, QToolBar, QStackedWidget,
     QMessageBox, QGraphicsOpacityEffect, QComboBox, QSizePolicy
 )
 
+from helpers.ui_helpers.cached_image_browser import CachedImageBrowser
 from helpers.ui_helpers.image_pop import ImagePopup
+from helpers.ui_helpers.incremental_preview import IncrementalPreview, adaptive_delay, PREVIEW_MIN_DELAY, \
+    ASYNC_RENDER_CHARS
 from models.note_model import NoteModel
+from services.render_service import RenderService
 from ui.fonts.font_list import main_font_list
 from ui.themes.scrollbar_style import vertical_scrollbar_style
 from utils.custom_context_menu import ContextMenuUtility
 from utils.custom_q_edit import CustomQEdit
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 from managers.editor_manager import EditorManager
 
 class EditorPanel(QDialog):
-    def __init__(self, parent, note_id, title, content, save_callback, delete_callback=None, tags=None):
+    def __init__(self, parent, note_id, title, content, save_callback, delete_callback=None, tags=None,
+                 model=None, updated=None):
+        """
+        :param model: NoteModel to share (its image store is used for dropped images); a new one if None
+        :param updated: The note row's `updated` value, shown without querying the database
+        """
         super().__init__(parent)
-        self.note_model = NoteModel()
+        self.note_model = model or NoteModel()
         self.note_id = note_id
+        self.updated = updated
         self.save_callback = save_callback
         self.delete_callback = delete_callback
         self._is_fullscreen = False
 
+        # Long notes are rendered on the shared render pool; results come back per job key
+        self._render_service = RenderService.instance()
+        self._content_job = f"editor-{id(self)}:content"
+        self._preview_job = f"editor-{id(self)}:preview"
+        self._render_service.rendered.connect(self._on_rendered)
+        self._render_service.failed.connect(self._on_render_failed)
+
         self.setWindowTitle("Scratch Board: Edit Note")
         self.resize(1100, 700)
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowMinimizeButtonHint | Qt.WindowType.WindowMaximizeButtonHint | Qt.WindowType.WindowCloseButtonHint)
@@ -49,6 +67,7 @@ class EditorPanel(QDialog):
         self.add_tag.setPlaceholderText("Tags: (e.g., tag1, tag2)")
         if tags:
             self.add_tag.setText(", ".join(tags))
+        self._loaded_fields = (self.title_edit.text(), self.add_tag.text())
         top_row.addWidget(self.add_tag, stretch=1)
         layout.addLayout(top_row)
 
@@ -72,8 +91,18 @@ class EditorPanel(QDialog):
         self.content_edit.setAcceptRichText(True)
         self.content_edit.setStyleSheet("background-color: #333; color: #fff;")
         self.content_edit.setStyleSheet(vertical_scrollbar_style)
-        self.content_edit.setHtml(EditorManager.load_initial_content(content))
         self.content_edit.setPlaceholderText("Use Plaintext, Markdown syntax, or the buttons to write and format.")
+        self._content_pending = EditorManager.is_markdown(content) and len(content) >= ASYNC_RENDER_CHARS
+        self._pending_content = None
+        if self._content_pending:
+            # Long legacy Markdown note: converted off the GUI thread, editable once it arrives
+            self.content_edit.setReadOnly(True)
+            self.content_edit.setPlaceholderText("Rendering note...")
+            self._pending_content = content  # shown as plain text if the render fails
+            self._render_service.submit(self._content_job, EditorManager.load_initial_content, content)
+        else:
+            self.content_edit.setHtml(EditorManager.load_initial_content(content))
+            self.content_edit.document().setModified(False)
         self.content_edit.textChanged.connect(self._schedule_preview)
         self.content_edit.textChanged.connect(self._update_word_stats)
         editor_layout.addWidget(self.content_edit, stretch=1)
@@ -86,7 +115,7 @@ class EditorPanel(QDialog):
         preview_page = QWidget()
         preview_layout = QVBoxLayout(preview_page)
         preview_layout.setContentsMargins(0,0,0,0)
-        self.preview = QTextBrowser()
+        self.preview = CachedImageBrowser()
         self.preview.setObjectName("PreviewPanel")
         self.preview.setPlaceholderText("This preview panel renders your Markdown/PlainText as Html.")
         self.preview.setOpenLinks(False)
@@ -125,10 +154,11 @@ class EditorPanel(QDialog):
         bottom.addWidget(self.toggle_button)
 
         # Save note button
-        btn_save = QPushButton("Save")
-        btn_save.setIcon(QIcon(resource_path("resources/icons/save.png")))
-        btn_save.clicked.connect(self.save_note)
-        bottom.addWidget(btn_save)
+        self.btn_save = QPushButton("Save")
+        self.btn_save.setIcon(QIcon(resource_path("resources/icons/save.png")))
+        self.btn_save.setEnabled(not self._content_pending)
+        self.btn_save.clicked.connect(self.save_note)
+        bottom.addWidget(self.btn_save)
 
         # Delete note button
         btn_delete = QPushButton("Delete")
@@ -149,16 +179,19 @@ class EditorPanel(QDialog):
         # Shortcuts
         self._bind_shortcuts()
 
-        # Preview timer
+        # Preview kept in step with the editor block by block; the debounce follows its render time
+        self._live_preview = IncrementalPreview(self.content_edit.document(), self.preview,
+                                                EditorManager.prepare_preview,
+                                                EditorManager.prepare_preview_fragment,
+                                                self._render_service, self._preview_job)
         self._preview_timer = QTimer(self)
         self._preview_timer.setSingleShot(True)
-        self._preview_timer.setInterval(200)
+        self._preview_timer.setInterval(PREVIEW_MIN_DELAY)
         self._preview_timer.timeout.connect(self._update_preview_no_animation)
 
-        # Initial update
+        # Initial update (the preview itself is rendered when first shown)
         self._update_word_stats()
         self._update_timestamps()
-        self._update_preview_no_animation()
         self.load_stylesheet()
 
     ### --- Editor/Preview Toggle --- ###
@@ -179,10 +212,12 @@ class EditorPanel(QDialog):
     ### --- Timestamps --- ###
     def _update_timestamps(self):
         """Update the creation and modification timestamps for the note file."""
-        note = self.note_model.get_note_by_id(self.note_id) # fetch from DB
-        if note:
+        updated = self.updated
+        if updated is None and self.note_id is not None:
+            note = self.note_model.get_note_by_id(self.note_id) # fetch from DB
+            updated = note["updated"] if note else None
+        if updated:
             #created = note["created"]  # ISO string from SQLite
-            updated = note["updated"]
             #created_dt = datetime.fromisoformat(created)
             updated_dt = datetime.fromisoformat(updated)
             #self.created_label.setText(f"Created: {created_dt.strftime('%Y-%m-%d %H:%M')}")
@@ -193,11 +228,44 @@ class EditorPanel(QDialog):
 
     ### --- Preview update --- ###
     def _schedule_preview(self):
-        self._preview_timer.start()
+        # Edits made while the editor page is showing are patched in when the preview is opened
+        if self.stack.currentIndex() == 1:
+            self._preview_timer.start()
 
     def _update_preview_no_animation(self):
-        html = self.content_edit.toHtml()
-        self.preview.setHtml(EditorManager.prepare_preview(html))
+        if self._live_preview.update() in ("patch", "full"):
+            self._preview_timer.setInterval(adaptive_delay(self._live_preview.render_ms))
+
+    def _on_rendered(self, key, html):
+        """Results from the render pool; only the latest job per key arrives here."""
+        if key == self._content_job:
+            self._finish_content_load(lambda: self.content_edit.setHtml(html))
+        elif key == self._preview_job:
+            self._live_preview.apply_full(html)
+            self._preview_timer.setInterval(adaptive_delay(self._live_preview.render_ms))
+            if self._live_preview.stale:
+                self._schedule_preview()  # edits made while it rendered
+
+    def _on_render_failed(self, key, error):
+        """A render job failed on the pool (the service already printed why)."""
+        if key == self._content_job:
+            # Keep the note editable: show its Markdown source rather than nothing
+            self._finish_content_load(lambda: self.content_edit.setPlainText(self._pending_content))
+        elif key == self._preview_job:
+            self._live_preview.render_failed()
+
+    def _finish_content_load(self, load):
+        """Put the asynchronously loaded content in the editor and make it editable."""
+        self._content_pending = False
+        load()
+        self._pending_content = None
+        self.content_edit.document().setModified(False)
+        self.content_edit.setReadOnly(False)
+        self.content_edit.setPlaceholderText("Use Plaintext, Markdown syntax, or the buttons to write and format.")
+        self.btn_save.setEnabled(True)
+        self._live_preview.invalidate()
+        self._update_word_stats()
+        self._schedule_preview()
 
     ### --- Toolbar actions --- ###
     def _add_toolbar_actions(self):
@@ -235,7 +303,8 @@ class EditorPanel(QDialog):
         # Insert images
         img = self.toolbar.addAction(QIcon(resource_path("resources/icons/insert_image.png")), "")
         img.setToolTip("Insert Image")
-        img.triggered.connect(lambda: EditorManager.insert_image_via_dialog(self, self.content_edit.textCursor()))
+        img.triggered.connect(lambda: EditorManager.insert_image_via_dialog(
+            self, self.content_edit.textCursor(), self.note_model.image_store))
 
         # Insert links
         action("link.png", lambda: EditorManager.insert_link(self, self.content_edit.textCursor()), "Insert Link")
@@ -332,8 +401,29 @@ class EditorPanel(QDialog):
             self.showFullScreen()
         self._is_fullscreen = not self._is_fullscreen
 
+    def showEvent(self, event):
+        """Keep images inserted into this editor from image GC while it is open (also when reopened from the pool)."""
+        super().showEvent(event)
+        self.note_model.image_store.track_open(self, self.content_edit.toHtml)
+
     ### --- Save/Delete --- ###
+    def done(self, result):
+        """Drop renders still in flight for this editor when it closes."""
+        self.note_model.image_store.untrack_open(self)
+        self._render_service.cancel(self._content_job)
+        if self._live_preview.queued:
+            self._live_preview.invalidate()  # its full render was dropped
+        super().done(result)
+
+    def is_pristine(self) -> bool:
+        """True while the editor still shows the note exactly as loaded (safe to reopen as-is)."""
+        return (not self._content_pending
+                and not self.content_edit.document().isModified()
+                and (self.title_edit.text(), self.add_tag.text()) == self._loaded_fields)
+
     def save_note(self):
+        if self._content_pending:
+            return  # the note hasn't been loaded into the editor yet
         title = self.title_edit.text().strip()
         tags = [t.strip() if t.startswith("#") else "#" + t.strip() for t in re.split(r"[,\s]+", self.add_tag.text().strip()) if t.strip()]
         tags = list(dict.fromkeys(tags))
@@ -358,11 +448,11 @@ class EditorPanel(QDialog):
         md_img = None
         if event.mimeData().hasImage():
             from utils.image_io import save_qimage
-            md_img = save_qimage(event.mimeData().imageData())
+            md_img = save_qimage(event.mimeData().imageData(), self.note_model.image_store)
         else:
             from utils.image_io import save_file_drop
             for url in event.mimeData().urls():
-                md_img = save_file_drop(url.toLocalFile())
+                md_img = save_file_drop(url.toLocalFile(), self.note_model.image_store)
                 if md_img: break
 
         if md_img:
@@ -401,8 +491,4 @@ class EditorPanel(QDialog):
 
     ### --- Load stylesheet --- ###
     def load_stylesheet(self):
-        try:
-            with open(resource_path("ui/themes/editor_view_theme.qss"), "r", encoding="utf-8") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print("Failed to load editor_view_theme.qss:", e)
+        ThemeService.apply(self, "editor_view_theme.qss")
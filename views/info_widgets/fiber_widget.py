@@ -6,6 +6,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QSize
 
 from ui.themes.scrollbar_style import vertical_scrollbar_style
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 from views.info_widgets.info_dictionaries.fiber_dict import signals
 
@@ -15,9 +16,7 @@ class FiberReferenceDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Apply the chart_theme.qss
-        with open(resource_path("ui/themes/charts_theme.qss"), "r") as f:
-            self.setStyleSheet(f.read())
+        ThemeService.apply(self, "charts_theme.qss")
 
         self.setWindowTitle("Scratch Board: Fiber Modem Reference Chart")
         self.setWindowModality(Qt.WindowModal)
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QTableWidgetItem, QTableWidget, QHBoxLayout, QPush
     QDialog, QSizePolicy
 
 from ui.themes.scrollbar_style import vertical_scrollbar_style
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 from views.info_widgets.info_dictionaries.gaming_dict import gaming_server_issues
 
@@ -11,12 +12,7 @@ class GamingReference(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Apply a chart theme if available
-        try:
-            with open(resource_path("ui/themes/charts_theme.qss"), "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception:
-            pass
+        ThemeService.apply(self, "charts_theme.qss")
 
         self.setWindowTitle("Scratch Board: Gaming Network Reference Chart")
         self.setWindowModality(Qt.WindowModality.WindowModal)
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QTableWidget, QHBoxLayout, QPushButton, QSizePolic
     QWidget, QTableWidgetItem
 
 from ui.themes.scrollbar_style import vertical_scrollbar_style
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 from views.info_widgets.info_dictionaries.protocol_dict import internet_protocols
 
@@ -16,8 +17,7 @@ class InternetProtocolsTimeline(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        with open(resource_path("ui/themes/charts_theme.qss"), "r") as f:
-            self.setStyleSheet(f.read())
+        ThemeService.apply(self, "charts_theme.qss")
 
         self.setWindowTitle("Scratch Board: Recent Internet Protocols")
         self.setWindowModality(Qt.WindowModality.WindowModal)
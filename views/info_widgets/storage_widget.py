@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QTableWidgetItem, QPushButton, QHBoxLayout, QTable
     QVBoxLayout, QDialog
 
 from ui.themes.scrollbar_style import vertical_scrollbar_style
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 from views.info_widgets.info_dictionaries.storage_dict import storage
 
@@ -16,9 +17,7 @@ class DiskStorageChart(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Apply the chart theme
-        with open(resource_path("ui/themes/charts_theme.qss"), "r") as f:
-            self.setStyleSheet(f.read())
+        ThemeService.apply(self, "charts_theme.qss")
 
         self.setWindowTitle("Scratch Board: Disk Storage Info Chart")
         self.setWindowModality(Qt.WindowModality.WindowModal)
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QTableWidget, QPushButton, QHBoxLayout, QSizePolic
     QDialog, QTableWidgetItem
 
 from ui.themes.scrollbar_style import vertical_scrollbar_style
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 from views.info_widgets.info_dictionaries.voip_dict import voip_signals
 
@@ -12,12 +13,7 @@ class VoIPReference(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Apply a chart theme if available
-        try:
-            with open(resource_path("ui/themes/charts_theme.qss"), "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception:
-            pass  # silently continue if theme not found
+        ThemeService.apply(self, "charts_theme.qss")
 
         self.setWindowTitle("Scratch Board: VoIP Reference Chart")
         self.setWindowModality(Qt.WindowModality.WindowModal)
@@ -1,63 +1,20 @@
-import os
 import random
 
 from PySide6.QtGui import QPixmap, QIcon
 from PySide6.QtWidgets import QWidget, QScrollArea, QGridLayout, QVBoxLayout, QLineEdit, QLabel, QHBoxLayout, \
     QPushButton, QSizePolicy, QCompleter
-from PySide6.QtCore import Qt, QSize, QThread, Signal, QStringListModel
+from PySide6.QtCore import Qt, QSize, QStringListModel
 
 from helpers.ui_helpers.empty_messages import empty_messages
 from helpers.ui_helpers.floating_action import FloatingButton
 from helpers.ui_helpers.image_pop import ImagePopup
 from models.note_model import NoteModel
+from services.theme_service import ThemeService
 from ui.themes.floating_action_style import floating_btn_style
 from ui.themes.scrollbar_style import vertical_scrollbar_style
 from utils.resource_path import resource_path
 from views.notes.single_note_view import NoteCard
 
-class PopulateNotesThread(QThread):
-    """
-    Background thread for preparing note images.
-
-    Scales and caches note images off the UI thread, then emits
-    the processed notes back to the main thread.
-    """
-
-    thread_loaded = Signal(list, object) # notes + click handler
-
-    def __init__(self, notes, on_click, max_size=250):
-        super().__init__()
-        self.notes = notes
-        self.on_click = on_click
-        self.max_size = max_size
-
-    def run(self):
-        """Process note images and cache scaled pixmaps."""
-        # Image cache once
-        for note in self.notes:
-            # If we already processed this note before, skip work entirely
-            if hasattr(note, "_cached_pix"):
-                continue
-
-            img_path = getattr(note, "image_path", None)
-            if img_path and os.path.exists(img_path):
-                pix = QPixmap(img_path)
-
-                # Scale image to a thumbnail size
-                if pix.width() > self.max_size or pix.height() > self.max_size:
-                    pix = pix.scaled(
-                        self.max_size,
-                        self.max_size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-
-                # Cache the pixmap on the note object
-                note._cached_pix = pix
-
-        # Notifies the main thread
-        self.thread_loaded.emit(self.notes, self.on_click)
-
 class MainNotesView(QWidget):
     """
     Main notes view widget.
@@ -66,12 +23,11 @@ class MainNotesView(QWidget):
     searching, and provides a floating action button for adding notes.
     """
 
-    def __init__(self, categories):
+    def __init__(self, categories, model=None):
         super().__init__()
 
-        # Track thread and state
-        self.note_model = NoteModel()
-        self._thread = None
+        # Track state (share the window's model so autocomplete sees its index)
+        self.note_model = model or NoteModel()
         self._last_click = None
         self._last_notes = None
         self.categories = categories
@@ -119,6 +75,8 @@ class MainNotesView(QWidget):
         self.scroll.setWidgetResizable(True)
 
         self.grid_widget = QWidget()
+        # Note card styling, set once on the container instead of on every card
+        ThemeService.apply(self.grid_widget, "note_card_theme.qss")
         self.grid_layout = QGridLayout(self.grid_widget)
         self.grid_layout.setSpacing(12)
         self.grid_layout.setContentsMargins(0,0,0,0)
@@ -144,31 +102,6 @@ class MainNotesView(QWidget):
         self.add_btn.reposition()
         super().resizeEvent(event)
 
-    def populate_notes_async(self, notes, on_click):
-        """
-        Populate notes in a background thread safely.
-
-        If a previous populate thread is still running, it will be
-        terminated cleanly before starting a new one, this avoids thread races.
-        """
-        self._last_notes = notes
-        self._last_click = on_click
-
-        # Stop any running thread
-        if hasattr(self, "_thread") and self._thread is not None:
-            if self._thread.isRunning():
-                self._thread.quit()
-                self._thread.wait()
-
-        # Create a new thread and keep a reference
-        self._thread = PopulateNotesThread(notes, on_click)
-        self._thread.thread_loaded.connect(self._populate_notes_from_thread)
-        self._thread.start()
-
-    def _populate_notes_from_thread(self, notes, on_click):
-        """ Called in main thread to safely populate the grid."""
-        self.populate_notes(notes, on_click)
-
     def populate_notes(self, notes, on_click):
         """
         Populate the notes grid with note cards. If note card category
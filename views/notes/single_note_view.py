@@ -1,15 +1,14 @@
-import base64
 import json
 import random
-from io import BytesIO
 from json import JSONDecodeError
 
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QTextBrowser, QMenu, QHBoxLayout
-from PySide6.QtCore import Qt, QEvent, Signal
-import markdown
-
+from PySide6.QtGui import QTextDocument
+from PySide6.QtCore import Qt, QEvent, Signal, QUrl
+from helpers.ui_helpers.cached_image_browser import CachedImageBrowser
+from services.note_render_cache_service import NoteRenderCacheService, RenderedCard
+from services.thumbnail_cache_service import ThumbnailCacheService
 from ui.themes.menu_theme import menu_style
-from utils.resource_path import resource_path
 
 
 def show_context_menu(widget, pos):
@@ -22,6 +21,42 @@ def show_context_menu(widget, pos):
     menu.exec_(global_pos)
 
 
+class ThumbnailBrowser(CachedImageBrowser):
+    """
+    CachedImageBrowser that resolves "thumb:" image URLs through the shared thumbnail cache
+    instead of decoding full-size files from disk.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cache = ThumbnailCacheService.instance()
+        self.sources: dict[str, str] = {}  # thumb url -> original image path
+        self._waiting: set[str] = set()
+        self.cache.thumbnail_ready.connect(self._on_thumbnail_ready)
+
+    def set_card(self, card: RenderedCard):
+        """Show a rendered card body and register the images behind its thumbnail URLs."""
+        self.sources = dict(card.sources)
+        self.setHtml(card.html)
+
+    def loadResource(self, resource_type, url: QUrl):
+        if resource_type == QTextDocument.ResourceType.ImageResource and url.scheme() == "thumb":
+            path = self.sources.get(url.toString())
+            image = self.cache.get(path) if path else None
+            if image is None:
+                self._waiting.add(url.path())
+            return image
+        return super().loadResource(resource_type, url)
+
+    def _on_thumbnail_ready(self, key: str):
+        if key in self._waiting:
+            self._waiting.discard(key)
+            self.setHtml(self._last_html)
+
+
+# Number of pastel tag colors defined in note_card_theme.qss
+TAG_TONES = 7
+
+
 class NoteCard(QFrame):
     """
     A visual card representing a single note with title and rendered Markdown content.
@@ -57,7 +92,6 @@ class NoteCard(QFrame):
         # Title
         title_label = QLabel(note["title"])
         title_label.setObjectName("NoteTitle")
-        title_label.setStyleSheet("background: transparent; border: none; font-weight: bold;")
         title_row.addWidget(title_label)
 
         title_row.addStretch(1)
@@ -70,30 +104,10 @@ class NoteCard(QFrame):
                 tags = []
 
             if isinstance(tags, list) and tags:
-                # Random background pastel colors
-                pastel_colors = [
-                    "#FFB3BA",  # Light red/pink
-                    "#FFDFBA",  # Light orange
-                    "#FFFFBA",  # Light yellow
-                    "#BAFFC9",  # Light green
-                    "#BAE1FF",  # Light blue
-                    "#E3BAFF",  # Light purple
-                    "#FFD1BA",  # Light peach
-                ]
-
-                color = random.choice(pastel_colors)
-
                 tag_label = QLabel(f"{tags[0]}")
                 tag_label.setObjectName("NoteTag")
-                tag_label.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {color};
-                        color: #333333;
-                        padding: 2px 6px;
-                        border-radius: 6px;
-                        font-size: 13px;
-                    }}
-                """)
+                # Random pastel background, one of the #NoteTag[tone=...] rules in note_card_theme.qss
+                tag_label.setProperty("tone", random.randrange(TAG_TONES))
                 title_row.addWidget(tag_label)
 
                 title_row.setAlignment(tag_label, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight)
@@ -101,11 +115,9 @@ class NoteCard(QFrame):
         layout.addLayout(title_row)
 
         # Content area
-        self.content_view = QTextBrowser()
+        self.content_view = ThumbnailBrowser()
+        self.content_view.setObjectName("NoteContent")
         self.content_view.setOpenExternalLinks(True)
-        self.content_view.setStyleSheet(
-            "background: none; border: none; a { color: #5DADE2; text-decoration: none;}"
-        )
 
         self.content_view.setMouseTracking(True)
         self.content_view.viewport().setMouseTracking(True)
@@ -117,38 +129,8 @@ class NoteCard(QFrame):
             lambda pos: show_context_menu(self.content_view, pos)
         )
 
-        # Render markdown to HTML
-        rendered_markdown = markdown.markdown(self.note["content"])
-
-        # Cached image
-        img_html = ""
-        cached = getattr(self.note, "_cached_pix", None)
-        img_path = getattr(self.note, "image_path", None)
-        if cached:
-            # inline encode ONCE
-            buffer = BytesIO()
-            cached.save(buffer, "PNG")
-            encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
-            img_html = f'<br><img src="data:image/png;base64,{encoded}" data-path="{img_path}" />'
-
-        # Combine everything with styling
-        html = f"""
-            <style>
-                a {{
-                    color: #5dade2;
-                    text-decoration: none;
-                }}
-                img {{
-                    max-width: 180px;
-                    height: auto;
-                    border-radius: 6px;
-                    cursor: pointer;
-                }}
-            </style>
-            {rendered_markdown}
-            {img_html}
-        """
-        self.content_view.setHtml(html)
+        # Rendered body is shared across refreshes until the note is edited
+        self.content_view.set_card(NoteRenderCacheService.instance().render(self.note))
 
         # Hide scrollbars but keep original size
         self.content_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -163,20 +145,9 @@ class NoteCard(QFrame):
             child.installEventFilter(self)
 
         # Add content view to layout
+        # (styling comes from note_card_theme.qss, set once on the notes grid by MainNotesView)
         layout.addWidget(self.content_view)
 
-        # Apply stylesheet
-        self.load_stylesheet()
-
-    def load_stylesheet(self):
-        """Load the external stylesheet for consistent dark theme styling."""
-        try:
-            qss_path = resource_path("ui/themes/note_card_theme.qss")
-            with open(qss_path, "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print("Failed to load note_card_theme.qss:", e)
-
     def mouseDoubleClickEvent(self, event):
         """
         Handle double-clicks on the card itself.
@@ -205,8 +176,9 @@ class NoteCard(QFrame):
                 cursor = self.content_view.cursorForPosition(event.pos())
                 fmt = cursor.charFormat()
                 if fmt.isImageFormat():
-                    # Try to get image path from HTML attribute
-                    img_path = fmt.toImageFormat().name()
+                    # Map the thumbnail back to the full-size image
+                    img_name = fmt.toImageFormat().name()
+                    img_path = self.content_view.sources.get(img_name, img_name)
                     self.imgRightClicked.emit(img_path)
                     return True
 
@@ -5,13 +5,10 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QFileDialog, QF
 from PySide6.QtCore import Signal, QSize, Qt, QUrl
 import subprocess
 
-from qdarkstyle import example
-
 from helpers.ui_helpers.logo_btn_url_action import LogoButton
 from helpers.ui_helpers.open_company_url import open_company_homepage
 from utils.resource_path import resource_path
-from managers.sticky_manager import StickyManager
-from views.notepad.notepad_view import NotepadDialog
+from services.view_registry_service import ViewRegistryService
 
 
 def open_github():
@@ -183,7 +180,7 @@ class Sidebar(QWidget):
         if hasattr(self, "_scratch_pad") and self._scratch_pad and self._scratch_pad.isVisible():
             self._scratch_pad.raise_()
             return
-        self._scratch_pad = StickyManager(model=self.model)
+        self._scratch_pad = ViewRegistryService.instance().create("sticky_notes", model=self.model)
         self._scratch_pad.show()
 
     def open_bat_file(self):
@@ -221,5 +218,5 @@ class Sidebar(QWidget):
                 return
 
         # Create a new dialog if none exists
-        self._notepad = NotepadDialog(self.parent())
+        self._notepad = ViewRegistryService.instance().create("notepad", self.parent())
         self._notepad.show()
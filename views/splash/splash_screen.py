@@ -1,9 +1,8 @@
 from datetime import datetime
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar, QSpacerItem, QSizePolicy, QApplication
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar, QSpacerItem, QSizePolicy
 from PySide6.QtGui import QPixmap, QPainterPath, QRegion
-from PySide6.QtCore import Qt, QThread, Signal, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 
-from startup.startup_runner import run_startup
 from utils.resource_path import resource_path
 
 
@@ -17,18 +16,6 @@ def get_current_version() -> str:
         return f"Unknown version ({e})"
 
 
-class ProgressThread(QThread):
-    """Thread to run startup tasks with progress updates."""
-    progress = Signal(int, str)
-
-    def __init__(self, func):
-        super().__init__()
-        self.func = func
-
-    def run(self):
-        self.func(self.progress.emit)
-
-
 class SplashScreen(QWidget):
     """Splash screen widget with image, progress bar, messages, and version/copyright info."""
 
@@ -41,9 +28,8 @@ class SplashScreen(QWidget):
         )
         self.setFixedSize(780, 680)
 
-        # Apply rounded corners and background
+        # Apply rounded corners (the dark background comes from the app-wide main theme)
         self._apply_rounded_corners(radius=20)
-        self._apply_base_style()
 
         # Main layout
         self.layout = QVBoxLayout(self)
@@ -69,11 +55,6 @@ class SplashScreen(QWidget):
         self.progress_anim.setDuration(200)  # Duration per step in ms
         self.progress_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # Start the background startup thread
-        self.worker = ProgressThread(run_startup)
-        self.worker.progress.connect(self.set_progress)
-        self.worker.start()
-
     # Widget Setup Methods
     def _setup_image(self, image_path: str):
         pixmap = QPixmap(image_path)
@@ -143,25 +124,6 @@ class SplashScreen(QWidget):
         self.layout.addItem(spacer)
 
     # Style Methods
-    def _apply_base_style(self):
-        """Base widget style including dark background."""
-        self.setStyleSheet("""
-            QWidget {
-                border-radius: 20px;
-                background-color: #505050;
-            }
-        """)
-        self._apply_dark_theme()
-
-    def _apply_dark_theme(self):
-        """Load custom QSS theme if not print stacktrace."""
-        try:
-            theme_path = resource_path("ui/themes/main_theme.qss")
-            with open(theme_path, "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print(f"Failed to load theme: {e}")
-
     def _apply_rounded_corners(self, radius: int = 20):
         path = QPainterPath()
         path.addRoundedRect(self.rect(), radius, radius)
@@ -170,14 +132,12 @@ class SplashScreen(QWidget):
 
     # Progress Handling
     def set_progress(self, value: int, message: str = ""):
-        """Update progress bar and message."""
+        """Update progress bar and message (connected to StartupRunner.progress)."""
         self.progress.setValue(value)
         if message:
             self.message_label.setText(message)
-        QApplication.processEvents()
-        if value >= 100:
-            QThread.msleep(300)
-            self.finish()
+        # GUI steps block the event loop while they run; show the new state first
+        self.repaint()
 
     def finish(self):
         """Close the splash screen."""
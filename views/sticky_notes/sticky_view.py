@@ -4,6 +4,7 @@ from PySide6.QtCore import Qt, QTimer, QPoint, QSize
 from PySide6.QtGui import QColor, QIcon, QPixmap, QGuiApplication, QTextCursor, QTextCharFormat
 
 from helpers.ui_helpers.text_color_switcher import get_text_color
+from services.note_render_cache_service import NoteRenderCacheService
 from utils.custom_context_menu import ContextMenuUtility
 from utils.custom_q_edit import CustomQEdit
 from utils.resource_path import resource_path
@@ -169,6 +170,7 @@ class ScratchNote(QDialog):
 
         if self.note_id:
             self.model.edit_note(self.note_id, title=title, content=text)
+            NoteRenderCacheService.instance().invalidate(self.note_id)
         else:
             self.note_id = self.model.add_note("Sticky Notes", title, text)
 
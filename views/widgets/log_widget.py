@@ -1,13 +1,30 @@
-from PySide6.QtGui import QIcon, QCursor, QPixmap
+import os
+
+from PySide6.QtCore import Qt, QSize, QThread, QTimer, QFileSystemWatcher, QUrl
+from PySide6.QtGui import QIcon, QCursor, QPixmap, QDesktopServices
 from PySide6.QtWidgets import QVBoxLayout, QTextEdit, QPushButton, QLabel, QHBoxLayout, QDialog, QApplication, QFrame, \
-    QSplitter, QSizePolicy, QMenu
-from helpers.parsers.log_parser_helper import ModemLogParser
-from PySide6.QtCore import Qt, QSize
+    QSplitter, QSizePolicy, QMenu, QPlainTextEdit, QFileDialog, QTableView, QHeaderView, QComboBox, QLineEdit, \
+    QAbstractItemView, QWidget
 
+from helpers.parsers.log_batch_helper import analyze_batch
+from helpers.parsers.log_parser_helper import ModemLogParser
+from helpers.parsers.rule_pack_helper import RulePackLoader
+from helpers.ui_helpers.batch_worker import BatchWorker
+from helpers.ui_helpers.log_parse_worker import LogParseWorker
+from models.log_event_model import LogEventTableModel
 from ui.themes.scrollbar_style import vertical_scrollbar_style
 from utils.custom_context_menu import ContextMenuUtility
 from utils.resource_path import resource_path
 
+ALL_CATEGORIES = "All Categories"
+ALL_SEVERITIES = "All Severities"
+
+# Lines timed per rule by Rule Statistics
+PROFILE_SAMPLE_LINES = 5000
+
+# Batch analyses keep running if the dialog closes, so their thread/worker pairs are held here
+_running_batches = []
+
 
 def _make_divider():
     divider = QFrame()
@@ -23,10 +40,15 @@ class ModemLogParserView(QDialog):
 
     Features:
         - Input area for modem logs
-        - Parse button to analyze logs
+        - Open button to stream a log file from disk without pasting it
+        - Batch button to analyze a folder or ZIP archives of logs across all CPU cores
+        - Parse button to analyze logs (parsed on a worker thread, shown in batches)
         - Clear button to reset the input and output
         - Summary display of events and severity
-        - Detailed log output with explanations
+        - Event table (virtualized) with category/severity filters and text search
+        - Explanation and troubleshooting steps for the selected event
+        - Rule packs (YAML/JSON) from ScratchBoardData/rule_packs, reloaded when the files change,
+          with per-rule hit counts and timing
     """
     def __init__(self, parent=None):
         """Initialize the ModemLogParserView class."""
@@ -34,8 +56,13 @@ class ModemLogParserView(QDialog):
         self.setWindowTitle("Scratch Board: Modem Log Parser")
         self.setWindowModality(Qt.WindowModality.ApplicationModal)  # makes it modal
 
-        # Initialize the log parser
-        self.parser = ModemLogParser()
+        # Initialize the log parser from the built-in rules plus any rule packs
+        pack_folder = resource_path("rule_packs", data=True)
+        os.makedirs(pack_folder, exist_ok=True)
+        self.rule_packs = RulePackLoader(pack_folder)
+        self.parser = self._build_parser()
+        self._thread = None
+        self._worker = None
 
         # Main vertical layout
         layout = QVBoxLayout(self)
@@ -61,6 +88,34 @@ class ModemLogParserView(QDialog):
 
         header_row.addStretch()  # push buttons to the right
 
+        # Open file button
+        open_btn = QPushButton("Open Log File")
+        open_btn.setIcon(QIcon(resource_path("resources/icons/open.png")))
+        open_btn.setToolTip("Parse a log file directly from disk")
+        open_btn.clicked.connect(self.open_log_file)
+        header_row.addWidget(open_btn)
+
+        # Batch analysis button (folder or ZIP archives)
+        batch_btn = QPushButton("Batch Analyze")
+        batch_btn.setIcon(QIcon(resource_path("resources/icons/open_folder.png")))
+        batch_btn.setToolTip("Analyze a folder or ZIP archives of modem logs")
+        batch_menu = QMenu(batch_btn)
+        batch_menu.addAction("Folder...", self.batch_analyze_folder)
+        batch_menu.addAction("ZIP Archives...", self.batch_analyze_zips)
+        batch_btn.setMenu(batch_menu)
+        header_row.addWidget(batch_btn)
+
+        # Rule pack button
+        rules_btn = QPushButton("Rule Packs")
+        rules_btn.setIcon(QIcon(resource_path("resources/icons/query.png")))
+        rules_btn.setToolTip("Extra parsing rules loaded from YAML/JSON files")
+        rules_menu = QMenu(rules_btn)
+        rules_menu.addAction("Open Rule Pack Folder", self.open_rule_pack_folder)
+        rules_menu.addAction("Reload Rule Packs", lambda: self._reload_rule_packs(force=True))
+        rules_menu.addAction("Rule Statistics", self.show_rule_stats)
+        rules_btn.setMenu(rules_menu)
+        header_row.addWidget(rules_btn)
+
         # Parse button
         parse_btn = QPushButton("Parse Logs")
         parse_btn.setIcon(QIcon(resource_path("resources/icons/query.png")))
@@ -109,20 +164,79 @@ class ModemLogParserView(QDialog):
         # Override context menu for input
         self.context_menu_helper = ContextMenuUtility(self.input)
 
-        # Output field
-        self.output_title = QLabel("Log Output:")
-        self.output = QTextEdit()
-        self.output.setPlaceholderText("Waiting for log to parse.")
-        self.output.setReadOnly(True)
+        # Output: filter row, event table, details
+        output_panel = QWidget()
+        output_layout = QVBoxLayout(output_panel)
+        output_layout.setContentsMargins(0, 0, 0, 0)
+        output_layout.setSpacing(4)
+
+        filter_row = QHBoxLayout()
+        self.category_filter = QComboBox()
+        self.category_filter.addItem(ALL_CATEGORIES)
+        self.category_filter.addItems(self.parser.table.categories)
+        self.category_filter.currentIndexChanged.connect(self._apply_filters)
+
+        self.severity_filter = QComboBox()
+        self.severity_filter.addItem(ALL_SEVERITIES)
+        self.severity_filter.addItems(self.parser.table.severities)
+        self.severity_filter.currentIndexChanged.connect(self._apply_filters)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search messages...")
+        self.search_input.setClearButtonEnabled(True)
+
+        # Debounce typing so each keystroke doesn't rescan the events
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._apply_filters)
+        self.search_input.textChanged.connect(self._search_timer.start)
+
+        filter_row.addWidget(self.category_filter)
+        filter_row.addWidget(self.severity_filter)
+        filter_row.addWidget(self.search_input, 1)
+        output_layout.addLayout(filter_row)
+
+        self.model = LogEventTableModel(self.parser.table, self)
+        self.output = QTableView()
+        self.output.setModel(self.model)
+        self.output.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.output.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.output.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.output.setWordWrap(False)
+        self.output.setAlternatingRowColors(True)
         self.output.verticalScrollBar().setStyleSheet(vertical_scrollbar_style)
         self.output.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-        #Override context menu for output
-        self.context_menu_helper = ContextMenuUtility(self.output)
+        # Fixed row heights keep the view from measuring every row
+        vertical = self.output.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(22)
+
+        header = self.output.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        header.resizeSection(0, 150)
+        header.resizeSection(1, 170)
+        header.resizeSection(2, 80)
+
+        self.output.selectionModel().currentRowChanged.connect(self._show_event_details)
+        output_layout.addWidget(self.output, 3)
+
+        # Explanation/steps of the selected event, or the batch report
+        self.details = QPlainTextEdit()
+        self.details.setPlaceholderText("Select an event to see its explanation and troubleshooting steps.")
+        self.details.setReadOnly(True)
+        self.details.verticalScrollBar().setStyleSheet(vertical_scrollbar_style)
+        output_layout.addWidget(self.details, 1)
+
+        #Override context menu for details
+        self.context_menu_helper = ContextMenuUtility(self.details)
 
         # Add to splitter
         splitter.addWidget(self.input)
-        splitter.addWidget(self.output)
+        splitter.addWidget(output_panel)
 
         # Sizing behavior
         splitter.setStretchFactor(0, 1)
@@ -139,6 +253,18 @@ class ModemLogParserView(QDialog):
 
         self.center_on_screen(parent)
 
+        # Hot reload: editing, adding or removing a pack rebuilds the parser (debounced, editors write in bursts)
+        self._pack_reload_timer = QTimer(self)
+        self._pack_reload_timer.setSingleShot(True)
+        self._pack_reload_timer.setInterval(500)
+        self._pack_reload_timer.timeout.connect(self._reload_rule_packs)
+
+        self._pack_watcher = QFileSystemWatcher(self)
+        self._pack_watcher.directoryChanged.connect(self._pack_reload_timer.start)
+        self._pack_watcher.fileChanged.connect(self._pack_reload_timer.start)
+        self._watch_rule_packs()
+        self._show_rule_pack_errors()
+
     def center_on_screen(self, parent=None):
         if parent:
             parent_geometry = parent.frameGeometry()
@@ -156,43 +282,265 @@ class ModemLogParserView(QDialog):
         """
         Parse the modem event logs within the input field.
 
-        Process the logs through ModemLogParser, display a summarized event count, severity overview, and
-        show the detailed event information.
+        Process the logs through ModemLogParser on a worker thread, display a summarized event count,
+        severity overview, and show the detailed event information as batches arrive.
         """
         raw = self.input.toPlainText()
         if not raw.strip():
-            self.output.setPlainText("No logs provided.")
+            self.details.setPlainText("No logs provided.")
             return
 
-        # Parse and summarize
-        events = self.parser.parse(raw)
-        summary = self.parser.summarize(events)
+        self._start_parse(raw, from_file=False)
 
-        # Build readable summary text
+    def open_log_file(self):
+        """Stream a log file from disk through the parser without loading it into the input field."""
+        path, _ = QFileDialog.getOpenFileName(self, "Open Modem Log", "", "Log Files (*.log *.txt);;All Files (*)")
+        if not path:
+            return
+
+        self.input.clear()
+        self.input.setPlaceholderText(f"Parsing {os.path.basename(path)} from disk.")
+        self._start_parse(path, from_file=True)
+
+    def batch_analyze_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Log Folder")
+        if folder:
+            self._start_batch([folder])
+
+    def batch_analyze_zips(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "Select Log Archives", "", "ZIP Archives (*.zip)")
+        if paths:
+            self._start_batch(paths)
+
+    def _start_batch(self, paths):
+        """Run a multi-process batch analysis off the GUI thread and show the combined report."""
+        self._stop_parse()
+        self.model.clear()
+        self.details.clear()
+        self.summary_label.setText(f"Analyzing {len(paths)} selection(s) using all CPU cores...")
+
+        rules = self.parser.rules
+
+        def run():
+            report = analyze_batch(paths, rules=rules)
+            return report.format() if report.files else "No .log or .txt files found."
+
+        thread = QThread()
+        worker = BatchWorker(run)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_batch_report)
+        worker.error.connect(self._on_parse_error_text)
+
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        # Keep references until the thread ends, even if the dialog is closed first
+        job = (thread, worker)
+        _running_batches.append(job)
+        thread.finished.connect(lambda: _running_batches.remove(job))
+
+        thread.start()
+
+    def _on_batch_report(self, text):
+        self.summary_label.setText(text.split("\n", 1)[0])
+        self.details.setPlainText(text)
+
+    def _on_parse_error_text(self, message):
+        self.summary_label.setText(f"Failed to analyze logs: {message}")
+
+    def _start_parse(self, source, from_file):
+        self._stop_parse()
+        if self.rule_packs.changed():
+            self._reload_rule_packs()
+
+        # The worker owns parser.table while it runs; the model reads a copy extended from batch_ready
+        self.model.clear(self.parser.table.copy())
+        self.parser.hits.clear()
+        self.details.clear()
+        self.summary_label.setText("Parsing...")
+
+        thread = QThread()
+        worker = LogParseWorker(self.parser, source, from_file=from_file)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.batch_ready.connect(self._on_batch)
+        worker.finished.connect(self._on_parse_finished)
+        worker.error.connect(self._on_parse_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+
+        # Owned here until the next parse or close, so sender checks stay valid for late batches
+        self._thread, self._worker = thread, worker
+        thread.start()
+
+    def _stop_parse(self):
+        """Stop a running parse and wait for its thread to end."""
+        if self._worker is not None:
+            self._worker.stop()
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
+        self._thread, self._worker = None, None
+
+    def _on_batch(self, batch, summary, new_entries):
+        """Update the running summary and add the parsed chunk to the table."""
+        if self.sender() is not self._worker:
+            return  # late batch from a parse that was stopped
+        self.summary_label.setText(self._format_summary(summary))
+        self.model.events.table.extend(new_entries)
+        self.model.append_batch(batch)
+        self._sync_filter_choices()
+
+    def _on_parse_finished(self, total):
+        if self.sender() is not self._worker:
+            return
+        if not total:
+            self.summary_label.setText("No events found.")
+
+    def _on_parse_error(self, message):
+        if self.sender() is not self._worker:
+            return
+        self.summary_label.setText(f"Failed to parse log: {message}")
+
+    @staticmethod
+    def _format_summary(summary):
+        """Build readable summary text."""
         summary_txt = ""
         for cat, data in summary.items():
             summary_txt += f"• {cat}: {data['count']} events (Severity: {data['severity']})\n"
-        self.summary_label.setText(summary_txt)
+        return summary_txt
+
+    @staticmethod
+    def _format_event(ev):
+        """Detailed event dump for one event."""
+        lines = [
+            f"[{ev.timestamp}] ({ev.category}/{ev.severity})\n"
+            f"{ev.message}\n"
+            f"→ {ev.explanation}\n"
+        ]
+        if ev.steps:
+            lines.append("Steps to troubleshoot:")
+            for step in ev.steps:
+                lines.append(f"  • {step}")
+        return "\n".join(lines)
+
+    def _show_event_details(self, current, _previous=None):
+        if current.isValid():
+            self.details.setPlainText(self._format_event(self.model.event_at(current.row())))
+
+    def _apply_filters(self):
+        """Re-filter the table from the per-category indexes."""
+        category = self.category_filter.currentText()
+        severity = self.severity_filter.currentText()
+        self.model.set_filters(
+            categories=None if category == ALL_CATEGORIES else {category},
+            severities=None if severity == ALL_SEVERITIES else {severity},
+            search=self.search_input.text()
+        )
+
+    ### RULE PACKS ###
+    def open_rule_pack_folder(self):
+        QDesktopServices.openUrl(QUrl.fromLocalFile(self.rule_packs.folder))
+
+    def _watch_rule_packs(self):
+        """Watch the pack folder and each pack (editors often replace files, so re-add after every change)."""
+        watched = self._pack_watcher.files() + self._pack_watcher.directories()
+        if watched:
+            self._pack_watcher.removePaths(watched)
+        self._pack_watcher.addPaths([self.rule_packs.folder] + self.rule_packs.pack_files())
+
+    def _reload_rule_packs(self, force=False):
+        """Rebuild the parser from the rule packs if they changed on disk."""
+        if not force and not self.rule_packs.changed():
+            return
+        if self._thread is not None and self._thread.isRunning():
+            return  # picked up by the next parse instead
+
+        self.parser = self._build_parser()
+        self._watch_rule_packs()
+        self._reset_filter_choices()
+
+        packs = self.rule_packs.packs
+        self.summary_label.setText(
+            f"Rule packs loaded: {len(packs)} pack(s), {sum(count for _, _, count in packs)} extra rule(s)."
+        )
+        self._show_rule_pack_errors()
+
+    def _build_parser(self):
+        """Parser from the built-in rules plus the rule packs, or from the built-in rules alone if the packs fail."""
+        try:
+            return self.rule_packs.parser()
+        except Exception as e:  # re.error and the like, from rules that only fail once merged
+            self.rule_packs.packs = []
+            self.rule_packs.origins = ["Built-in"] * len(ModemLogParser.RULES)
+            self.rule_packs.errors.append(("Rule packs", f"not applied, using the built-in rules only ({e})"))
+            return ModemLogParser()
+
+    def _show_rule_pack_errors(self):
+        if self.rule_packs.errors:
+            self.details.setPlainText(
+                "Rule pack problems:\n" + "\n".join(f"  • {name}: {message}" for name, message in self.rule_packs.errors)
+            )
+
+    def show_rule_stats(self):
+        """Show hits per rule for the last parse and how long each pattern takes per line."""
+        messages = self.model.events.messages
+        sample = messages[:PROFILE_SAMPLE_LINES] if messages else self.input.toPlainText().splitlines()[:PROFILE_SAMPLE_LINES]
+        sample = [line for line in sample if line.strip()]
+        if not sample:
+            self.details.setPlainText("Parse a log first; rule timing is measured on its lines.")
+            return
 
-        # Detailed event dump
-        lines = []
-        for ev in events:
+        stats = self.parser.profile_rules(sample)
+        origins = self.rule_packs.origins
+        lines = [
+            f"Rule statistics ({len(self.parser.rules)} rules, timed on {len(sample):,} lines, slowest first)",
+            "",
+        ]
+        for stat in stats:
+            origin = origins[stat["index"]] if stat["index"] < len(origins) else "Built-in"
             lines.append(
-                f"[{ev.timestamp}] ({ev.category}/{ev.severity})\n"
-                f"{ev.message}\n"
-                f"→ {ev.explanation}\n"
+                f"{stat['seconds'] * 1e6 / len(sample):7.2f} µs/line  {stat['hits']:>8,} hits  "
+                f"[{origin}] {stat['category']}: {stat['pattern']}"
             )
-            if ev.steps:
-                lines.append("Steps to troubleshoot:")
-                for step in ev.steps:
-                    lines.append(f"  • {step}")
-            lines.append("-------------------------")
 
-        self.output.setPlainText("\n".join(lines))
+        for name, message in self.rule_packs.errors:
+            lines.append(f"Skipped {name}: {message}")
+        self.details.setPlainText("\n".join(lines))
+
+    def _reset_filter_choices(self):
+        """Refill the filters from a new parser's RuleTable."""
+        for combo, first, names in (
+            (self.category_filter, ALL_CATEGORIES, self.parser.table.categories),
+            (self.severity_filter, ALL_SEVERITIES, self.parser.table.severities),
+        ):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(first)
+            combo.addItems(names)
+            combo.blockSignals(False)
+        self._apply_filters()
+
+    def _sync_filter_choices(self):
+        """Offer categories/severities that showed up while parsing (e.g. from embedded tags)."""
+        table = self.model.events.table
+        for combo, names in ((self.category_filter, table.categories), (self.severity_filter, table.severities)):
+            for name in names[combo.count() - 1:]:
+                combo.addItem(name)
 
     def clear_logs(self):
         """Clear all input, summary, and output fields in the dialog."""
+        self._stop_parse()
         self.input.clear()
-        self.output.clear()
+        self.input.setPlaceholderText("Paste the modem log here.")
+        self.model.clear()
+        self.details.clear()
         self.summary_label.clear()
 
+
+    def done(self, result):
+        """Stop any running parse before the dialog closes."""
+        self._stop_parse()
+        super().done(result)
@@ -0,0 +1,192 @@
+import csv
+import io
+import os
+from collections import Counter
+
+from PySide6.QtCore import Qt, QThread, QObject, Signal, Slot
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QTextEdit, QLabel, \
+    QFileDialog, QSplitter, QMessageBox
+
+from ui.themes.mac_widget_style import mac_widget_style
+from utils.custom_context_menu import ContextMenuUtility
+from utils.oui_lookup import OUILookup, find_macs
+from utils.resource_path import resource_path
+
+# Per-MAC lines shown in the dialog; Save CSV writes all of them
+MAX_LISTED = 1000
+
+
+class BulkLookupWorker(QObject):
+    """Extracts every MAC from pasted text or a file and resolves them with OUILookup.lookup_many()."""
+    finished = Signal(object, object)  # list of MACs, list of (vendor, address, type)
+    error = Signal(str)
+
+    def __init__(self, oui, source, from_file=False):
+        super().__init__()
+        self.oui = oui
+        self.source = source
+        self.from_file = from_file
+
+    @Slot()
+    def run(self):
+        try:
+            if self.from_file:
+                lines = open(self.source, "r", encoding="utf-8", errors="replace")
+            else:
+                lines = io.StringIO(self.source)
+            with lines:
+                macs = list(find_macs(lines))
+            self.finished.emit(macs, self.oui.lookup_many(macs))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class MacBulkDialog(QDialog):
+    """
+    Bulk MAC vendor lookup.
+
+    Paste an ARP table, DHCP lease dump or CMTS CPE list (or open one from disk);
+    every MAC in it is looked up and the results are summarized as vendor counts.
+    """
+    def __init__(self, oui=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Scratch Board: Bulk MAC Vendor Lookup")
+        self.resize(900, 600)
+
+        self.oui = oui or OUILookup()
+        self.macs = []
+        self.results = []
+        self._thread = None
+        self._worker = None
+
+        layout = QVBoxLayout(self)
+
+        # Buttons
+        button_row = QHBoxLayout()
+        self.status_label = QLabel("Paste text containing MAC addresses or open a file.")
+        button_row.addWidget(self.status_label, 1)
+
+        open_btn = QPushButton("Open File")
+        open_btn.setIcon(QIcon(resource_path("resources/icons/open.png")))
+        open_btn.setToolTip("Look up every MAC in a text file")
+        open_btn.clicked.connect(self.open_file)
+        button_row.addWidget(open_btn)
+
+        self.lookup_btn = QPushButton("Look Up")
+        self.lookup_btn.setIcon(QIcon(resource_path("resources/icons/db_search.png")))
+        self.lookup_btn.setToolTip("Look up every MAC in the pasted text")
+        self.lookup_btn.clicked.connect(self.lookup_pasted)
+        button_row.addWidget(self.lookup_btn)
+
+        self.save_btn = QPushButton("Save CSV")
+        self.save_btn.setIcon(QIcon(resource_path("resources/icons/save.png")))
+        self.save_btn.setToolTip("Save every MAC with its vendor")
+        self.save_btn.setEnabled(False)
+        self.save_btn.clicked.connect(self.save_csv)
+        button_row.addWidget(self.save_btn)
+
+        layout.addLayout(button_row)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # Paste input
+        self.input = QPlainTextEdit()
+        self.input.setPlaceholderText("Paste an ARP table, DHCP lease dump or CMTS CPE list here.")
+        self.context_menu_helper = ContextMenuUtility(self.input)
+        splitter.addWidget(self.input)
+
+        # Console-style output
+        self.output = QTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setStyleSheet(mac_widget_style)
+        self.context_menu_output = ContextMenuUtility(self.output)
+        splitter.addWidget(self.output)
+
+        splitter.setSizes([400, 500])
+        layout.addWidget(splitter)
+
+    def lookup_pasted(self):
+        text = self.input.toPlainText()
+        if not text.strip():
+            QMessageBox.warning(self, "Error", "Nothing to look up.")
+            return
+        self._start(text, from_file=False)
+
+    def open_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open MAC List", "", "Text Files (*.txt *.csv *.log);;All Files (*)")
+        if path:
+            self.input.clear()
+            self.input.setPlaceholderText(f"Reading {os.path.basename(path)} from disk.")
+            self._start(path, from_file=True)
+
+    def _start(self, source, from_file):
+        if self._thread is not None:
+            return  # one lookup at a time
+
+        self.lookup_btn.setEnabled(False)
+        self.save_btn.setEnabled(False)
+        self.status_label.setText("Looking up...")
+
+        thread = QThread()
+        worker = BulkLookupWorker(self.oui, source, from_file)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_finished)
+        worker.error.connect(self._on_error)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        thread.finished.connect(self._on_thread_done)
+
+        self._thread, self._worker = thread, worker
+        thread.start()
+
+    def _on_thread_done(self):
+        self._thread, self._worker = None, None
+        self.lookup_btn.setEnabled(True)
+
+    def _on_error(self, message):
+        self.status_label.setText(f"Lookup failed: {message}")
+
+    def _on_finished(self, macs, results):
+        self.macs, self.results = macs, results
+        self.save_btn.setEnabled(bool(macs))
+        self.status_label.setText(f"{len(macs):,} MAC(s) found.")
+        self.output.setPlainText(self.format_report(macs, results))
+
+    @staticmethod
+    def format_report(macs, results):
+        """Vendor counts first, then the first MAX_LISTED MACs with their vendor."""
+        if not macs:
+            return "> No MAC addresses found."
+
+        counts = Counter(vendor for vendor, _, _ in results)
+        lines = [f"> {len(macs):,} MACs, {len(counts):,} vendors", ""]
+        for vendor, count in counts.most_common():
+            lines.append(f"{count:>9,}  {vendor}")
+
+        lines += ["", f"> MACs (first {min(len(macs), MAX_LISTED):,})"]
+        for mac, (vendor, _, prefix_type) in zip(macs[:MAX_LISTED], results):
+            lines.append(f"{mac:<17}  {vendor}  {prefix_type}")
+        return "\n".join(lines)
+
+    def save_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Results", "mac_vendors.csv", "CSV Files (*.csv)")
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["MAC", "Vendor", "Address", "Type"])
+                for mac, result in zip(self.macs, self.results):
+                    writer.writerow([mac, *result])
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not save results: {e}")
+
+    def done(self, result):
+        """Wait for a running lookup before the dialog closes."""
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
+        super().done(result)
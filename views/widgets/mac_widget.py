@@ -1,4 +1,4 @@
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QPushButton, QMessageBox, QTextEdit, QHBoxLayout, \
     QSizePolicy
@@ -7,7 +7,7 @@ from ui.themes.mac_widget_style import mac_widget_style
 from utils.custom_context_menu import ContextMenuUtility
 from utils.resource_path import resource_path
 
-from utils.oui_lookup import OUILookup
+from utils.oui_lookup import OUILookup, mac_to_int
 
 class MacVendorView(QWidget):
     """
@@ -15,7 +15,7 @@ class MacVendorView(QWidget):
 
     Features:
     - Input field for MAC addresses.
-    - Query and Clear buttons.
+    - Query, Bulk and Clear buttons (Bulk opens MacBulkDialog for pasted lists or files).
     - Console-style output showing results in a styled QTextEdit.
     """
     def __init__(self):
@@ -64,6 +64,16 @@ class MacVendorView(QWidget):
         mac_query_btn.clicked.connect(self.lookup_mac)
         input_layout.addWidget(mac_query_btn)
 
+        # Bulk lookup button
+        bulk_btn = QPushButton()
+        bulk_btn.setToolTip("Bulk lookup (paste a list or open a file)")
+        bulk_btn.setIcon(QIcon(resource_path("resources/icons/list.png")))
+        bulk_btn.setFixedSize(32, 32)
+        bulk_btn.setIconSize(QSize(24, 24))
+        bulk_btn.setStyleSheet("text-align: center;")
+        bulk_btn.clicked.connect(self.open_bulk_lookup)
+        input_layout.addWidget(bulk_btn)
+
         # Clear button
         clear_btn = QPushButton()
         clear_btn.setToolTip("Clear")
@@ -91,8 +101,8 @@ class MacVendorView(QWidget):
         """
         mac = self.input_mac.text().strip()
 
-        # MAC Validation
-        if len(mac) < 6 or len(mac) > 12:
+        # MAC Validation (6-12 hex digits in any notation, e.g. 00:1A:2B:33:44:55 or 001a.2b33.4455)
+        if mac_to_int(mac) is None:
             QMessageBox.warning(self, "Error", "Enter a valid MAC address.")
             return
 
@@ -105,6 +115,14 @@ class MacVendorView(QWidget):
         self.append_console(f"> Country: {address}")
         self.append_console(f"> Type: {prefix_type}")
 
+    def open_bulk_lookup(self):
+        """Open the bulk lookup dialog, sharing this widget's OUI index."""
+        from views.widgets.mac_bulk_dialog import MacBulkDialog
+
+        dialog = MacBulkDialog(self.oui, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.show()
+
     def clear_btn(self):
         """
         Clear the MAC input field and console output.
@@ -2,11 +2,9 @@ from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QLabel
 from PySide6.QtCore import Qt
 
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 
-# Load the QSS theme for the Markdown guide table
-with open(resource_path("ui/themes/md_chart_theme.qss"), "r") as f:
-    md_chart_theme = f.read()
 
 def get_markdown_guide():
     """
@@ -69,7 +67,7 @@ class MarkdownGuideWidget(QWidget):
         table.setColumnWidth(1, 300)
         table.setColumnWidth(2, 300)
         table.setShowGrid(False)
-        table.setStyleSheet(md_chart_theme)
+        table.setStyleSheet(ThemeService.stylesheet("md_chart_theme.qss"))
 
         # Default row height (adjust as needed)
         table.verticalHeader().setDefaultSectionSize(55)
@@ -7,6 +7,7 @@ from PySide6.QtWidgets import QDialog, QVBoxLayout, QComboBox, QLabel, QWidget,
     QLineEdit, QProgressBar, QPushButton, QApplication, QSizePolicy, QStackedWidget
 
 from utils.custom_context_menu import ContextMenuUtility
+from services.theme_service import ThemeService
 from utils.resource_path import resource_path
 
 
@@ -170,9 +171,7 @@ class PassGenWidget(QDialog):
         self.update_visibility()
 
         # Styling
-        style_path = resource_path("ui/themes/passgen_theme.qss")
-        with open(style_path, "r") as f:
-            self.setStyleSheet(f.read())
+        ThemeService.apply(self, "passgen_theme.qss")
 
     def update_visibility(self):
         mode = self.select_mode.currentText()
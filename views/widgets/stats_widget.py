@@ -1,6 +1,5 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout
 from PySide6.QtCore import Qt, Property, QPropertyAnimation, QEasingCurve
-from utils.resource_path import resource_path
 from domain.analytics.calc_note_stats import calculate_stats  # Make sure this returns new stats like avg words
 
 
@@ -73,11 +72,3 @@ class StatsWidget(QWidget):
                 card._anim = anim
             else:
                 card._set_value(val)
-
-    def load_stylesheet(self):
-        """Load dark theme QSS."""
-        try:
-            with open(resource_path("ui/themes/main_theme.qss"), "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print("Failed to load main_theme.qss:", e)
\ No newline at end of file
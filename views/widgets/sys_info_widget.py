@@ -131,6 +131,10 @@ class CalStatWidget(QWidget):
         # Spin up the thread
         self.thread.start()
 
+        # closeEvent doesn't run when the window owning the dashboard is deleted; stop the thread then too
+        thread = self.thread
+        self.destroyed.connect(lambda: (thread.quit(), thread.wait()))
+
         # Thread Timers
         self.clock_timer = QTimer(self)
         self.clock_timer.timeout.connect(self.worker.get_time)